@@ -1,29 +1,56 @@
-from .simulated_annealing import SimulatedAnnealing, SimulatedAnnealingState
+from .simulated_annealing import (
+    SimulatedAnnealing,
+    ParallelTemperingSimulatedAnnealing,
+    SimulatedAnnealingState,
+)
 from .hill_climbing import (
     SteepestAscentHillClimbing,
+    ExactSteepestAscentHillClimbing,
     StochasticHillClimbing,
     SidewaysMoveHillClimbing,
     RandomRestartHillClimbing,
     HillClimbingState,
+    ExactHillClimbingState,
     DEFAULT_MAX_SIDEWAYS,
     DEFAULT_MAX_RESTART,
+    DEFAULT_NEIGHBORHOOD_SIZE,
 )
 from .state import Problem, State, JadwalKuliah, Slot
 from .solver import Solver
+from .budget import SearchBudget
+from .stagnation import StagnationCriteria
+from .compiled import (
+    CompiledProblem,
+    NeighborhoodEvaluator,
+    PopulationEvaluator,
+    compile_problem,
+)
+from .move_queue import MoveDeltaQueue
 
 __all__ = [
     "SimulatedAnnealing",
+    "ParallelTemperingSimulatedAnnealing",
     "SimulatedAnnealingState",
     "SteepestAscentHillClimbing",
+    "ExactSteepestAscentHillClimbing",
     "StochasticHillClimbing",
     "SidewaysMoveHillClimbing",
     "RandomRestartHillClimbing",
     "HillClimbingState",
+    "ExactHillClimbingState",
     "DEFAULT_MAX_SIDEWAYS",
     "DEFAULT_MAX_RESTART",
+    "DEFAULT_NEIGHBORHOOD_SIZE",
     "Problem",
     "State",
     "JadwalKuliah",
     "Slot",
     "Solver",
+    "SearchBudget",
+    "StagnationCriteria",
+    "CompiledProblem",
+    "NeighborhoodEvaluator",
+    "PopulationEvaluator",
+    "compile_problem",
+    "MoveDeltaQueue",
 ]
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from typing import Optional
+import time
+from .perf import PerfCounters
+
+# Alasan pencarian berhenti sebelum aturan berhenti algoritmanya sendiri
+STOP_TIME_LIMIT = "time_limit"
+STOP_MAX_EVALUATIONS = "max_evaluations"
+STOP_TARGET_OBJECTIVE = "target_objective"
+STOP_CANCELLED = "cancelled"
+
+
+@dataclass(frozen=True)
+class SearchBudget:
+    # Batas yang berlaku untuk semua solver, None berarti tidak dibatasi.
+    # Solver tetap mengembalikan jadwal terbaik yang ditemukan saat anggaran habis
+    time_limit_s: Optional[float] = None
+    max_evaluations: Optional[int] = None
+    target_objective: Optional[float] = None
+
+    def validate(self):
+        if self.time_limit_s is not None and self.time_limit_s <= 0:
+            raise ValueError("Batas waktu harus lebih dari nol")
+        if self.max_evaluations is not None and self.max_evaluations < 1:
+            raise ValueError("Batas evaluasi harus lebih dari nol")
+
+    def active(self) -> bool:
+        return (
+            self.time_limit_s is not None
+            or self.max_evaluations is not None
+            or self.target_objective is not None
+        )
+
+    def start(self, perf: PerfCounters) -> "BudgetClock":
+        deadline = None
+        if self.time_limit_s is not None:
+            deadline = time.time() + self.time_limit_s
+        return BudgetClock(self, perf, deadline)
+
+
+class BudgetClock:
+    # Anggaran yang sedang berjalan. Evaluasi dibaca dari PerfCounters pencarian,
+    # ditambah evaluations_used untuk bagian pencarian yang dihitung di tempat lain
+    def __init__(
+        self,
+        budget: SearchBudget,
+        perf: PerfCounters,
+        deadline: Optional[float] = None,
+        evaluations_used: int = 0,
+    ):
+        self.budget = budget
+        self.perf = perf
+        self.deadline = deadline
+        self.evaluations_used = evaluations_used
+
+    def evaluations(self) -> int:
+        return self.evaluations_used + self.perf.evaluations
+
+    def fork(self, perf: PerfCounters) -> "BudgetClock":
+        # Clock untuk sub-pencarian (mis. satu restart) dengan counter sendiri
+        return BudgetClock(self.budget, perf, self.deadline, self.evaluations())
+
+    def exhausted(self, objective: float) -> Optional[str]:
+        budget = self.budget
+        if budget.target_objective is not None and objective <= budget.target_objective:
+            return STOP_TARGET_OBJECTIVE
+        if (
+            budget.max_evaluations is not None
+            and self.evaluations() >= budget.max_evaluations
+        ):
+            return STOP_MAX_EVALUATIONS
+        if self.deadline is not None and time.time() >= self.deadline:
+            return STOP_TIME_LIMIT
+        return None
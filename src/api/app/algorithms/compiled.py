@@ -0,0 +1,466 @@
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+from .state import (
+    Problem,
+    JadwalKuliah,
+    N_WAKTU,
+    priority_weight,
+)
+
+
+@dataclass
+class ConflictEdges:
+    # Graf konflik Problem dalam format CSR. Tetangga kelas ke-i ada pada
+    # tetangga_idx[tetangga_ptr[i]:tetangga_ptr[i + 1]], dan mahasiswa bersama
+    # untuk sisi ke-e ada pada bersama_*[bersama_ptr[e]:bersama_ptr[e + 1]]
+    tetangga_ptr: np.ndarray
+    tetangga_idx: np.ndarray
+    bersama_ptr: np.ndarray
+    bersama_mhs: np.ndarray
+    bersama_jumlah1: np.ndarray
+    bersama_jumlah2: np.ndarray
+
+
+def _posisi_csr(awal: np.ndarray, panjang: np.ndarray) -> np.ndarray:
+    # Indeks seluruh entri CSR awal[i]..awal[i] + panjang[i], berurutan per i
+    return (
+        np.arange(panjang.sum())
+        - np.repeat(np.cumsum(panjang) - panjang, panjang)
+        + np.repeat(awal, panjang)
+    )
+
+
+class CompiledProblem:
+    # Representasi integer dari Problem: kelas, ruangan, dan waktu mulai menjadi
+    # indeks. Jadwal adalah array int berukuran (jumlah pertemuan, 2) berisi
+    # (indeks ruangan, indeks waktu) untuk setiap pertemuan.
+    def __init__(self, problem: Problem):
+        self.problem = problem
+
+        self.kode_kelas = [kelas.kode for kelas in problem.list_kelas]
+        self.index_kelas = {kode: i for i, kode in enumerate(self.kode_kelas)}
+        self.kode_ruangan = [ruangan.kode for ruangan in problem.list_ruangan]
+        self.index_ruangan = {kode: i for i, kode in enumerate(self.kode_ruangan)}
+
+        self.n_kelas = len(self.kode_kelas)
+        self.n_ruangan = len(self.kode_ruangan)
+        self.n_mahasiswa = len(problem.list_kuliah_mahasiswa)
+
+        self.kuota_ruangan = np.array(
+            [ruangan.kuota for ruangan in problem.list_ruangan], dtype=np.int64
+        )
+        self.jumlah_mahasiswa = np.array(
+            [kelas.jumlah_mahasiswa for kelas in problem.list_kelas], dtype=np.int64
+        )
+        self.sks = np.array([kelas.sks for kelas in problem.list_kelas], dtype=np.int64)
+
+        # Pertemuan kelas ke-i menempati baris offset_kelas[i]..offset_kelas[i + 1]
+        self.offset_kelas = np.zeros(self.n_kelas + 1, dtype=np.int64)
+        np.cumsum(self.sks, out=self.offset_kelas[1:])
+        self.n_pertemuan = int(self.offset_kelas[-1])
+        self.kelas_pertemuan = np.repeat(np.arange(self.n_kelas), self.sks)
+
+        # Bobot prioritas per kelas
+        self.bobot_kelas = np.zeros(self.n_kelas, dtype=np.float64)
+        for mahasiswa in problem.list_kuliah_mahasiswa:
+            for prioritas, kode_kuliah in mahasiswa.prio_mata_kuliah.items():
+                self.bobot_kelas[self.index_kelas[kode_kuliah]] += priority_weight(
+                    prioritas
+                )
+        self.bobot_pertemuan = self.bobot_kelas[self.kelas_pertemuan]
+        self.jumlah_mahasiswa_pertemuan = self.jumlah_mahasiswa[self.kelas_pertemuan]
+
+        # Daftar mahasiswa per kelas dalam format CSR: mahasiswa kelas ke-i ada pada
+        # mahasiswa_idx[mahasiswa_ptr[i]:mahasiswa_ptr[i + 1]]
+        self.mahasiswa_ptr = np.zeros(self.n_kelas + 1, dtype=np.int64)
+        mahasiswa_idx: list[int] = []
+        mahasiswa_jumlah: list[int] = []
+        for i, kode in enumerate(self.kode_kelas):
+            for mhs, jumlah in problem.mahasiswa_by_class[kode]:
+                mahasiswa_idx.append(mhs)
+                mahasiswa_jumlah.append(jumlah)
+            self.mahasiswa_ptr[i + 1] = len(mahasiswa_idx)
+        self.mahasiswa_idx = np.array(mahasiswa_idx, dtype=np.int64)
+        self.mahasiswa_jumlah = np.array(mahasiswa_jumlah, dtype=np.int64)
+
+        self._conflict_edges: Optional[ConflictEdges] = None
+
+    def conflict_edges(self) -> ConflictEdges:
+        if self._conflict_edges is not None:
+            return self._conflict_edges
+
+        bersama: dict[tuple[int, int], list[tuple[int, int, int]]] = {}
+        for j, mahasiswa in enumerate(self.problem.list_kuliah_mahasiswa):
+            jumlah: dict[int, int] = {}
+            for kode in mahasiswa.prio_mata_kuliah.values():
+                i = self.index_kelas[kode]
+                jumlah[i] = jumlah.get(i, 0) + 1
+            for kelas1, jumlah1 in jumlah.items():
+                for kelas2, jumlah2 in jumlah.items():
+                    if kelas1 != kelas2:
+                        key = (kelas1, kelas2)
+                        if key not in bersama:
+                            bersama[key] = []
+                        bersama[key].append((j, jumlah1, jumlah2))
+
+        edges = sorted(bersama)
+        tetangga_ptr = np.zeros(self.n_kelas + 1, dtype=np.int64)
+        np.add.at(tetangga_ptr, [kelas1 + 1 for kelas1, _ in edges], 1)
+        np.cumsum(tetangga_ptr, out=tetangga_ptr)
+        tetangga_idx = np.array([kelas2 for _, kelas2 in edges], dtype=np.int64)
+
+        entries = [entry for key in edges for entry in bersama[key]]
+        bersama_ptr = np.zeros(len(edges) + 1, dtype=np.int64)
+        np.cumsum([len(bersama[key]) for key in edges], out=bersama_ptr[1:])
+        bersama_arr = np.array(entries, dtype=np.int64).reshape(-1, 3)
+
+        self._conflict_edges = ConflictEdges(
+            tetangga_ptr=tetangga_ptr,
+            tetangga_idx=tetangga_idx,
+            bersama_ptr=bersama_ptr,
+            bersama_mhs=bersama_arr[:, 0],
+            bersama_jumlah1=bersama_arr[:, 1],
+            bersama_jumlah2=bersama_arr[:, 2],
+        )
+        return self._conflict_edges
+
+    def compile_jadwal(self, jadwal: JadwalKuliah) -> np.ndarray:
+        res = np.empty(self.n_pertemuan, dtype=np.int64)
+        for i, kode in enumerate(self.kode_kelas):
+            slot_list = jadwal.slot_kuliah[kode]
+            if len(slot_list) != self.sks[i]:
+                raise ValueError(f"Jumlah pertemuan kelas {kode} tidak sesuai SKS")
+            res[self.offset_kelas[i] : self.offset_kelas[i + 1]] = slot_list
+        return np.stack(np.divmod(res, N_WAKTU), axis=1)
+
+    def decompile_jadwal(self, jadwal: np.ndarray) -> JadwalKuliah:
+        slot_id = (jadwal[:, 0] * N_WAKTU + jadwal[:, 1]).tolist()
+        return JadwalKuliah(
+            {
+                kode: slot_id[self.offset_kelas[i] : self.offset_kelas[i + 1]]
+                for i, kode in enumerate(self.kode_kelas)
+            }
+        )
+
+    def slot(self, ruang: int, waktu: int) -> int:
+        return int(ruang) * N_WAKTU + int(waktu)
+
+    def objective(self, jadwal: np.ndarray) -> float:
+        return (
+            self.tabrakan_jadwal_mahasiswa(jadwal)
+            + self.tabrakan_ruangan_berbobot(jadwal)
+            + self.kuota_kelas(jadwal)
+        )
+
+    def tabrakan_jadwal_mahasiswa(self, jadwal: np.ndarray) -> float:
+        # Jumlah pertemuan kelas per waktu, lalu jumlah pertemuan mahasiswa per waktu
+        timetable = self.jam_mahasiswa(jadwal)
+        return float(timetable[timetable > 1].sum())
+
+    def jam_mahasiswa(self, jadwal: np.ndarray) -> np.ndarray:
+        # Banyak pertemuan setiap mahasiswa per waktu, berukuran (mahasiswa, N_WAKTU).
+        # Dihitung dari daftar mahasiswa CSR setiap pertemuan
+        awal = self.mahasiswa_ptr[self.kelas_pertemuan]
+        panjang = self.mahasiswa_ptr[self.kelas_pertemuan + 1] - awal
+        posisi = _posisi_csr(awal, panjang)
+        indeks = self.mahasiswa_idx[posisi] * N_WAKTU + np.repeat(jadwal[:, 1], panjang)
+        jumlah = np.bincount(
+            indeks,
+            weights=self.mahasiswa_jumlah[posisi],
+            minlength=self.n_mahasiswa * N_WAKTU,
+        )
+        return jumlah.astype(np.int64).reshape(self.n_mahasiswa, N_WAKTU)
+
+    def tabrakan_ruangan_berbobot(self, jadwal: np.ndarray) -> float:
+        slot = jadwal[:, 0] * N_WAKTU + jadwal[:, 1]
+        n_slot = self.n_ruangan * N_WAKTU
+        jumlah = np.bincount(slot, minlength=n_slot)
+        bobot = np.bincount(slot, weights=self.bobot_pertemuan, minlength=n_slot)
+        return float(bobot[jumlah > 1].sum())
+
+    def kuota_kelas(self, jadwal: np.ndarray) -> float:
+        over_capacity = (
+            self.jumlah_mahasiswa_pertemuan - self.kuota_ruangan[jadwal[:, 0]]
+        )
+        return float(over_capacity[over_capacity > 0].sum())
+
+
+class NeighborhoodEvaluator:
+    # Menilai banyak kandidat swap/move sekaligus tanpa mengubah jadwal. Kandidat
+    # dinyatakan dengan indeks pertemuan dan indeks slot (ruang * N_WAKTU + waktu).
+    def __init__(self, compiled: CompiledProblem, jadwal: np.ndarray):
+        self.compiled = compiled
+        self.jadwal = jadwal.copy()
+
+        self.jam_mahasiswa = compiled.jam_mahasiswa(jadwal)
+
+        slot = self.slot_pertemuan()
+        n_slot = compiled.n_ruangan * N_WAKTU
+        self.jumlah_slot = np.bincount(slot, minlength=n_slot)
+        self.bobot_slot = np.bincount(
+            slot, weights=compiled.bobot_pertemuan, minlength=n_slot
+        )
+
+    def slot_pertemuan(self, pertemuan=None) -> np.ndarray:
+        jadwal = self.jadwal if pertemuan is None else self.jadwal[pertemuan]
+        return jadwal[..., 0] * N_WAKTU + jadwal[..., 1]
+
+    def empty_slots(self) -> np.ndarray:
+        return np.flatnonzero(self.jumlah_slot == 0)
+
+    def find_pertemuan(self, kelas: int, slot: int) -> int:
+        awal = self.compiled.offset_kelas[kelas]
+        akhir = self.compiled.offset_kelas[kelas + 1]
+        cocok = np.flatnonzero(self.slot_pertemuan(slice(awal, akhir)) == slot)
+        return int(awal + cocok[0])
+
+    def delta_swaps(self, pertemuan1: np.ndarray, pertemuan2: np.ndarray) -> np.ndarray:
+        c = self.compiled
+        n = len(pertemuan1)
+        kelas1 = c.kelas_pertemuan[pertemuan1]
+        kelas2 = c.kelas_pertemuan[pertemuan2]
+        slot1 = self.slot_pertemuan(pertemuan1)
+        slot2 = self.slot_pertemuan(pertemuan2)
+
+        # Tabrakan jadwal mahasiswa: kelas1 pindah dari waktu slot1 ke waktu slot2
+        # dan kelas2 sebaliknya, mahasiswa yang sama digabung per kandidat
+        cand1, mhs1, jumlah1 = self._entries(kelas1)
+        cand2, mhs2, jumlah2 = self._entries(kelas2)
+        key, inverse = np.unique(
+            np.concatenate([cand1, cand2]) * c.n_mahasiswa
+            + np.concatenate([mhs1, mhs2]),
+            return_inverse=True,
+        )
+        perubahan = np.bincount(
+            inverse, weights=np.concatenate([-jumlah1, jumlah2]), minlength=len(key)
+        ).astype(np.int64)
+        res = self._delta_mahasiswa(
+            key // c.n_mahasiswa,
+            key % c.n_mahasiswa,
+            perubahan,
+            slot1 % N_WAKTU,
+            slot2 % N_WAKTU,
+            n,
+        )
+
+        # Tabrakan ruangan berbobot, jumlah kelas pada kedua slot tetap
+        bobot1 = c.bobot_pertemuan[pertemuan1]
+        bobot2 = c.bobot_pertemuan[pertemuan2]
+        jumlah_a = self.jumlah_slot[slot1]
+        jumlah_b = self.jumlah_slot[slot2]
+        bobot_a = self.bobot_slot[slot1]
+        bobot_b = self.bobot_slot[slot2]
+        res += (
+            _penalti_slot(jumlah_a, bobot_a - bobot1 + bobot2)
+            - _penalti_slot(jumlah_a, bobot_a)
+            + _penalti_slot(jumlah_b, bobot_b - bobot2 + bobot1)
+            - _penalti_slot(jumlah_b, bobot_b)
+        )
+
+        # Kuota kelas
+        ruang1 = slot1 // N_WAKTU
+        ruang2 = slot2 // N_WAKTU
+        res += (
+            self._penalti_kuota(kelas1, ruang2)
+            - self._penalti_kuota(kelas1, ruang1)
+            + self._penalti_kuota(kelas2, ruang1)
+            - self._penalti_kuota(kelas2, ruang2)
+        )
+
+        res[(slot1 == slot2) | (kelas1 == kelas2)] = 0.0
+        return res
+
+    def delta_moves(self, pertemuan: np.ndarray, slot_to: np.ndarray) -> np.ndarray:
+        c = self.compiled
+        n = len(pertemuan)
+        kelas = c.kelas_pertemuan[pertemuan]
+        slot_from = self.slot_pertemuan(pertemuan)
+
+        cand, mhs, jumlah = self._entries(kelas)
+        res = self._delta_mahasiswa(
+            cand, mhs, -jumlah, slot_from % N_WAKTU, slot_to % N_WAKTU, n
+        )
+
+        bobot = c.bobot_pertemuan[pertemuan]
+        jumlah_a = self.jumlah_slot[slot_from]
+        jumlah_b = self.jumlah_slot[slot_to]
+        bobot_a = self.bobot_slot[slot_from]
+        bobot_b = self.bobot_slot[slot_to]
+        res += (
+            _penalti_slot(jumlah_a - 1, bobot_a - bobot)
+            - _penalti_slot(jumlah_a, bobot_a)
+            + _penalti_slot(jumlah_b + 1, bobot_b + bobot)
+            - _penalti_slot(jumlah_b, bobot_b)
+        )
+
+        res += self._penalti_kuota(kelas, slot_to // N_WAKTU) - self._penalti_kuota(
+            kelas, slot_from // N_WAKTU
+        )
+
+        res[slot_from == slot_to] = 0.0
+        return res
+
+    def apply_swap(self, pertemuan1: int, pertemuan2: int):
+        slot1 = int(self.slot_pertemuan(pertemuan1))
+        slot2 = int(self.slot_pertemuan(pertemuan2))
+        self.apply_move(pertemuan1, slot2)
+        self.apply_move(pertemuan2, slot1)
+
+    def apply_move(self, pertemuan: int, slot_to: int):
+        c = self.compiled
+        kelas = c.kelas_pertemuan[pertemuan]
+        slot_from = int(self.slot_pertemuan(pertemuan))
+        awal, akhir = c.mahasiswa_ptr[kelas], c.mahasiswa_ptr[kelas + 1]
+        mhs = c.mahasiswa_idx[awal:akhir]
+        jumlah = c.mahasiswa_jumlah[awal:akhir]
+        self.jam_mahasiswa[mhs, slot_from % N_WAKTU] -= jumlah
+        self.jam_mahasiswa[mhs, slot_to % N_WAKTU] += jumlah
+
+        bobot = c.bobot_pertemuan[pertemuan]
+        self.jumlah_slot[slot_from] -= 1
+        self.bobot_slot[slot_from] -= bobot
+        self.jumlah_slot[slot_to] += 1
+        self.bobot_slot[slot_to] += bobot
+        self.jadwal[pertemuan] = divmod(slot_to, N_WAKTU)
+
+    def _entries(self, kelas: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # (indeks kandidat, indeks mahasiswa, jumlah pengambilan) untuk semua
+        # mahasiswa dari kelas setiap kandidat
+        c = self.compiled
+        awal = c.mahasiswa_ptr[kelas]
+        panjang = c.mahasiswa_ptr[kelas + 1] - awal
+        cand = np.repeat(np.arange(len(kelas)), panjang)
+        posisi = _posisi_csr(awal, panjang)
+        return cand, c.mahasiswa_idx[posisi], c.mahasiswa_jumlah[posisi]
+
+    def _delta_mahasiswa(
+        self,
+        cand: np.ndarray,
+        mhs: np.ndarray,
+        perubahan: np.ndarray,
+        waktu_a: np.ndarray,
+        waktu_b: np.ndarray,
+        n: int,
+    ) -> np.ndarray:
+        # perubahan ditambahkan pada waktu_a dan dikurangkan pada waktu_b
+        waktu_a = waktu_a[cand]
+        waktu_b = waktu_b[cand]
+        lama_a = self.jam_mahasiswa[mhs, waktu_a]
+        lama_b = self.jam_mahasiswa[mhs, waktu_b]
+        baru_a = lama_a + perubahan
+        baru_b = lama_b - perubahan
+        delta = (
+            _penalti_jam(baru_a)
+            - _penalti_jam(lama_a)
+            + _penalti_jam(baru_b)
+            - _penalti_jam(lama_b)
+        )
+        delta[waktu_a == waktu_b] = 0
+        # Tanpa entri mahasiswa bincount mengembalikan int64, bukan float64
+        return np.bincount(cand, weights=delta, minlength=n).astype(
+            np.float64, copy=False
+        )
+
+    def _penalti_kuota(self, kelas: np.ndarray, ruang: np.ndarray) -> np.ndarray:
+        over_capacity = (
+            self.compiled.jumlah_mahasiswa[kelas] - self.compiled.kuota_ruangan[ruang]
+        )
+        return np.maximum(over_capacity, 0)
+
+
+class PopulationEvaluator:
+    # Menilai seluruh populasi sekaligus. Populasi adalah array int berukuran
+    # (jumlah individu, jumlah pertemuan) berisi ID slot (ruang * N_WAKTU + waktu)
+    # dengan urutan pertemuan yang sama seperti CompiledProblem.
+    def __init__(self, compiled: CompiledProblem, chunk_elements: int = 1 << 18):
+        self.compiled = compiled
+
+        # Insidensi pertemuan x mahasiswa dalam format entri: entri ke-e adalah
+        # mahasiswa entri_mahasiswa[e] pada pertemuan entri_pertemuan[e], diulang
+        # sebanyak jumlah pengambilan kelasnya
+        kelas = compiled.kelas_pertemuan
+        awal = compiled.mahasiswa_ptr[kelas]
+        panjang = compiled.mahasiswa_ptr[kelas + 1] - awal
+        posisi = (
+            np.arange(panjang.sum())
+            - np.repeat(np.cumsum(panjang) - panjang, panjang)
+            + np.repeat(awal, panjang)
+        )
+        jumlah = compiled.mahasiswa_jumlah[posisi]
+        self.entri_pertemuan = np.repeat(
+            np.repeat(np.arange(compiled.n_pertemuan), panjang), jumlah
+        )
+        self.entri_mahasiswa = np.repeat(compiled.mahasiswa_idx[posisi], jumlah)
+        self.offset_entri = self.entri_mahasiswa * N_WAKTU
+
+        # Individu dinilai per potongan agar array perantara tidak melebihi chunk_elements
+        self.n_sel = compiled.n_mahasiswa * N_WAKTU
+        self.n_slot = compiled.n_ruangan * N_WAKTU
+        self.chunk = max(
+            1,
+            chunk_elements
+            // max(1, self.n_sel, self.n_slot, len(self.entri_pertemuan)),
+        )
+
+    def objective(self, genome: np.ndarray) -> np.ndarray:
+        return (
+            self.tabrakan_jam(genome).sum(axis=1)
+            + self.tabrakan_ruangan_berbobot(genome)
+            + self.kuota_kelas(genome)
+        )
+
+    def tabrakan_jam(self, genome: np.ndarray) -> np.ndarray:
+        # Penalti tabrakan jadwal mahasiswa per individu per jam
+        res = np.empty((len(genome), N_WAKTU), dtype=np.int64)
+        for awal in range(0, len(genome), self.chunk):
+            blok = genome[awal : awal + self.chunk]
+            n = len(blok)
+            kunci = (blok % N_WAKTU)[:, self.entri_pertemuan]
+            kunci += self.offset_entri
+            kunci += (np.arange(n) * self.n_sel)[:, None]
+            jumlah = np.bincount(kunci.ravel(), minlength=n * self.n_sel).reshape(
+                n, self.compiled.n_mahasiswa, N_WAKTU
+            )
+            jumlah[jumlah < 2] = 0
+            jumlah.sum(axis=1, out=res[awal : awal + n])
+        return res
+
+    def tabrakan_ruangan_berbobot(self, genome: np.ndarray) -> np.ndarray:
+        res = np.empty(len(genome), dtype=np.float64)
+        bobot_pertemuan = self.compiled.bobot_pertemuan
+        for awal in range(0, len(genome), self.chunk):
+            blok = genome[awal : awal + self.chunk]
+            n = len(blok)
+            kunci = (blok + (np.arange(n) * self.n_slot)[:, None]).ravel()
+            jumlah = np.bincount(kunci, minlength=n * self.n_slot)
+            bobot = np.bincount(
+                kunci,
+                weights=np.broadcast_to(bobot_pertemuan, blok.shape).ravel(),
+                minlength=n * self.n_slot,
+            )
+            res[awal : awal + n] = (
+                _penalti_slot(jumlah, bobot).reshape(n, self.n_slot).sum(axis=1)
+            )
+        return res
+
+    def kuota_kelas(self, genome: np.ndarray) -> np.ndarray:
+        c = self.compiled
+        over_capacity = (
+            c.jumlah_mahasiswa_pertemuan - c.kuota_ruangan[genome // N_WAKTU]
+        )
+        return np.maximum(over_capacity, 0).sum(axis=1)
+
+
+def _penalti_jam(jumlah: np.ndarray) -> np.ndarray:
+    return np.where(jumlah > 1, jumlah, 0)
+
+
+def _penalti_slot(jumlah: np.ndarray, bobot: np.ndarray) -> np.ndarray:
+    return np.where(jumlah > 1, bobot, 0.0)
+
+
+def compile_problem(problem: Problem) -> CompiledProblem:
+    if problem.compiled is None:
+        problem.compiled = CompiledProblem(problem)
+    return problem.compiled
@@ -1,13 +1,25 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from .state import Problem, State, JadwalKuliah, Slot, LIST_WAKTU_MULAI
+from .state import Problem, State, JadwalKuliah, N_WAKTU
+from .compiled import PopulationEvaluator, compile_problem
 from .solver import Solver
+from .budget import SearchBudget
+from .stagnation import StagnationCriteria, StagnationDetector
+from .perf import PerfCounters
 from ..schemas import GeneticAlgorithmResultsModel
+from time import perf_counter
+import hashlib
+import numpy as np
 import random
 import time
-import copy
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple, Dict, Optional
 
+MIGRATION_TOPOLOGIES = ("ring", "random")
+# Jumlah objective genome yang diingat untuk melewati evaluasi genome duplikat
+FITNESS_MEMO_SIZE = 4096
+
 
 @dataclass(frozen=True)
 class GAParams:
@@ -17,14 +29,51 @@ class GAParams:
     mutation_rate: float = 0.2
     tournament_k: int = 3
     elitism: int = 1
+    # Island model: populasi dibagi ke beberapa pulau yang berevolusi pada proses
+    # terpisah dan bertukar individu terbaik setiap migration_interval generasi
+    islands: int = 1
+    migration_interval: int = 10
+    migrants: int = 2
+    migration_topology: str = "ring"
 
 
-class GAIndividual:
-    __slots__ = ["jadwal", "objective"]
+class GAPopulation:
+    # Genome seluruh individu dalam satu buffer. Baris ke-i berisi ID slot setiap
+    # pertemuan individu ke-i, pertemuan kelas ke-k ada pada kolom
+    # GAState.offset_kelas[k]..offset_kelas[k + 1]. tabrakan_jam menyimpan penalti
+    # tabrakan mahasiswa per jam agar anak cukup menghitung ulang jam yang berubah
+    __slots__ = ["genome", "objective", "tabrakan_jam"]
 
-    def __init__(self, jadwal: JadwalKuliah, objective: float):
-        self.jadwal = jadwal
+    def __init__(
+        self, genome: np.ndarray, objective: np.ndarray, tabrakan_jam: np.ndarray
+    ):
+        self.genome = genome
         self.objective = objective
+        self.tabrakan_jam = tabrakan_jam
+
+    @classmethod
+    def empty(cls, size: int, n_pertemuan: int) -> GAPopulation:
+        return cls(
+            np.empty((size, n_pertemuan), dtype=np.int64),
+            np.empty(size, dtype=np.float64),
+            np.empty((size, N_WAKTU), dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.objective)
+
+    def best(self) -> int:
+        return int(np.argmin(self.objective))
+
+    def take(self, indices: np.ndarray) -> GAPopulation:
+        return GAPopulation(
+            self.genome[indices], self.objective[indices], self.tabrakan_jam[indices]
+        )
+
+    def copy_from(self, i: int, source: GAPopulation, j: int):
+        self.genome[i] = source.genome[j]
+        self.objective[i] = source.objective[j]
+        self.tabrakan_jam[i] = source.tabrakan_jam[j]
 
 
 class GAState(State):
@@ -35,95 +84,357 @@ class GAState(State):
     ):
         super().__init__(problem, JadwalKuliah({}), randomizer)
 
-    def _evaluate(self, jadwal: JadwalKuliah) -> float:
-        backup = self.jadwal
-        self.jadwal = jadwal
-        val = self.objective()
-        self.jadwal = backup
-        return val
+        # Tabel per pertemuan untuk genome datar, urut sesuai problem.list_kelas
+        list_kelas = problem.list_kelas
+        self.kode_kelas = [kelas.kode for kelas in list_kelas]
+        self.sks_kelas = [kelas.sks for kelas in list_kelas]
+        self.offset_kelas = [0]
+        for sks in self.sks_kelas:
+            self.offset_kelas.append(self.offset_kelas[-1] + sks)
+        self.n_kelas = len(list_kelas)
+        self.n_pertemuan = self.offset_kelas[-1]
+        self.kelas_pertemuan = np.repeat(
+            np.arange(self.n_kelas, dtype=np.int64), self.sks_kelas
+        )
+        # Objective seluruh generasi dihitung dalam satu pass NumPy
+        self.evaluator = PopulationEvaluator(compile_problem(problem))
+
+        # Objective genome yang pernah dievaluasi, kunci adalah digest genome
+        self.memo: Dict[bytes, Tuple[float, np.ndarray]] = {}
+
+        # Buffer kerja operator, dipakai ulang setiap generasi
+        self._dari_p1 = np.empty(self.n_pertemuan, dtype=np.bool_)
+        self._slot_terpakai = np.empty(problem.n_slot, dtype=np.bool_)
+        self._anak_cadangan = np.empty(self.n_pertemuan, dtype=np.int64)
+
+    def encode(self, jadwal: JadwalKuliah, out: np.ndarray):
+        for k, kode in enumerate(self.kode_kelas):
+            out[self.offset_kelas[k] : self.offset_kelas[k + 1]] = jadwal.slot_kuliah[
+                kode
+            ]
+
+    def decode(self, genome: np.ndarray) -> JadwalKuliah:
+        slot_list = genome.tolist()
+        return JadwalKuliah(
+            {
+                kode: slot_list[self.offset_kelas[k] : self.offset_kelas[k + 1]]
+                for k, kode in enumerate(self.kode_kelas)
+            }
+        )
 
-    def seed_population(self, n: int) -> List[GAIndividual]:
-        population: List[GAIndividual] = []
-        for _ in range(n):
-            super().seed_jadwal()
-            indiv = GAIndividual(
-                copy.deepcopy(self.jadwal), self._evaluate(self.jadwal)
+    def evaluate(
+        self,
+        population: GAPopulation,
+        start: int = 0,
+        induk: Optional[GAPopulation] = None,
+        indeks_induk: Tuple[np.ndarray, ...] = (),
+    ):
+        # Mengisi objective dan tabrakan_jam individu population[start:]. indeks_induk
+        # berisi indeks induk pada populasi induk untuk setiap individu tersebut
+        mulai = perf_counter()
+        genome = population.genome[start:]
+        objective = population.objective[start:]
+        tabrakan_jam = population.tabrakan_jam[start:]
+        n = len(genome)
+        selesai = np.zeros(n, dtype=np.bool_)
+        hitung_jam = np.ones((n, N_WAKTU), dtype=np.bool_)
+
+        # Jam yang tidak disentuh pertemuan yang berbeda dari salah satu induk
+        # diwarisi dari induk tersebut, anak yang sama dengan induknya selesai
+        for indeks in indeks_induk:
+            genome_induk = induk.genome[indeks]
+            berbeda = genome != genome_induk
+            tersentuh = self._jam_tersentuh(genome, genome_induk, berbeda)
+            np.copyto(tabrakan_jam, induk.tabrakan_jam[indeks], where=~tersentuh)
+            hitung_jam &= tersentuh
+            sama = ~berbeda.any(axis=1)
+            objective[sama] = induk.objective[indeks[sama]]
+            selesai |= sama
+
+        # Genome yang ada di memo atau muncul lebih dari sekali tidak dievaluasi ulang
+        kunci: Dict[bytes, int] = {}
+        duplikat: List[Tuple[int, int]] = []
+        for i in np.flatnonzero(~selesai).tolist():
+            key = hashlib.blake2b(genome[i], digest_size=16).digest()
+            hit = self.memo.get(key)
+            if hit is not None:
+                objective[i], tabrakan_jam[i] = hit
+                selesai[i] = True
+            elif key in kunci:
+                duplikat.append((i, kunci[key]))
+                selesai[i] = True
+            else:
+                kunci[key] = i
+
+        dievaluasi = np.fromiter(kunci.values(), dtype=np.int64, count=len(kunci))
+        perlu_jam = dievaluasi[hitung_jam[dievaluasi].any(axis=1)]
+        if len(perlu_jam):
+            tabrakan_jam[perlu_jam] = self.evaluator.tabrakan_jam(genome[perlu_jam])
+        if len(dievaluasi):
+            dievaluasi_genome = genome[dievaluasi]
+            objective[dievaluasi] = (
+                tabrakan_jam[dievaluasi].sum(axis=1)
+                + self.evaluator.tabrakan_ruangan_berbobot(dievaluasi_genome)
+                + self.evaluator.kuota_kelas(dievaluasi_genome)
+            )
+        for i, asal in duplikat:
+            objective[i] = objective[asal]
+            tabrakan_jam[i] = tabrakan_jam[asal]
+
+        for key, i in kunci.items():
+            if len(self.memo) >= FITNESS_MEMO_SIZE:
+                del self.memo[next(iter(self.memo))]
+            self.memo[key] = (float(objective[i]), tabrakan_jam[i].copy())
+        self.perf.evaluations += len(dievaluasi)
+        self.perf.evaluation_time += perf_counter() - mulai
+
+    def _jam_tersentuh(
+        self, genome: np.ndarray, genome_induk: np.ndarray, berbeda: np.ndarray
+    ) -> np.ndarray:
+        # Jam asal dan tujuan setiap pertemuan yang berbeda dari induk, per individu
+        n = len(genome)
+        baris = (np.arange(n) * N_WAKTU)[:, None]
+        kunci = np.concatenate(
+            (
+                (genome_induk % N_WAKTU + baris)[berbeda],
+                (genome % N_WAKTU + baris)[berbeda],
             )
-            population.append(indiv)
+        )
+        return (np.bincount(kunci, minlength=n * N_WAKTU) > 0).reshape(n, N_WAKTU)
+
+    def seed_population(self, n: int) -> GAPopulation:
+        # Populasi awal memulai pencarian baru, memo dikosongkan agar jumlah evaluasi
+        # (dan anggaran max_evaluations) tidak bergantung pada pencarian sebelumnya
+        self.memo.clear()
+        population = GAPopulation.empty(n, self.n_pertemuan)
+        for i in range(n):
+            super().seed_jadwal()
+            self.encode(self.jadwal, population.genome[i])
+        self.evaluate(population)
         return population
 
-    def tournament_select(self, population: List[GAIndividual], k: int) -> GAIndividual:
-        chosen = self.random.sample(population, k=min(k, len(population)))
-        best = min(chosen, key=lambda ind: ind.objective)
-        return best
-
-    def _all_possible_slots(self) -> List[Slot]:
-        all_slots: List[Slot] = []
-        for ruangan in self.problem.list_ruangan:
-            for hari, waktu_mulai in LIST_WAKTU_MULAI:
-                all_slots.append(Slot(ruangan.kode, hari, waktu_mulai, waktu_mulai + 1))
-        return all_slots
-
-    def _empty_slots_for(self, jadwal: JadwalKuliah) -> List[Slot]:
-        used: set[Slot] = set()
-        for slot_list in jadwal.slot_kuliah.values():
-            for s in slot_list:
-                used.add(s)
-        all_slots = self._all_possible_slots()
-        return [s for s in all_slots if s not in used]
+    def diversity(self, population: GAPopulation) -> float:
+        # Rata-rata proporsi pertemuan yang slotnya berbeda dari individu terbaik
+        genome = population.genome
+        berbeda = np.count_nonzero(genome != genome[population.best()])
+        return berbeda / max(1, genome.size)
+
+    def tournament_select(self, population: GAPopulation, k: int) -> int:
+        chosen = self.random.sample(range(len(population)), k=min(k, len(population)))
+        return min(chosen, key=population.objective.__getitem__)
 
     def crossover(
-        self, p1: GAIndividual, p2: GAIndividual
-    ) -> Tuple[JadwalKuliah, JadwalKuliah]:
-        child1_map: Dict[str, List[Slot]] = {}
-        child2_map: Dict[str, List[Slot]] = {}
-
-        kelas_codes: List[str] = [k.kode for k in self.problem.list_kelas]
-
-        for kode in kelas_codes:
-            take_from_p1 = self.random.random() < 0.5
-            if take_from_p1:
-                child1_map[kode] = list(p1.jadwal.slot_kuliah[kode])
-                child2_map[kode] = list(p2.jadwal.slot_kuliah[kode])
-            else:
-                child1_map[kode] = list(p2.jadwal.slot_kuliah[kode])
-                child2_map[kode] = list(p1.jadwal.slot_kuliah[kode])
-
-        return JadwalKuliah(child1_map), JadwalKuliah(child2_map)
-
-    def _mut_swap_two_meetings(self, jadwal: JadwalKuliah):
-        k1 = self.random.choice(self.problem.list_kelas).kode
-        k2 = self.random.choice(self.problem.list_kelas).kode
-        s1_list = jadwal.slot_kuliah[k1]
-        s2_list = jadwal.slot_kuliah[k2]
-        i = self.random.randrange(len(s1_list))
-        j = self.random.randrange(len(s2_list))
-        s1_list[i], s2_list[j] = s2_list[j], s1_list[i]
-
-    def _mut_move_to_empty(self, jadwal: JadwalKuliah):
-        empty_slots = self._empty_slots_for(jadwal)
-        if not empty_slots:
+        self, p1: np.ndarray, p2: np.ndarray, child1: np.ndarray, child2: np.ndarray
+    ):
+        # Uniform crossover per kelas: semua pertemuan satu kelas diwarisi dari induk
+        # yang sama, ditulis langsung ke baris anak
+        bits = self.random.getrandbits(self.n_kelas).to_bytes(
+            (self.n_kelas + 7) // 8, "little"
+        )
+        dari_p1_kelas = np.unpackbits(
+            np.frombuffer(bits, dtype=np.uint8), count=self.n_kelas, bitorder="little"
+        ).view(np.bool_)
+        dari_p1 = np.take(dari_p1_kelas, self.kelas_pertemuan, out=self._dari_p1)
+        np.copyto(child1, p2)
+        np.copyto(child1, p1, where=dari_p1)
+        np.copyto(child2, p1)
+        np.copyto(child2, p2, where=dari_p1)
+
+    def _random_pertemuan(self) -> int:
+        # Kelas dipilih seragam, lalu salah satu pertemuannya
+        k = self.random.randrange(self.n_kelas)
+        return self.offset_kelas[k] + self.random.randrange(self.sks_kelas[k])
+
+    def _mut_swap_two_meetings(self, genome: np.ndarray):
+        i = self._random_pertemuan()
+        j = self._random_pertemuan()
+        genome[i], genome[j] = genome[j], genome[i]
+
+    def _mut_move_to_empty(self, genome: np.ndarray):
+        terpakai = self._slot_terpakai
+        terpakai.fill(False)
+        terpakai[genome] = True
+        n_slot = self.problem.n_slot
+        n_kosong = n_slot - int(np.count_nonzero(terpakai))
+        if n_kosong == 0:
             return
-        k = self.random.choice(self.problem.list_kelas).kode
-        s_list = jadwal.slot_kuliah[k]
-        idx = self.random.randrange(len(s_list))
-        s_list[idx] = self.random.choice(empty_slots)
+        i = self._random_pertemuan()
+        if n_kosong * 8 >= n_slot:
+            # Rejection sampling tetap seragam di antara slot kosong
+            slot = self.random.randrange(n_slot)
+            while terpakai[slot]:
+                slot = self.random.randrange(n_slot)
+        else:
+            slot = int(np.flatnonzero(~terpakai)[self.random.randrange(n_kosong)])
+        genome[i] = slot
 
-    def mutate(self, jadwal: JadwalKuliah, mutation_rate: float):
+    def mutate(self, genome: np.ndarray, mutation_rate: float):
         if self.random.random() > mutation_rate:
             return
 
         if self.random.random() < 0.5:
-            self._mut_swap_two_meetings(jadwal)
+            self._mut_swap_two_meetings(genome)
         else:
-            self._mut_move_to_empty(jadwal)
+            self._mut_move_to_empty(genome)
+
+    def elitism(self, population: GAPopulation, elitism_n: int) -> np.ndarray:
+        # Indeks individu terbaik, urut dari objective terkecil
+        if elitism_n <= 0:
+            return np.empty(0, dtype=np.int64)
+        return np.argsort(population.objective, kind="stable")[:elitism_n]
+
+    def next_generation(
+        self, population: GAPopulation, params: GAParams, out: GAPopulation
+    ):
+        # Generasi berikutnya ditulis ke buffer out yang berukuran sama
+        ps = len(population)
+        elitism_n = max(0, min(params.elitism, ps - 1))
+        genome = population.genome
+        objective = population.objective
+
+        elites = self.elitism(population, elitism_n)
+        mulai = perf_counter()
+        np.take(genome, elites, axis=0, out=out.genome[:elitism_n])
+        out.objective[:elitism_n] = objective[elites]
+        out.tabrakan_jam[:elitism_n] = population.tabrakan_jam[elites]
+        self.perf.copy_time += perf_counter() - mulai
+
+        # Semua anak dibangkitkan dulu, lalu dinilai bersama dalam satu pass
+        induk = np.empty((2, ps - elitism_n), dtype=np.int64)
+        n = elitism_n
+        while n < ps:
+            i1 = self.tournament_select(population, params.tournament_k)
+            i2 = self.tournament_select(population, params.tournament_k)
+            c1 = out.genome[n]
+            # Anak kedua yang tidak muat tetap dibangkitkan pada buffer cadangan
+            c2 = out.genome[n + 1] if n + 1 < ps else self._anak_cadangan
+
+            if self.random.random() < params.crossover_rate:
+                mulai = perf_counter()
+                self.crossover(genome[i1], genome[i2], c1, c2)
+                self.perf.move_time += perf_counter() - mulai
+            else:
+                mulai = perf_counter()
+                np.copyto(c1, genome[i1])
+                np.copyto(c2, genome[i2])
+                self.perf.copy_time += perf_counter() - mulai
+
+            mulai = perf_counter()
+            self.mutate(c1, params.mutation_rate)
+            self.mutate(c2, params.mutation_rate)
+            self.perf.move_time += perf_counter() - mulai
+
+            induk[:, n - elitism_n : n - elitism_n + 2] = [[i1], [i2]]
+            n += 2
+
+        self.evaluate(out, elitism_n, population, (induk[0], induk[1]))
+
+        # Anak dihitung diterima jika lebih baik dari kedua induknya
+        batas = np.minimum(objective[induk[0]], objective[induk[1]])
+        self.perf.proposed += len(batas)
+        self.perf.accepted += int(np.count_nonzero(out.objective[elitism_n:] < batas))
+
+
+@dataclass
+class Island:
+    size: int
+    random_state: tuple
+    population: Optional[GAPopulation] = None
+
+
+@dataclass
+class IslandEpoch:
+    island: Island
+    best_trace: List[float]
+    avg_trace: List[float]
+    emigrants: GAPopulation
+    perf: PerfCounters
+    diversity: Optional[float] = None
+
+
+_island_state: Optional[GAState] = None
+
+
+def _init_island_worker(problem: Problem):
+    global _island_state
+    _island_state = GAState(problem, random.Random())
+
+
+def _evolve_island(
+    island: Island,
+    generations: int,
+    params: GAParams,
+    immigrants: Optional[GAPopulation],
+    measure_diversity: bool = False,
+) -> IslandEpoch:
+    state = _island_state
+    state.random.setstate(island.random_state)
+    state.perf = PerfCounters()
+
+    best_trace: List[float] = []
+    avg_trace: List[float] = []
+    if island.population is None:
+        population = state.seed_population(island.size)
+    else:
+        population = island.population
+        # Imigran menggantikan individu terburuk
+        n_immigrants = (
+            0 if immigrants is None else min(len(immigrants), len(population) - 1)
+        )
+        if n_immigrants > 0:
+            terburuk = np.argsort(population.objective, kind="stable")[
+                len(population) - n_immigrants :
+            ]
+            population.genome[terburuk] = immigrants.genome[:n_immigrants]
+            population.objective[terburuk] = immigrants.objective[:n_immigrants]
+            population.tabrakan_jam[terburuk] = immigrants.tabrakan_jam[:n_immigrants]
+
+    cadangan = GAPopulation.empty(len(population), state.n_pertemuan)
+    for _ in range(generations):
+        state.next_generation(population, params, cadangan)
+        population, cadangan = cadangan, population
+        best_trace.append(float(population.objective.min()))
+        avg_trace.append(float(population.objective.mean()))
+
+    n_migrants = max(0, min(params.migrants, island.size - 1))
+    emigrants = population.take(state.elitism(population, n_migrants))
+    return IslandEpoch(
+        island=Island(island.size, state.random.getstate(), population),
+        best_trace=best_trace,
+        avg_trace=avg_trace,
+        emigrants=emigrants,
+        perf=state.perf,
+        diversity=state.diversity(population) if measure_diversity else None,
+    )
 
 
 class GeneticAlgorithm(Solver):
-    def __init__(self, input: Problem, params: Optional[GAParams] = None):
-        super().__init__(input)
+    def __init__(
+        self,
+        input: Problem,
+        params: Optional[GAParams] = None,
+        seed: Optional[int] = None,
+        budget: Optional[SearchBudget] = None,
+        stagnation: Optional[StagnationCriteria] = None,
+    ):
+        super().__init__(input, seed, budget)
         self.params = params or GAParams()
-        self.state = GAState(input)
+        self.stagnation = stagnation or StagnationCriteria()
+        self.stagnation.validate()
+        if self.params.population_size < 1:
+            raise ValueError("Ukuran populasi harus lebih dari nol")
+        if self.params.islands < 1:
+            raise ValueError("Jumlah pulau harus lebih dari nol")
+        if self.params.islands > self.params.population_size:
+            raise ValueError("Jumlah pulau tidak boleh melebihi ukuran populasi")
+        if self.params.migration_interval < 1:
+            raise ValueError("Interval migrasi harus lebih dari nol")
+        if self.params.migration_topology not in MIGRATION_TOPOLOGIES:
+            raise ValueError(
+                f"Topologi migrasi harus salah satu dari {', '.join(MIGRATION_TOPOLOGIES)}"
+            )
+        self.state = GAState(input, self.random)
+        self.state.perf = self.perf
 
         self.search_time: float = 0.0
         self.generations_done: int = 0
@@ -133,81 +444,182 @@ class GeneticAlgorithm(Solver):
         self.jadwal_init: Optional[JadwalKuliah] = None
         self.jadwal: Optional[JadwalKuliah] = None
 
-    def _evaluate_population(self, pop: List[GAIndividual]):
-        for ind in pop:
-            ind.objective = self.state._evaluate(ind.jadwal)
-
-    def _elitism(self, pop: List[GAIndividual], elitism_n: int) -> List[GAIndividual]:
-        if elitism_n <= 0:
-            return []
-        elites = sorted(pop, key=lambda ind: ind.objective)[:elitism_n]
-        return [GAIndividual(copy.deepcopy(e.jadwal), e.objective) for e in elites]
-
     def search(self):
         self.search_time = 0.0
+        self.perf.reset()
+        self._start_budget()
         self.generations_done = 0
         self.best_objective_trace = []
         self.avg_objective_trace = []
         self.jadwal_init = None
         self.jadwal = None
 
+        if self.params.islands > 1:
+            self._search_islands()
+            return
+
         ps = self.params.population_size
         gens = self.params.max_generations
-        cx_rate = self.params.crossover_rate
-        mut_rate = self.params.mutation_rate
-        k = self.params.tournament_k
-        elitism_n = max(0, min(self.params.elitism, ps - 1))
 
+        # Dua buffer populasi dipakai bergantian antar generasi
         population = self.state.seed_population(ps)
-        best0 = min(population, key=lambda ind: ind.objective)
-        self.jadwal_init = copy.deepcopy(best0.jadwal)
+        cadangan = GAPopulation.empty(ps, self.state.n_pertemuan)
+        best0 = population.best()
+        self.jadwal_init = self.state.decode(population.genome[best0])
 
-        self.best_objective_trace.append(best0.objective)
-        self.avg_objective_trace.append(
-            sum(ind.objective for ind in population) / len(population)
-        )
+        self.best_objective_trace.append(float(population.objective[best0]))
+        self.avg_objective_trace.append(float(population.objective.mean()))
+
+        detector = None
+        if self.stagnation.active():
+            detector = StagnationDetector(self.stagnation)
+            detector.update(self.best_objective_trace[-1], steps=0)
 
         start = time.time()
 
         for gen in range(1, gens + 1):
-            next_population: List[GAIndividual] = []
-
-            elites = self._elitism(population, elitism_n)
-            next_population.extend(elites)
-
-            while len(next_population) < ps:
-                p1 = self.state.tournament_select(population, k)
-                p2 = self.state.tournament_select(population, k)
+            self.state.next_generation(population, self.params, cadangan)
+            population, cadangan = cadangan, population
 
-                if self.state.random.random() < cx_rate:
-                    c1_jadwal, c2_jadwal = self.state.crossover(p1, p2)
-                else:
-                    c1_jadwal = copy.deepcopy(p1.jadwal)
-                    c2_jadwal = copy.deepcopy(p2.jadwal)
+            best = float(population.objective.min())
+            avg = float(population.objective.mean())
+            self.best_objective_trace.append(best)
+            self.avg_objective_trace.append(avg)
 
-                self.state.mutate(c1_jadwal, mut_rate)
-                self.state.mutate(c2_jadwal, mut_rate)
+            self.generations_done = gen
+            if self._tick(gen, best, best=best, avg=avg):
+                break
+            if detector is not None and self._stop(
+                detector.update(best) or self._check_diversity(detector, population)
+            ):
+                break
 
-                c1 = GAIndividual(c1_jadwal, self.state._evaluate(c1_jadwal))
-                next_population.append(c1)
-                if len(next_population) < ps:
-                    c2 = GAIndividual(c2_jadwal, self.state._evaluate(c2_jadwal))
-                    next_population.append(c2)
+        end = time.time()
+        self.search_time = end - start
 
-            population = next_population
+        self.jadwal = self.state.decode(population.genome[population.best()])
 
-            best = min(population, key=lambda ind: ind.objective)
-            avg = sum(ind.objective for ind in population) / len(population)
-            self.best_objective_trace.append(best.objective)
-            self.avg_objective_trace.append(avg)
+    def _search_islands(self):
+        n_islands = self.params.islands
+        ps = self.params.population_size
+        gens = self.params.max_generations
+        interval = self.params.migration_interval
+
+        # Populasi dibagi serata mungkin ke setiap pulau
+        islands = [
+            Island(
+                size=ps // n_islands + (1 if i < ps % n_islands else 0),
+                random_state=random.Random(
+                    self.state.random.getrandbits(64)
+                ).getstate(),
+            )
+            for i in range(n_islands)
+        ]
+        immigrants: List[Optional[GAPopulation]] = [None] * n_islands
+        measure_diversity = self.stagnation.min_diversity is not None
 
-            self.generations_done = gen
+        start = time.time()
+        with ProcessPoolExecutor(
+            max_workers=n_islands,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_island_worker,
+            initargs=(self.input,),
+        ) as executor:
+            # Epoch pertama hanya membangkitkan populasi awal
+            epochs = list(
+                executor.map(
+                    _evolve_island,
+                    islands,
+                    [0] * n_islands,
+                    [self.params] * n_islands,
+                    immigrants,
+                )
+            )
+            for epoch in epochs:
+                self.perf.merge(epoch.perf)
+            populations = [epoch.island.population for epoch in epochs]
+            best0 = min(populations, key=lambda population: population.objective.min())
+            self.jadwal_init = self.state.decode(best0.genome[best0.best()])
+            self.best_objective_trace.append(float(best0.objective.min()))
+            self.avg_objective_trace.append(
+                sum(float(population.objective.sum()) for population in populations)
+                / ps
+            )
+            detector = None
+            if self.stagnation.active():
+                detector = StagnationDetector(self.stagnation)
+                detector.update(self.best_objective_trace[-1], steps=0)
+
+            while self.generations_done < gens:
+                generations = min(interval, gens - self.generations_done)
+                immigrants = self._migrate([epoch.emigrants for epoch in epochs])
+                epochs = list(
+                    executor.map(
+                        _evolve_island,
+                        [epoch.island for epoch in epochs],
+                        [generations] * n_islands,
+                        [self.params] * n_islands,
+                        immigrants,
+                        [measure_diversity] * n_islands,
+                    )
+                )
+                for epoch in epochs:
+                    self.perf.merge(epoch.perf)
+                for g in range(generations):
+                    self.best_objective_trace.append(
+                        min(epoch.best_trace[g] for epoch in epochs)
+                    )
+                    self.avg_objective_trace.append(
+                        sum(epoch.avg_trace[g] * epoch.island.size for epoch in epochs)
+                        / ps
+                    )
+                self.generations_done += generations
+                if self._tick(
+                    self.generations_done,
+                    self.best_objective_trace[-1],
+                    best=self.best_objective_trace[-1],
+                    avg=self.avg_objective_trace[-1],
+                ):
+                    break
+                if detector is None:
+                    continue
+                alasan = detector.update(
+                    self.best_objective_trace[-1], steps=generations
+                )
+                if alasan is None and measure_diversity:
+                    # Dirata-ratakan per pulau, antar pulau memang dibiarkan berbeda
+                    alasan = detector.check_diversity(
+                        sum(epoch.diversity for epoch in epochs) / n_islands
+                    )
+                if self._stop(alasan):
+                    break
 
         end = time.time()
         self.search_time = end - start
 
-        final_best = min(population, key=lambda ind: ind.objective)
-        self.jadwal = copy.deepcopy(final_best.jadwal)
+        final_best = min(
+            (epoch.island.population for epoch in epochs),
+            key=lambda population: population.objective.min(),
+        )
+        self.jadwal = self.state.decode(final_best.genome[final_best.best()])
+
+    def _check_diversity(
+        self, detector: StagnationDetector, population: GAPopulation
+    ) -> Optional[str]:
+        if self.stagnation.min_diversity is None:
+            return None
+        return detector.check_diversity(self.state.diversity(population))
+
+    def _migrate(self, emigrants: List[GAPopulation]) -> List[GAPopulation]:
+        n_islands = len(emigrants)
+        if self.params.migration_topology == "ring":
+            sources = [(i - 1) % n_islands for i in range(n_islands)]
+        else:
+            sources = [
+                self.state.random.choice([j for j in range(n_islands) if j != i])
+                for i in range(n_islands)
+            ]
+        return [emigrants[source] for source in sources]
 
     def get_result(self) -> GeneticAlgorithmResultsModel:
         return GeneticAlgorithmResultsModel(
@@ -224,5 +636,10 @@ class GeneticAlgorithm(Solver):
                 "tournament_k": self.params.tournament_k,
                 "elitism": self.params.elitism,
                 "max_generations": self.params.max_generations,
+                "islands": self.params.islands,
+                "migration_interval": self.params.migration_interval,
+                "migrants": self.params.migrants,
             },
+            stop_reason=self.stop_reason,
+            perf=self._perf_model(self.search_time),
         )
@@ -1,12 +1,22 @@
 from dataclasses import dataclass
-from .state import Problem, State, JadwalKuliah, Slot, LIST_WAKTU_MULAI
+from .state import Problem, State, JadwalKuliah
 from .solver import Solver
+from .budget import SearchBudget, BudgetClock, STOP_TARGET_OBJECTIVE, STOP_CANCELLED
+from .progress import SolverProgress
+from .perf import PerfCounters
+from .compiled import NeighborhoodEvaluator, compile_problem
+from .move_queue import MoveDeltaQueue, SWAP
 from ..schemas import HillClimbingResultsModel
+import numpy as np
+from time import perf_counter
 import random
 import time
-import copy
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from typing import Optional
 
+DEFAULT_NEIGHBORHOOD_SIZE = 50
+
 
 @dataclass(frozen=True)
 class IterationResult:
@@ -21,23 +31,33 @@ class HillClimbingState(State):
         problem: Problem,
         jadwal=JadwalKuliah({}),
         randomizer: random.Random = random.Random(int(time.time() * 1000)),
+        neighborhood_size: int = DEFAULT_NEIGHBORHOOD_SIZE,
+        batched: bool = False,
     ):
+        if neighborhood_size < 1:
+            raise ValueError("Ukuran neighborhood harus lebih dari nol")
         super().__init__(problem, jadwal, randomizer)
 
-        self.slot_assignment: dict[Slot, list[str]] = dict()
-        self.empty_slots: set[Slot] = set()
+        # Banyak kandidat swap dan move yang dicoba setiap iterasi
+        self.neighborhood_size = neighborhood_size
+        self.batched = batched
+        self.evaluator: Optional[NeighborhoodEvaluator] = None
+        self.np_random: Optional[np.random.Generator] = None
 
     def next(self, allow_sideways: bool = False) -> IterationResult:
-        e_init = self._energy()
+        if self.evaluator is not None:
+            return self._next_batched(allow_sideways)
+
         best_delta = 0.0
         best_move = None
         sideways_candidate = None
 
-        num_swaps_to_try = min(len(self.problem.list_kelas) ** 2, 50)
+        num_swaps_to_try = min(
+            len(self.problem.list_kelas) ** 2, self.neighborhood_size
+        )
         for _ in range(num_swaps_to_try):
             kelas1, slot1, kelas2, slot2 = self._random_pair_jadwal()
-            self._swap_pair_jadwal(kelas1, slot1, kelas2, slot2)
-            delta = self._energy() - e_init
+            delta = self.delta_swap(kelas1, slot1, kelas2, slot2)
 
             if delta < best_delta:
                 best_delta = delta
@@ -50,16 +70,14 @@ class HillClimbingState(State):
             ):
                 sideways_candidate = ("swap", kelas1, slot1, kelas2, slot2)
 
-            self._swap_pair_jadwal(kelas1, slot2, kelas2, slot1)
-
         if len(self.empty_slots) > 0:
             num_moves_to_try = min(
-                len(self.problem.list_kelas) * len(self.empty_slots), 50
+                len(self.problem.list_kelas) * len(self.empty_slots),
+                self.neighborhood_size,
             )
             for _ in range(num_moves_to_try):
                 slot_from, kode, slot_to = self._random_move_to_empty_slot()
-                self._move_into_slot(slot_from, kode, slot_to)
-                delta = self._energy() - e_init
+                delta = self.delta_move(slot_from, kode, slot_to)
 
                 if delta < best_delta:
                     best_delta = delta
@@ -72,9 +90,11 @@ class HillClimbingState(State):
                 ):
                     sideways_candidate = ("move", slot_from, kode, slot_to)
 
-                self._move_into_slot(slot_to, kode, slot_from)
-
+        self.perf.proposed += num_swaps_to_try
+        if len(self.empty_slots) > 0:
+            self.perf.proposed += num_moves_to_try
         if best_move is not None:
+            self.perf.accepted += 1
             if best_move[0] == "swap":
                 _, kelas1, slot1, kelas2, slot2 = best_move
                 self._swap_pair_jadwal(kelas1, slot1, kelas2, slot2)
@@ -83,6 +103,7 @@ class HillClimbingState(State):
                 self._move_into_slot(slot_from, kode, slot_to)
             return IterationResult(delta_energy=best_delta, move_accepted=True)
         if allow_sideways and sideways_candidate is not None:
+            self.perf.accepted += 1
             if sideways_candidate[0] == "swap":
                 _, kelas1, slot1, kelas2, slot2 = sideways_candidate
                 self._swap_pair_jadwal(kelas1, slot1, kelas2, slot2)
@@ -94,92 +115,212 @@ class HillClimbingState(State):
             )
         return IterationResult(delta_energy=0.0, move_accepted=False)
 
+    def _next_batched(self, allow_sideways: bool) -> IterationResult:
+        evaluator = self.evaluator
+        compiled = evaluator.compiled
+        n_kelas = compiled.n_kelas
+
+        num_swaps_to_try = min(n_kelas**2, self.neighborhood_size)
+        swap1 = self._random_pertemuan(num_swaps_to_try)
+        swap2 = self._random_pertemuan(num_swaps_to_try)
+        mulai = perf_counter()
+        deltas = [evaluator.delta_swaps(swap1, swap2)]
+
+        empty_slots = evaluator.empty_slots()
+        move_from = move_to = np.empty(0, dtype=np.int64)
+        if len(empty_slots) > 0:
+            num_moves_to_try = min(n_kelas * len(empty_slots), self.neighborhood_size)
+            move_from = self._random_pertemuan(num_moves_to_try)
+            move_to = empty_slots[
+                self.np_random.integers(len(empty_slots), size=num_moves_to_try)
+            ]
+            deltas.append(evaluator.delta_moves(move_from, move_to))
+        deltas = np.concatenate(deltas)
+        self.perf.evaluation_time += perf_counter() - mulai
+        self.perf.evaluations += len(deltas)
+        self.perf.proposed += len(deltas)
+        if len(deltas) == 0:
+            return IterationResult(delta_energy=0.0, move_accepted=False)
+
+        best = int(np.argmin(deltas))
+        if deltas[best] < 0:
+            chosen = best
+        elif allow_sideways and np.any(deltas == 0):
+            chosen = int(np.flatnonzero(deltas == 0)[0])
+        else:
+            return IterationResult(delta_energy=0.0, move_accepted=False)
+
+        self.perf.accepted += 1
+        if chosen < num_swaps_to_try:
+            pertemuan1, pertemuan2 = int(swap1[chosen]), int(swap2[chosen])
+            kelas1, slot1 = self._slot_pertemuan(pertemuan1)
+            kelas2, slot2 = self._slot_pertemuan(pertemuan2)
+            self._swap_pair_jadwal(kelas1, slot1, kelas2, slot2)
+        else:
+            chosen_move = chosen - num_swaps_to_try
+            kode, slot_from = self._slot_pertemuan(int(move_from[chosen_move]))
+            self._move_into_slot(slot_from, kode, int(move_to[chosen_move]))
+
+        delta = float(deltas[chosen])
+        if delta < 0:
+            return IterationResult(delta_energy=delta, move_accepted=True)
+        return IterationResult(delta_energy=0.0, move_accepted=True, sideways_move=True)
+
+    def _random_pertemuan(self, n: int) -> np.ndarray:
+        # Kelas dipilih seragam, lalu salah satu pertemuannya, seperti _random_pair_jadwal
+        compiled = self.evaluator.compiled
+        kelas = self.np_random.integers(compiled.n_kelas, size=n)
+        urutan = (self.np_random.random(n) * compiled.sks[kelas]).astype(np.int64)
+        return compiled.offset_kelas[kelas] + urutan
+
+    def _slot_pertemuan(self, pertemuan: int) -> tuple[str, int]:
+        compiled = self.evaluator.compiled
+        ruang, waktu = self.evaluator.jadwal[pertemuan]
+        kode = compiled.kode_kelas[compiled.kelas_pertemuan[pertemuan]]
+        return kode, compiled.slot(ruang, waktu)
+
     def seed_jadwal(self):
         super().seed_jadwal()
-        self.slot_assignment = {}
-        self.empty_slots = set()
-        for kode_kelas, slot_assignment in self.jadwal.slot_kuliah.items():
-            for slot in slot_assignment:
-                if slot not in self.slot_assignment:
-                    self.slot_assignment[slot] = []
-                self.slot_assignment[slot].append(kode_kelas)
-        for ruangan in self.problem.list_ruangan:
-            for hari, waktu_mulai in LIST_WAKTU_MULAI:
-                slot = Slot(ruangan.kode, hari, waktu_mulai, waktu_mulai + 1)
-                if slot not in self.slot_assignment:
-                    self.empty_slots.add(slot)
-
-    def _energy(self) -> float:
-        return self.objective()
+        self.init_slot_assignment()
+        self.init_delta()
 
-    def _swap_pair_jadwal(self, kelas1: str, slot1: Slot, kelas2: str, slot2: Slot):
-        slot_kuliah_1 = self.jadwal.slot_kuliah[kelas1]
-        slot_kuliah_2 = self.jadwal.slot_kuliah[kelas2]
-        slot_kuliah_1[slot_kuliah_1.index(slot1)] = slot2
-        slot_kuliah_2[slot_kuliah_2.index(slot2)] = slot1
+        if self.batched:
+            compiled = compile_problem(self.problem)
+            self.evaluator = NeighborhoodEvaluator(
+                compiled, compiled.compile_jadwal(self.jadwal)
+            )
+            self.np_random = np.random.default_rng(self.random.getrandbits(64))
 
-        slot_assignment1 = self.slot_assignment[slot1]
-        slot_assignment2 = self.slot_assignment[slot2]
-        slot_assignment1[slot_assignment1.index(kelas1)] = kelas2
-        slot_assignment2[slot_assignment2.index(kelas2)] = kelas1
+    def _energy(self) -> float:
+        return self.current_objective
+
+    def _swap_pair_jadwal(self, kelas1: str, slot1: int, kelas2: str, slot2: int):
+        mulai = perf_counter()
+        if self.evaluator is not None and kelas1 != kelas2 and slot1 != slot2:
+            compiled = self.evaluator.compiled
+            index1 = compiled.index_kelas[kelas1]
+            index2 = compiled.index_kelas[kelas2]
+            self.evaluator.apply_swap(
+                self.evaluator.find_pertemuan(index1, slot1),
+                self.evaluator.find_pertemuan(index2, slot2),
+            )
+        self.apply_swap(kelas1, slot1, kelas2, slot2)
+        self._pindah_pertemuan(kelas1, slot1, slot2)
+        self._pindah_pertemuan(kelas2, slot2, slot1)
+        self.perf.move_time += perf_counter() - mulai
 
-    def _random_pair_jadwal(self) -> tuple[str, Slot, str, Slot]:
+    def _random_pair_jadwal(self) -> tuple[str, int, str, int]:
         kelas1 = self.random.choice(self.problem.list_kelas).kode
         kelas2 = self.random.choice(self.problem.list_kelas).kode
         slot1 = self.random.choice(self.jadwal.slot_kuliah[kelas1])
         slot2 = self.random.choice(self.jadwal.slot_kuliah[kelas2])
         return (kelas1, slot1, kelas2, slot2)
 
-    def _random_move_to_empty_slot(self) -> tuple[Slot, str, Slot]:
+    def _random_move_to_empty_slot(self) -> tuple[int, str, int]:
         kelas = self.random.choice(self.problem.list_kelas).kode
         slot_from = self.random.choice(self.jadwal.slot_kuliah[kelas])
-        slot_to = self.random.choice(tuple(self.empty_slots))
+        slot_to = self.empty_slots.choice(self.random)
         return (slot_from, kelas, slot_to)
 
-    def _move_into_slot(self, slot_from: Slot, kode: str, slot_to: Slot):
-        slot_kuliah = self.jadwal.slot_kuliah[kode]
-        slot_kuliah[slot_kuliah.index(slot_from)] = slot_to
-
-        self.slot_assignment[slot_from].remove(kode)
-        if len(self.slot_assignment[slot_from]) == 0:
-            self.slot_assignment.pop(slot_from)
-            self.empty_slots.add(slot_from)
-
-        if slot_to in self.slot_assignment:
-            self.slot_assignment[slot_to].append(kode)
-        else:
-            self.slot_assignment[slot_to] = [kode]
-            self.empty_slots.discard(slot_to)
+    def _move_into_slot(self, slot_from: int, kode: str, slot_to: int):
+        mulai = perf_counter()
+        if self.evaluator is not None and slot_from != slot_to:
+            compiled = self.evaluator.compiled
+            self.evaluator.apply_move(
+                self.evaluator.find_pertemuan(compiled.index_kelas[kode], slot_from),
+                slot_to,
+            )
+        self.apply_move(slot_from, kode, slot_to)
+        self._pindah_pertemuan(kode, slot_from, slot_to)
+        self.perf.move_time += perf_counter() - mulai
 
 
 class StochasticHillClimbingState(HillClimbingState):
     def next(self) -> IterationResult:
-        e_init = self._energy()
         max_attempts = max(1, min(50, len(self.problem.list_kelas) * 4))
 
         for _ in range(max_attempts):
+            self.perf.proposed += 1
             if len(self.empty_slots) == 0 or self.random.random() < 0.5:
                 kelas1, slot1, kelas2, slot2 = self._random_pair_jadwal()
-                self._swap_pair_jadwal(kelas1, slot1, kelas2, slot2)
-                delta = self._energy() - e_init
+                delta = self.delta_swap(kelas1, slot1, kelas2, slot2)
                 if delta < 0:
+                    self.perf.accepted += 1
+                    self._swap_pair_jadwal(kelas1, slot1, kelas2, slot2)
                     return IterationResult(delta_energy=delta, move_accepted=True)
-                self._swap_pair_jadwal(kelas1, slot2, kelas2, slot1)
             else:
                 slot_from, kode, slot_to = self._random_move_to_empty_slot()
-                self._move_into_slot(slot_from, kode, slot_to)
-                delta = self._energy() - e_init
+                delta = self.delta_move(slot_from, kode, slot_to)
                 if delta < 0:
+                    self.perf.accepted += 1
+                    self._move_into_slot(slot_from, kode, slot_to)
                     return IterationResult(delta_energy=delta, move_accepted=True)
-                self._move_into_slot(slot_to, kode, slot_from)
 
         return IterationResult(delta_energy=0.0, move_accepted=False)
 
 
+class ExactHillClimbingState(HillClimbingState):
+    # Steepest ascent atas seluruh tetangga swap dan move, bukan sampel acak
+    def __init__(
+        self,
+        problem: Problem,
+        jadwal=JadwalKuliah({}),
+        randomizer: random.Random = random.Random(int(time.time() * 1000)),
+    ):
+        super().__init__(problem, jadwal, randomizer)
+        self.queue: Optional[MoveDeltaQueue] = None
+
+    def next(self) -> IterationResult:
+        best = self.queue.best()
+        if best is None:
+            return IterationResult(delta_energy=0.0, move_accepted=False)
+
+        delta, kind, pertemuan, target = best
+        self.perf.proposed += 1
+        self.perf.accepted += 1
+        kode, slot = self._slot_pertemuan(pertemuan)
+        if kind == SWAP:
+            kode_target, slot_target = self._slot_pertemuan(target)
+            self._swap_pair_jadwal(kode, slot, kode_target, slot_target)
+        else:
+            self._move_into_slot(slot, kode, target)
+        # Delta tetangga yang terpengaruh dihitung ulang oleh queue
+        mulai = perf_counter()
+        evaluasi = self.queue.evaluations
+        self.queue.apply(kind, pertemuan, target)
+        self.perf.evaluations += self.queue.evaluations - evaluasi
+        self.perf.evaluation_time += perf_counter() - mulai
+        return IterationResult(delta_energy=delta, move_accepted=True)
+
+    def seed_jadwal(self):
+        super().seed_jadwal()
+        compiled = compile_problem(self.problem)
+        mulai = perf_counter()
+        self.queue = MoveDeltaQueue(
+            NeighborhoodEvaluator(compiled, compiled.compile_jadwal(self.jadwal))
+        )
+        self.perf.evaluations += self.queue.evaluations
+        self.perf.evaluation_time += perf_counter() - mulai
+
+    def _slot_pertemuan(self, pertemuan: int) -> tuple[str, int]:
+        compiled = self.queue.compiled
+        ruang, waktu = self.queue.evaluator.jadwal[pertemuan]
+        kode = compiled.kode_kelas[compiled.kelas_pertemuan[pertemuan]]
+        return kode, compiled.slot(ruang, waktu)
+
+
 class SteepestAscentHillClimbing(Solver):
-    def __init__(self, input: Problem):
-        super().__init__(input)
-        self.state = HillClimbingState(input)
+    def __init__(
+        self,
+        input: Problem,
+        neighborhood_size: int = DEFAULT_NEIGHBORHOOD_SIZE,
+        batched: bool = False,
+        seed: Optional[int] = None,
+        budget: Optional[SearchBudget] = None,
+    ):
+        super().__init__(input, seed, budget)
+        self.state = self._make_state(neighborhood_size, batched)
+        self.state.perf = self.perf
 
         # Statistics - general
         self.search_time = 0
@@ -189,9 +330,19 @@ class SteepestAscentHillClimbing(Solver):
         # Statistics - hill climbing
         self.local_optima_iteration = 0
 
+    def _make_state(self, neighborhood_size: int, batched: bool) -> HillClimbingState:
+        return HillClimbingState(
+            self.input,
+            randomizer=self.random,
+            neighborhood_size=neighborhood_size,
+            batched=batched,
+        )
+
     def search(self):
         # Reset statistics in case solver instance is reused
         self.search_time = 0
+        self.perf.reset()
+        self._start_budget()
         self.iteration = 0
         self.objective_plt = []
         self.local_optima_iteration = 0
@@ -199,8 +350,8 @@ class SteepestAscentHillClimbing(Solver):
         # --- INIT ---
         self.state.seed_jadwal()
         self.jadwal = self.state.jadwal
-        self.jadwal_init = copy.deepcopy(self.jadwal)
-        self.objective_plt.append(self.state.objective())
+        self.jadwal_init = self.perf.copy(self.jadwal)
+        self.objective_plt.append(self.state._energy())
 
         # --- Start ---
         starttime = time.time()
@@ -213,7 +364,9 @@ class SteepestAscentHillClimbing(Solver):
                 break
 
             self.iteration += 1
-            self.objective_plt.append(self.state.objective())
+            self.objective_plt.append(self.state._energy())
+            if self._tick(self.iteration, self.objective_plt[-1]):
+                break
 
         endtime = time.time()
         self.search_time = endtime - starttime
@@ -226,13 +379,21 @@ class SteepestAscentHillClimbing(Solver):
             iteration=self.iteration,
             objective_over_iteration=self.objective_plt,
             local_optima_iteration=self.local_optima_iteration,
+            stop_reason=self.stop_reason,
+            perf=self._perf_model(self.search_time),
         )
 
 
 class StochasticHillClimbing(Solver):
-    def __init__(self, input: Problem):
-        super().__init__(input)
-        self.state = StochasticHillClimbingState(input)
+    def __init__(
+        self,
+        input: Problem,
+        seed: Optional[int] = None,
+        budget: Optional[SearchBudget] = None,
+    ):
+        super().__init__(input, seed, budget)
+        self.state = StochasticHillClimbingState(input, randomizer=self.random)
+        self.state.perf = self.perf
         self.search_time = 0
         self.iteration = 0
         self.objective_plt: list[float] = []
@@ -240,14 +401,16 @@ class StochasticHillClimbing(Solver):
 
     def search(self):
         self.search_time = 0
+        self.perf.reset()
+        self._start_budget()
         self.iteration = 0
         self.objective_plt = []
         self.local_optima_iteration = 0
 
         self.state.seed_jadwal()
         self.jadwal = self.state.jadwal
-        self.jadwal_init = copy.deepcopy(self.jadwal)
-        self.objective_plt.append(self.state.objective())
+        self.jadwal_init = self.perf.copy(self.jadwal)
+        self.objective_plt.append(self.state._energy())
 
         starttime = time.time()
 
@@ -258,7 +421,9 @@ class StochasticHillClimbing(Solver):
                 break
 
             self.iteration += 1
-            self.objective_plt.append(self.state.objective())
+            self.objective_plt.append(self.state._energy())
+            if self._tick(self.iteration, self.objective_plt[-1]):
+                break
 
         endtime = time.time()
         self.search_time = endtime - starttime
@@ -271,16 +436,46 @@ class StochasticHillClimbing(Solver):
             iteration=self.iteration,
             objective_over_iteration=self.objective_plt,
             local_optima_iteration=self.local_optima_iteration,
+            stop_reason=self.stop_reason,
+            perf=self._perf_model(self.search_time),
         )
 
 
+class ExactSteepestAscentHillClimbing(SteepestAscentHillClimbing):
+    def __init__(
+        self,
+        input: Problem,
+        seed: Optional[int] = None,
+        budget: Optional[SearchBudget] = None,
+    ):
+        super().__init__(input, seed=seed, budget=budget)
+
+    def _make_state(self, neighborhood_size: int, batched: bool) -> HillClimbingState:
+        # Seluruh tetangga dievaluasi sehingga neighborhood_size dan batched tidak dipakai
+        return ExactHillClimbingState(self.input, randomizer=self.random)
+
+
 DEFAULT_MAX_SIDEWAYS = 50
 
 
 class SidewaysMoveHillClimbing(Solver):
-    def __init__(self, input: Problem, max_sideways: int = DEFAULT_MAX_SIDEWAYS):
-        super().__init__(input)
-        self.state = HillClimbingState(input)
+    def __init__(
+        self,
+        input: Problem,
+        max_sideways: int = DEFAULT_MAX_SIDEWAYS,
+        neighborhood_size: int = DEFAULT_NEIGHBORHOOD_SIZE,
+        batched: bool = False,
+        seed: Optional[int] = None,
+        budget: Optional[SearchBudget] = None,
+    ):
+        super().__init__(input, seed, budget)
+        self.state = HillClimbingState(
+            input,
+            randomizer=self.random,
+            neighborhood_size=neighborhood_size,
+            batched=batched,
+        )
+        self.state.perf = self.perf
         self.max_sideways = max_sideways
         self.search_time = 0
         self.iteration = 0
@@ -290,6 +485,8 @@ class SidewaysMoveHillClimbing(Solver):
 
     def search(self):
         self.search_time = 0
+        self.perf.reset()
+        self._start_budget()
         self.iteration = 0
         self.objective_plt = []
         self.local_optima_iteration = 0
@@ -297,8 +494,8 @@ class SidewaysMoveHillClimbing(Solver):
 
         self.state.seed_jadwal()
         self.jadwal = self.state.jadwal
-        self.jadwal_init = copy.deepcopy(self.jadwal)
-        self.objective_plt.append(self.state.objective())
+        self.jadwal_init = self.perf.copy(self.jadwal)
+        self.objective_plt.append(self.state._energy())
 
         starttime = time.time()
         sideways_streak = 0
@@ -316,11 +513,13 @@ class SidewaysMoveHillClimbing(Solver):
                 sideways_streak = 0
 
             self.iteration += 1
-            self.objective_plt.append(self.state.objective())
+            self.objective_plt.append(self.state._energy())
 
             if iter_result.sideways_move and sideways_streak >= self.max_sideways:
                 self.local_optima_iteration = self.iteration
                 break
+            if self._tick(self.iteration, self.objective_plt[-1]):
+                break
 
         endtime = time.time()
         self.search_time = endtime - starttime
@@ -335,10 +534,132 @@ class SidewaysMoveHillClimbing(Solver):
             local_optima_iteration=self.local_optima_iteration,
             sideways_moves=self.sideways_moves,
             max_sideways=self.max_sideways,
+            stop_reason=self.stop_reason,
+            perf=self._perf_model(self.search_time),
         )
 
 
 DEFAULT_MAX_RESTART = 10
+DEFAULT_TARGET_OBJECTIVE = 0.0
+
+
+@dataclass
+class RestartResult:
+    objective: float
+    trace: list[float]
+    jadwal_init: JadwalKuliah
+    jadwal: JadwalKuliah
+    iterations: int
+    perf: PerfCounters
+
+
+def climb_restart(
+    problem: Problem,
+    neighborhood_size: int,
+    batched: bool,
+    max_iterations: Optional[int],
+    seed: Optional[int] = None,
+    stop=None,
+    progress: Optional[SolverProgress] = None,
+    iteration_offset: int = 0,
+    clock: Optional[BudgetClock] = None,
+    evaluations=None,
+) -> RestartResult:
+    # Tanpa seed, random.Random(None) di-seed dari os.urandom
+    state = HillClimbingState(
+        problem,
+        randomizer=random.Random(seed),
+        neighborhood_size=neighborhood_size,
+        batched=batched,
+    )
+    if clock is not None:
+        clock = clock.fork(state.perf)
+    state.seed_jadwal()
+    initial_schedule = state.perf.copy(state.jadwal)
+    objective_trace = [state._energy()]
+    iteration_count = 0
+    dilaporkan = 0
+
+    while True:
+        iter_result = state.next()
+        if not iter_result.move_accepted:
+            break
+
+        iteration_count += 1
+        objective_trace.append(state._energy())
+
+        if max_iterations is not None and iteration_count >= max_iterations:
+            break
+        # Restart lain sudah mencapai target
+        if stop is not None and iteration_count % 16 == 0 and stop.is_set():
+            break
+        # Evaluasi dijumlahkan antar worker agar max_evaluations berlaku untuk
+        # seluruh restart, bukan per proses
+        if evaluations is not None and iteration_count % 16 == 0:
+            with evaluations.get_lock():
+                evaluations.value += state.perf.evaluations - dilaporkan
+                dilaporkan = state.perf.evaluations
+                clock.evaluations_used = evaluations.value - dilaporkan
+        # Alasan berhenti dicatat oleh solver setelah restart direkam
+        if clock is not None and clock.exhausted(objective_trace[-1]) is not None:
+            break
+        if progress is not None and progress.tick(
+            iteration_offset + iteration_count, objective_trace[-1]
+        ):
+            break
+
+    if evaluations is not None:
+        with evaluations.get_lock():
+            evaluations.value += state.perf.evaluations - dilaporkan
+
+    return RestartResult(
+        objective=objective_trace[-1],
+        trace=objective_trace,
+        jadwal_init=initial_schedule,
+        jadwal=state.jadwal,
+        iterations=iteration_count,
+        perf=state.perf,
+    )
+
+
+_restart_stop = None
+_restart_evaluations = None
+
+
+def _init_restart_worker(stop, evaluations):
+    global _restart_stop, _restart_evaluations
+    _restart_stop = stop
+    _restart_evaluations = evaluations
+
+
+def _climb_restart_worker(
+    problem: Problem,
+    neighborhood_size: int,
+    batched: bool,
+    max_iterations: Optional[int],
+    seed: int,
+    clock: Optional[BudgetClock] = None,
+) -> Optional[RestartResult]:
+    if _restart_stop.is_set():
+        return None
+    evaluations = None
+    if clock is not None:
+        evaluations = _restart_evaluations
+        clock = BudgetClock(
+            clock.budget, PerfCounters(), clock.deadline, evaluations.value
+        )
+        if clock.exhausted(float("inf")) is not None:
+            return None
+    return climb_restart(
+        problem,
+        neighborhood_size,
+        batched,
+        max_iterations,
+        seed,
+        _restart_stop,
+        clock=clock,
+        evaluations=evaluations,
+    )
 
 
 class RandomRestartHillClimbing(Solver):
@@ -347,83 +668,176 @@ class RandomRestartHillClimbing(Solver):
         input: Problem,
         max_restart: int = DEFAULT_MAX_RESTART,
         max_iterations_per_restart: Optional[int] = None,
+        neighborhood_size: int = DEFAULT_NEIGHBORHOOD_SIZE,
+        batched: bool = False,
+        workers: int = 1,
+        target_objective: float = DEFAULT_TARGET_OBJECTIVE,
+        seed: Optional[int] = None,
+        budget: Optional[SearchBudget] = None,
     ):
-        super().__init__(input)
+        super().__init__(input, seed, budget)
+        # State restart baru dibuat saat search, mungkin di proses lain
+        if neighborhood_size < 1:
+            raise ValueError("Ukuran neighborhood harus lebih dari nol")
+        if workers < 1:
+            raise ValueError("Jumlah worker restart harus lebih dari nol")
         self.max_restart = max_restart
         self.max_iterations_per_restart = max_iterations_per_restart
+        self.neighborhood_size = neighborhood_size
+        self.batched = batched
+        # Restart dibagi ke beberapa proses jika workers > 1
+        self.workers = workers
+        self.target_objective = target_objective
         self.search_time = 0
         self.iteration = 0
         self.objective_plt: list[float] = []
         self.local_optima_iteration = 0
         self.restart_count = 0
         self.iterations_per_restart: list[int] = []
+        self.best_restart: Optional[RestartResult] = None
 
     def search(self):
         self.search_time = 0
+        self.perf.reset()
+        self._start_budget()
         self.iteration = 0
         self.objective_plt = []
         self.local_optima_iteration = 0
         self.restart_count = 0
         self.iterations_per_restart = []
-
-        best_objective = float("inf")
-        best_trace: list[float] = []
-        best_final_schedule: JadwalKuliah | None = None
-        best_initial_schedule: JadwalKuliah | None = None
+        self.best_restart = None
 
         starttime = time.time()
 
-        for _ in range(self.max_restart):
-            state = HillClimbingState(self.input)
-            state.seed_jadwal()
-            initial_schedule = copy.deepcopy(state.jadwal)
-            objective_trace = [state.objective()]
-            iteration_count = 0
-
-            while True:
-                iter_result = state.next()
-                if not iter_result.move_accepted:
+        if self.workers > 1 and self.max_restart > 1:
+            self._search_parallel()
+        else:
+            for _ in range(self.max_restart):
+                self._record_restart(
+                    climb_restart(
+                        self.input,
+                        self.neighborhood_size,
+                        self.batched,
+                        self.max_iterations_per_restart,
+                        seed=self.random.getrandbits(64),
+                        progress=self.progress,
+                        iteration_offset=self.iteration,
+                        clock=self.clock,
+                    )
+                )
+                if self.best_restart.objective <= self.target_objective:
+                    self.stop_reason = STOP_TARGET_OBJECTIVE
                     break
-
-                iteration_count += 1
-                objective_trace.append(state.objective())
-
-                if (
-                    self.max_iterations_per_restart is not None
-                    and iteration_count >= self.max_iterations_per_restart
+                if self._tick(
+                    self.iteration,
+                    self.best_restart.objective,
+                    restart=self.restart_count,
                 ):
                     break
 
-            self.restart_count += 1
-            self.iteration += iteration_count
-            self.iterations_per_restart.append(iteration_count)
-
-            final_objective = objective_trace[-1]
-            if final_objective < best_objective:
-                best_objective = final_objective
-                best_trace = objective_trace[:]
-                best_final_schedule = copy.deepcopy(state.jadwal)
-                best_initial_schedule = initial_schedule
-                self.local_optima_iteration = iteration_count
-
-            if best_objective == 0:
-                break
-
         endtime = time.time()
         self.search_time = endtime - starttime
 
-        if best_final_schedule is None:
-            fallback_state = HillClimbingState(self.input)
+        best = self.best_restart
+        if best is None:
+            fallback_state = HillClimbingState(self.input, randomizer=self.random)
+            fallback_state.perf = self.perf
             fallback_state.seed_jadwal()
-            fallback_init = copy.deepcopy(fallback_state.jadwal)
-            best_initial_schedule = fallback_init
-            best_final_schedule = copy.deepcopy(fallback_state.jadwal)
-            best_trace = [fallback_state.objective()]
+            best = RestartResult(
+                objective=fallback_state._energy(),
+                trace=[fallback_state._energy()],
+                jadwal_init=self.perf.copy(fallback_state.jadwal),
+                jadwal=fallback_state.jadwal,
+                iterations=0,
+                perf=self.perf,
+            )
             self.local_optima_iteration = 0
 
-        self.jadwal_init = copy.deepcopy(best_initial_schedule)
-        self.jadwal = copy.deepcopy(best_final_schedule)
-        self.objective_plt = best_trace[:]
+        self.jadwal_init = self.perf.copy(best.jadwal_init)
+        self.jadwal = self.perf.copy(best.jadwal)
+        self.objective_plt = best.trace[:]
+
+    def _search_parallel(self):
+        context = multiprocessing.get_context("spawn")
+        stop = context.Event()
+        evaluations = context.Value("q", 0)
+        seeds = [self.random.getrandbits(64) for _ in range(self.max_restart)]
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, self.max_restart),
+            mp_context=context,
+            initializer=_init_restart_worker,
+            initargs=(stop, evaluations),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _climb_restart_worker,
+                    self.input,
+                    self.neighborhood_size,
+                    self.batched,
+                    self.max_iterations_per_restart,
+                    seed,
+                    self.clock,
+                )
+                for seed in seeds
+            ]
+            # Hasil setiap restart diproses segera setelah selesai. Selama menunggu,
+            # pembatalan job diperiksa per interval progres lalu diteruskan ke worker
+            # lewat event stop karena worker tidak memegang hook progres
+            interval = None if self.progress is None else self.progress.interval
+            belum_selesai = set(futures)
+            while belum_selesai:
+                selesai, belum_selesai = wait(
+                    belum_selesai, timeout=interval, return_when=FIRST_COMPLETED
+                )
+                if (
+                    not stop.is_set()
+                    and self.progress is not None
+                    and self.progress.stop_requested()
+                ):
+                    self.stop_reason = STOP_CANCELLED
+                    stop.set()
+                    for pending in futures:
+                        pending.cancel()
+                for future in selesai:
+                    if future.cancelled():
+                        continue
+                    result = future.result()
+                    if result is not None:
+                        self._record_restart(result)
+                    if self.clock is not None:
+                        # Evaluasi semua worker, termasuk restart yang masih berjalan
+                        self.clock.evaluations_used = (
+                            evaluations.value - self.perf.evaluations
+                        )
+                    if stop.is_set():
+                        continue
+                    if result is None:
+                        # Restart dilewati worker karena anggaran sudah habis
+                        self.stop_reason = self.clock.exhausted(float("inf"))
+                        dihentikan = self.stop_reason is not None
+                    else:
+                        dihentikan = self._tick(
+                            self.iteration,
+                            self.best_restart.objective,
+                            restart=self.restart_count,
+                        )
+                        if self.best_restart.objective <= self.target_objective:
+                            self.stop_reason = STOP_TARGET_OBJECTIVE
+                            dihentikan = True
+                    if dihentikan:
+                        stop.set()
+                        for pending in futures:
+                            pending.cancel()
+
+    def _record_restart(self, result: RestartResult):
+        self.restart_count += 1
+        self.iteration += result.iterations
+        self.perf.merge(result.perf)
+        self.iterations_per_restart.append(result.iterations)
+
+        if self.best_restart is None or result.objective < self.best_restart.objective:
+            self.best_restart = result
+            self.local_optima_iteration = result.iterations
 
     def get_result(self) -> HillClimbingResultsModel:
         return HillClimbingResultsModel(
@@ -435,4 +849,6 @@ class RandomRestartHillClimbing(Solver):
             local_optima_iteration=self.local_optima_iteration,
             restart_count=self.restart_count,
             iterations_per_restart=self.iterations_per_restart,
+            stop_reason=self.stop_reason,
+            perf=self._perf_model(self.search_time),
         )
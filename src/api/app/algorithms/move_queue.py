@@ -0,0 +1,353 @@
+import heapq
+import numpy as np
+from .compiled import NeighborhoodEvaluator
+from .state import N_WAKTU
+
+SWAP = 0
+MOVE = 1
+
+
+def _f(jumlah: np.ndarray) -> np.ndarray:
+    return np.where(jumlah > 1, jumlah, 0)
+
+
+def _g(jumlah: np.ndarray, bobot: np.ndarray) -> np.ndarray:
+    return np.where(jumlah > 1, bobot, 0.0)
+
+
+class MoveDeltaQueue:
+    # Menyimpan delta seluruh tetangga swap dan move. Setiap pertemuan p memiliki
+    # satu baris berisi swap (p, q) untuk semua q dan move (p, slot kosong), dan
+    # hanya kandidat terbaik per baris yang masuk priority queue. Setelah sebuah
+    # langkah diterapkan, hanya entri yang bergantung pada kelas, jam, dan slot
+    # yang tersentuh yang dihitung ulang; baris yang kandidat terbaiknya memburuk
+    # dicari ulang dari delta yang tersimpan.
+    def __init__(self, evaluator: NeighborhoodEvaluator, chunk_elements: int = 1 << 18):
+        self.evaluator = evaluator
+        self.compiled = c = evaluator.compiled
+        # Batas banyak delta per blok saat satu blok baris dihitung sekaligus
+        self.chunk_elements = chunk_elements
+        self.edges = c.conflict_edges()
+        self.edge_key = (
+            np.repeat(np.arange(c.n_kelas), np.diff(self.edges.tetangga_ptr))
+            * c.n_kelas
+            + self.edges.tetangga_idx
+        )
+
+        self.slot = evaluator.slot_pertemuan()
+        self.jam = self.slot % N_WAKTU
+        self.ruang = self.slot // N_WAKTU
+
+        # Delta tabrakan mahasiswa saat satu pertemuan kelas dilepas dari atau
+        # ditambahkan ke suatu jam, tanpa memperhitungkan kelas lain yang ikut
+        # berpindah
+        self.lepas = np.zeros((c.n_kelas, N_WAKTU))
+        self.tambah = np.zeros((c.n_kelas, N_WAKTU))
+        self._update_kelas_jam(np.arange(c.n_kelas), np.arange(N_WAKTU))
+
+        over_capacity = c.jumlah_mahasiswa[:, None] - c.kuota_ruangan[None, :]
+        self.penalti_kuota = np.maximum(over_capacity, 0)
+
+        n = c.n_pertemuan
+        # Delta swap (p, q) dan move (p, slot); move ke slot terisi bernilai inf
+        self.swap = np.empty((n, n))
+        self.move = np.full((n, c.n_ruangan * N_WAKTU), np.inf)
+        self.best_delta = np.full(n, np.inf)
+        self.best_kind = np.full(n, -1, dtype=np.int64)
+        self.best_target = np.full(n, -1, dtype=np.int64)
+        self.versi = np.zeros(n, dtype=np.int64)
+        self.heap: list[tuple[float, int, int]] = []
+        self.recompute: set[int] = set()
+        # Banyak delta tetangga yang telah dihitung
+        self.evaluations = 0
+        semua = np.arange(n)
+        self._full_rows(semua)
+        self._argmin_rows(semua)
+
+    def best(self):
+        # (delta, jenis langkah, pertemuan, target) dari kandidat terbaik, atau None
+        # jika tidak ada langkah yang memperbaiki
+        while self.heap:
+            delta, versi, p = self.heap[0]
+            if versi == self.versi[p]:
+                return delta, int(self.best_kind[p]), p, int(self.best_target[p])
+            heapq.heappop(self.heap)
+        return None
+
+    def apply(self, kind: int, p: int, target: int):
+        ev = self.evaluator
+        if kind == SWAP:
+            q = target
+            touched = [int(self.slot[p]), int(self.slot[q])]
+            kelas = [p, q]
+            ev.apply_swap(p, q)
+        else:
+            touched = [int(self.slot[p]), target]
+            kelas = [p]
+            ev.apply_move(p, target)
+        self.slot = ev.slot_pertemuan()
+        self.jam = self.slot % N_WAKTU
+        self.ruang = self.slot // N_WAKTU
+
+        c = self.compiled
+        slot_s = np.unique(touched)
+        jam_h = np.unique(slot_s % N_WAKTU)
+        kelas_k = np.unique(c.kelas_pertemuan[kelas])
+        e = self.edges
+        kelas_n = np.unique(
+            np.concatenate(
+                [kelas_k]
+                + [
+                    e.tetangga_idx[e.tetangga_ptr[k] : e.tetangga_ptr[k + 1]]
+                    for k in kelas_k
+                ]
+            )
+        )
+        self._update_kelas_jam(kelas_n, jam_h)
+
+        in_n = np.isin(c.kelas_pertemuan, kelas_n)
+        in_h = np.isin(self.jam, jam_h)
+        in_s = np.isin(self.slot, slot_s)
+        in_a = (in_n & in_h) | in_s
+        rows_a = np.flatnonzero(in_a)
+        rows_n = np.flatnonzero(in_n & ~in_a)
+        rows_h = np.flatnonzero(in_h & ~in_a)
+        rest = np.flatnonzero(~in_a)
+        self.recompute = set(rows_a.tolist())
+
+        # Baris yang tersentuh langsung dihitung penuh, dan kolomnya (swap simetris)
+        # disalin ke baris lain
+        self._full_rows(rows_a)
+        self._update_entries(rest, SWAP, rows_a, self.swap[np.ix_(rest, rows_a)])
+
+        # Swap antara kelas tetangga dan pertemuan pada jam yang tersentuh
+        deltas = self._swap_deltas(
+            np.repeat(rows_n, len(rows_h)), np.tile(rows_h, len(rows_n))
+        ).reshape(len(rows_n), len(rows_h))
+        self._update_entries(rows_n, SWAP, rows_h, deltas)
+        self._update_entries(rows_h, SWAP, rows_n, deltas.T)
+
+        # Move ke slot yang berubah status kosongnya dan ke jam yang tersentuh
+        kosong = ev.jumlah_slot == 0
+        terisi = slot_s[~kosong[slot_s]]
+        self._update_entries(
+            rest, MOVE, terisi, np.full((len(rest), len(terisi)), np.inf)
+        )
+        rows_lain = np.flatnonzero(~in_a & ~in_n)
+        dikosongkan = slot_s[kosong[slot_s]]
+        deltas = self._move_deltas(
+            np.repeat(rows_lain, len(dikosongkan)), np.tile(dikosongkan, len(rows_lain))
+        ).reshape(len(rows_lain), len(dikosongkan))
+        self._update_entries(rows_lain, MOVE, dikosongkan, deltas)
+        empty_h = np.flatnonzero(kosong)
+        empty_h = empty_h[np.isin(empty_h % N_WAKTU, jam_h)]
+        deltas = self._move_deltas(
+            np.repeat(rows_n, len(empty_h)), np.tile(empty_h, len(rows_n))
+        ).reshape(len(rows_n), len(empty_h))
+        self._update_entries(rows_n, MOVE, empty_h, deltas)
+
+        self._argmin_rows(np.fromiter(self.recompute, dtype=np.int64))
+
+        if len(self.heap) > 4 * len(self.versi):
+            self.heap = [
+                (float(self.best_delta[r]), int(self.versi[r]), int(r))
+                for r in np.flatnonzero(self.best_delta < 0)
+            ]
+            heapq.heapify(self.heap)
+
+    def _row_chunks(self, rows: np.ndarray):
+        per_chunk = max(1, self.chunk_elements // max(1, self.compiled.n_pertemuan))
+        for mulai in range(0, len(rows), per_chunk):
+            yield rows[mulai : mulai + per_chunk]
+
+    def _full_rows(self, rows: np.ndarray):
+        # Menghitung ulang seluruh delta swap dan move pada baris rows beserta
+        # kolom swap-nya
+        n = self.compiled.n_pertemuan
+        empty_slots = self.evaluator.empty_slots()
+        for blok in self._row_chunks(rows):
+            swap_deltas = self._swap_deltas(
+                np.repeat(blok, n), np.tile(np.arange(n), len(blok))
+            ).reshape(len(blok), n)
+            self.swap[blok] = swap_deltas
+            self.swap[:, blok] = swap_deltas.T
+            move_deltas = self._move_deltas(
+                np.repeat(blok, len(empty_slots)), np.tile(empty_slots, len(blok))
+            )
+            self.move[blok] = np.inf
+            self.move[np.ix_(blok, empty_slots)] = move_deltas.reshape(
+                len(blok), len(empty_slots)
+            )
+
+    def _argmin_rows(self, rows: np.ndarray):
+        # Kandidat terbaik dicari dari delta yang tersimpan, tanpa evaluasi baru
+        for blok in self._row_chunks(rows):
+            swap = self.swap[blok]
+            move = self.move[blok]
+            i = np.argmin(swap, axis=1)
+            j = np.argmin(move, axis=1)
+            swap_best = swap[np.arange(len(blok)), i]
+            move_best = move[np.arange(len(blok)), j]
+            pakai_move = move_best < swap_best
+            kinds = np.where(pakai_move, MOVE, SWAP)
+            targets = np.where(pakai_move, j, i)
+            deltas = np.minimum(swap_best, move_best)
+            for r, kind, target, delta in zip(blok, kinds, targets, deltas):
+                self._set_best(int(r), int(kind), int(target), delta)
+
+    def _set_best(self, p: int, kind: int, target: int, delta: float):
+        self.best_kind[p] = kind
+        self.best_target[p] = target
+        self.best_delta[p] = delta
+        self.versi[p] += 1
+        if delta < 0:
+            heapq.heappush(self.heap, (float(delta), int(self.versi[p]), int(p)))
+
+    def _update_entries(
+        self, rows: np.ndarray, kind: int, targets: np.ndarray, deltas: np.ndarray
+    ):
+        # Entri (rows[i], targets[j]) berubah menjadi deltas[i, j]. Jika entri terbaik
+        # sebuah baris memburuk, baris itu dicari ulang dari delta yang tersimpan;
+        # selain itu cukup dibandingkan dengan entri terbaik yang baru.
+        if len(rows) == 0 or len(targets) == 0:
+            return
+        cache = self.swap if kind == SWAP else self.move
+        cache[np.ix_(rows, targets)] = deltas
+        same = self.best_kind[rows] == kind
+        sekarang = cache[rows[same], self.best_target[rows[same]]]
+        worse = rows[same][sekarang > self.best_delta[rows[same]]]
+        self.recompute.update(worse.tolist())
+
+        i = np.argmin(deltas, axis=1)
+        terbaik = deltas[np.arange(len(rows)), i]
+        better = terbaik < self.best_delta[rows]
+        for r, target, delta in zip(rows[better], targets[i[better]], terbaik[better]):
+            self._set_best(int(r), kind, int(target), delta)
+
+    def _swap_deltas(self, ps: np.ndarray, qs: np.ndarray) -> np.ndarray:
+        c = self.compiled
+        ev = self.evaluator
+        self.evaluations += len(ps)
+        kelas1, kelas2 = c.kelas_pertemuan[ps], c.kelas_pertemuan[qs]
+        jam_a, jam_b = self.jam[ps], self.jam[qs]
+        slot_a, slot_b = self.slot[ps], self.slot[qs]
+        ruang_a, ruang_b = self.ruang[ps], self.ruang[qs]
+
+        res = (
+            self.lepas[kelas1, jam_a]
+            + self.tambah[kelas1, jam_b]
+            + self.lepas[kelas2, jam_b]
+            + self.tambah[kelas2, jam_a]
+            + self._koreksi_bersama(kelas1, kelas2, jam_a, jam_b)
+        )
+        res[jam_b == jam_a] = 0.0
+
+        bobot1 = c.bobot_pertemuan[ps]
+        bobot2 = c.bobot_pertemuan[qs]
+        jumlah_a, jumlah_b = ev.jumlah_slot[slot_a], ev.jumlah_slot[slot_b]
+        bobot_a, bobot_b = ev.bobot_slot[slot_a], ev.bobot_slot[slot_b]
+        res += (
+            _g(jumlah_a, bobot_a - bobot1 + bobot2)
+            - _g(jumlah_a, bobot_a)
+            + _g(jumlah_b, bobot_b - bobot2 + bobot1)
+            - _g(jumlah_b, bobot_b)
+        )
+        res += (
+            self.penalti_kuota[kelas1, ruang_b]
+            - self.penalti_kuota[kelas1, ruang_a]
+            + self.penalti_kuota[kelas2, ruang_a]
+            - self.penalti_kuota[kelas2, ruang_b]
+        )
+        res[(kelas2 == kelas1) | (slot_b == slot_a)] = np.inf
+        return res
+
+    def _koreksi_bersama(
+        self,
+        kelas1: np.ndarray,
+        kelas2: np.ndarray,
+        jam_a: np.ndarray,
+        jam_b: np.ndarray,
+    ) -> np.ndarray:
+        # Untuk mahasiswa yang mengambil kelas1 dan kelas2 sekaligus, delta swap
+        # bukan jumlah delta kedua perpindahan. Selisihnya dihitung di sini.
+        e = self.edges
+        res = np.zeros(len(kelas1))
+        if len(self.edge_key) == 0:
+            return res
+        key = kelas1 * self.compiled.n_kelas + kelas2
+        edge = np.minimum(np.searchsorted(self.edge_key, key), len(self.edge_key) - 1)
+        pair = np.flatnonzero((self.edge_key[edge] == key) & (jam_a != jam_b))
+        if len(pair) == 0:
+            return res
+
+        edge = edge[pair]
+        awal = e.bersama_ptr[edge]
+        panjang = e.bersama_ptr[edge + 1] - awal
+        pair = np.repeat(pair, panjang)
+        entry = (
+            np.arange(panjang.sum())
+            - np.repeat(np.cumsum(panjang) - panjang, panjang)
+            + np.repeat(awal, panjang)
+        )
+
+        mhs = e.bersama_mhs[entry]
+        jumlah1 = e.bersama_jumlah1[entry]
+        jumlah2 = e.bersama_jumlah2[entry]
+        jam = self.evaluator.jam_mahasiswa
+        lama_a = jam[mhs, jam_a[pair]]
+        lama_b = jam[mhs, jam_b[pair]]
+        sebenarnya = (
+            _f(lama_a - jumlah1 + jumlah2)
+            - _f(lama_a)
+            + _f(lama_b + jumlah1 - jumlah2)
+            - _f(lama_b)
+        )
+        terpisah = (
+            _f(lama_a - jumlah1)
+            - _f(lama_a)
+            + _f(lama_b + jumlah1)
+            - _f(lama_b)
+            + _f(lama_b - jumlah2)
+            - _f(lama_b)
+            + _f(lama_a + jumlah2)
+            - _f(lama_a)
+        )
+        res += np.bincount(pair, weights=sebenarnya - terpisah, minlength=len(res))
+        return res
+
+    def _move_deltas(self, ps: np.ndarray, slot_to: np.ndarray) -> np.ndarray:
+        c = self.compiled
+        ev = self.evaluator
+        self.evaluations += len(ps)
+        kelas = c.kelas_pertemuan[ps]
+        jam_a, jam_b = self.jam[ps], slot_to % N_WAKTU
+        slot_a = self.slot[ps]
+
+        res = np.where(
+            jam_a != jam_b, self.lepas[kelas, jam_a] + self.tambah[kelas, jam_b], 0.0
+        )
+        bobot = c.bobot_pertemuan[ps]
+        jumlah_a, jumlah_b = ev.jumlah_slot[slot_a], ev.jumlah_slot[slot_to]
+        bobot_a, bobot_b = ev.bobot_slot[slot_a], ev.bobot_slot[slot_to]
+        res += (
+            _g(jumlah_a - 1, bobot_a - bobot)
+            - _g(jumlah_a, bobot_a)
+            + _g(jumlah_b + 1, bobot_b + bobot)
+            - _g(jumlah_b, bobot_b)
+        )
+        res += (
+            self.penalti_kuota[kelas, slot_to // N_WAKTU]
+            - self.penalti_kuota[kelas, self.ruang[ps]]
+        )
+        return res
+
+    def _update_kelas_jam(self, kelas: np.ndarray, jam: np.ndarray):
+        cand, mhs, jumlah = self.evaluator._entries(kelas)
+        for h in jam:
+            lama = self.evaluator.jam_mahasiswa[mhs, h]
+            self.lepas[kelas, h] = np.bincount(
+                cand, weights=_f(lama - jumlah) - _f(lama), minlength=len(kelas)
+            )
+            self.tambah[kelas, h] = np.bincount(
+                cand, weights=_f(lama + jumlah) - _f(lama), minlength=len(kelas)
+            )
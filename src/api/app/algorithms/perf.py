@@ -0,0 +1,44 @@
+from time import perf_counter
+import copy
+from ..schemas import PerfModel
+
+
+class PerfCounters:
+    # Penghitung kinerja satu run, dibagi antara solver dan state-nya.
+    # Waktu dalam detik
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.evaluations = 0
+        self.proposed = 0
+        self.accepted = 0
+        self.evaluation_time = 0.0
+        self.move_time = 0.0
+        self.copy_time = 0.0
+        self.serialization_time = 0.0
+
+    def merge(self, other: "PerfCounters"):
+        # Menggabungkan counter dari restart, replika, atau pulau di proses lain
+        for name, value in vars(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def copy(self, obj):
+        mulai = perf_counter()
+        res = copy.deepcopy(obj)
+        self.copy_time += perf_counter() - mulai
+        return res
+
+    def to_model(self, search_time: float) -> PerfModel:
+        return PerfModel(
+            evaluations=self.evaluations,
+            neighbors_proposed=self.proposed,
+            neighbors_accepted=self.accepted,
+            evaluation_time=self.evaluation_time,
+            move_time=self.move_time,
+            copy_time=self.copy_time,
+            serialization_time=self.serialization_time,
+            evaluations_per_sec=self.evaluations / search_time
+            if search_time > 0
+            else 0.0,
+        )
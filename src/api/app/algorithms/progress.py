@@ -0,0 +1,50 @@
+import time
+from typing import Any
+
+DEFAULT_PROGRESS_INTERVAL = 0.5
+
+
+class SolverProgress:
+    # Hook progres yang dipanggil setiap iterasi dari loop utama solver.
+    # Publikasi dan pengecekan pembatalan dibatasi per interval detik karena
+    # implementasinya bisa mahal (mis. lewat proses lain)
+    def __init__(self, interval: float = DEFAULT_PROGRESS_INTERVAL):
+        self.interval = interval
+        self.iteration = 0
+        self.objective = float("inf")
+        self.best_objective = float("inf")
+        self.info: dict[str, Any] = {}
+        self._last_publish = 0.0
+        self._stop = False
+
+    def tick(self, iteration: int, objective: float, **info) -> bool:
+        self.iteration = iteration
+        self.objective = objective
+        self.info = info
+        if objective < self.best_objective:
+            self.best_objective = objective
+
+        now = time.monotonic()
+        if now - self._last_publish >= self.interval:
+            self._last_publish = now
+            self.publish()
+            self._stop = self.stop_requested()
+        return self._stop
+
+    def flush(self):
+        if self.best_objective != float("inf"):
+            self.publish()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "iteration": self.iteration,
+            "objective": self.objective,
+            "best_objective": self.best_objective,
+            **self.info,
+        }
+
+    def publish(self):
+        pass
+
+    def stop_requested(self) -> bool:
+        return False
@@ -1,11 +1,15 @@
 from dataclasses import dataclass
-from .state import Problem, State, JadwalKuliah, Slot, LIST_WAKTU_MULAI
+from typing import Optional
+from .state import Problem, State, JadwalKuliah
 from .solver import Solver
+from .budget import SearchBudget
+from .stagnation import StagnationCriteria, StagnationDetector
 from ..schemas import SimulatedAnnealingResultsModel
+from time import perf_counter
 import random
 import math
 import time
-import copy
+import multiprocessing
 
 DEFAULT_INITIAL_TEMP = 100000
 DEFAULT_DECAY_RATE = 0.995
@@ -26,51 +30,35 @@ class SimulatedAnnealingState(State):
     ):
         super().__init__(problem, jadwal, randomizer)
 
-        self.slot_assignment: dict[Slot, list[str]] = dict()
-        self.empty_slots: set[Slot] = set()
-
     def next(self, temperature: float) -> IterationResult:
-        e_init = self._energy()
-
-        e_neighbor = None
+        self.perf.proposed += 1
+        delta = None
         move_accepted = None
         move_type = self.random.random()
         if move_type > 0.5 or len(self.empty_slots) == 0:
             kelas1, slot1, kelas2, slot2 = self._random_pair_jadwal()
-            self._swap_pair_jadwal(kelas1, slot1, kelas2, slot2)
-            e_neighbor = self._energy()
-            move_accepted = self._accept_move(e_neighbor - e_init, temperature)
-            if not move_accepted:
-                self._swap_pair_jadwal(kelas1, slot2, kelas2, slot1)
+            delta = self.delta_swap(kelas1, slot1, kelas2, slot2)
+            move_accepted = self._accept_move(delta, temperature)
+            if move_accepted:
+                self._swap_pair_jadwal(kelas1, slot1, kelas2, slot2)
         else:
             slot_from, kode, slot_to = self._random_move_to_empty_slot()
-            self._move_into_slot(slot_from, kode, slot_to)
-            e_neighbor = self._energy()
-            move_accepted = self._accept_move(e_neighbor - e_init, temperature)
-            if not move_accepted:
-                self._move_into_slot(slot_to, kode, slot_from)
-
-        return IterationResult(
-            delta_energy=e_neighbor - e_init, move_accepted=move_accepted
-        )
+            delta = self.delta_move(slot_from, kode, slot_to)
+            move_accepted = self._accept_move(delta, temperature)
+            if move_accepted:
+                self._move_into_slot(slot_from, kode, slot_to)
+
+        if move_accepted:
+            self.perf.accepted += 1
+        return IterationResult(delta_energy=delta, move_accepted=move_accepted)
 
     def seed_jadwal(self):
         super().seed_jadwal()
-        self.slot_assignment = {}
-        self.empty_slots = set()
-        for kode_kelas, slot_assignment in self.jadwal.slot_kuliah.items():
-            for slot in slot_assignment:
-                if slot not in self.slot_assignment:
-                    self.slot_assignment[slot] = []
-                self.slot_assignment[slot].append(kode_kelas)
-        for ruangan in self.problem.list_ruangan:
-            for hari, waktu_mulai in LIST_WAKTU_MULAI:
-                slot = Slot(ruangan.kode, hari, waktu_mulai, waktu_mulai + 1)
-                if slot not in self.slot_assignment:
-                    self.empty_slots.add(slot)
+        self.init_slot_assignment()
+        self.init_delta()
 
     def _energy(self) -> float:
-        return self.objective()
+        return self.current_objective
 
     def _accept_move(self, delta_energy: float, temp: float) -> bool:
         if delta_energy < 0:
@@ -79,44 +67,31 @@ class SimulatedAnnealingState(State):
             return True
         return False
 
-    def _swap_pair_jadwal(self, kelas1: str, slot1: Slot, kelas2: str, slot2: Slot):
-        slot_kuliah_1 = self.jadwal.slot_kuliah[kelas1]
-        slot_kuliah_2 = self.jadwal.slot_kuliah[kelas2]
-        slot_kuliah_1[slot_kuliah_1.index(slot1)] = slot2
-        slot_kuliah_2[slot_kuliah_2.index(slot2)] = slot1
-
-        slot_assignment1 = self.slot_assignment[slot1]
-        slot_assignment2 = self.slot_assignment[slot2]
-        slot_assignment1[slot_assignment1.index(kelas1)] = kelas2
-        slot_assignment2[slot_assignment2.index(kelas2)] = kelas1
+    def _swap_pair_jadwal(self, kelas1: str, slot1: int, kelas2: str, slot2: int):
+        mulai = perf_counter()
+        self.apply_swap(kelas1, slot1, kelas2, slot2)
+        self._pindah_pertemuan(kelas1, slot1, slot2)
+        self._pindah_pertemuan(kelas2, slot2, slot1)
+        self.perf.move_time += perf_counter() - mulai
 
-    def _random_pair_jadwal(self) -> tuple[str, Slot, str, Slot]:
+    def _random_pair_jadwal(self) -> tuple[str, int, str, int]:
         kelas1 = self.random.choice(self.problem.list_kelas).kode
         kelas2 = self.random.choice(self.problem.list_kelas).kode
         slot1 = self.random.choice(self.jadwal.slot_kuliah[kelas1])
         slot2 = self.random.choice(self.jadwal.slot_kuliah[kelas2])
         return (kelas1, slot1, kelas2, slot2)
 
-    def _random_move_to_empty_slot(self) -> tuple[Slot, str, Slot]:
+    def _random_move_to_empty_slot(self) -> tuple[int, str, int]:
         kelas = self.random.choice(self.problem.list_kelas).kode
         slot_from = self.random.choice(self.jadwal.slot_kuliah[kelas])
-        slot_to = self.random.choice(tuple(self.empty_slots))
+        slot_to = self.empty_slots.choice(self.random)
         return (slot_from, kelas, slot_to)
 
-    def _move_into_slot(self, slot_from: Slot, kode: str, slot_to: Slot):
-        slot_kuliah = self.jadwal.slot_kuliah[kode]
-        slot_kuliah[slot_kuliah.index(slot_from)] = slot_to
-
-        self.slot_assignment[slot_from].remove(kode)
-        if len(self.slot_assignment[slot_from]) == 0:
-            self.slot_assignment.pop(slot_from)
-            self.empty_slots.add(slot_from)
-
-        if slot_to in self.slot_assignment:
-            self.slot_assignment[slot_to].append(kode)
-        else:
-            self.slot_assignment[slot_to] = [kode]
-            self.empty_slots.discard(slot_to)
+    def _move_into_slot(self, slot_from: int, kode: str, slot_to: int):
+        mulai = perf_counter()
+        self.apply_move(slot_from, kode, slot_to)
+        self._pindah_pertemuan(kode, slot_from, slot_to)
+        self.perf.move_time += perf_counter() - mulai
 
 
 class SimulatedAnnealing(Solver):
@@ -125,9 +100,15 @@ class SimulatedAnnealing(Solver):
         input: Problem,
         initial_temp=DEFAULT_INITIAL_TEMP,
         decay=DEFAULT_DECAY_RATE,
+        seed: Optional[int] = None,
+        budget: Optional[SearchBudget] = None,
+        stagnation: Optional[StagnationCriteria] = None,
     ):
-        super().__init__(input)
-        self.state = SimulatedAnnealingState(input)
+        super().__init__(input, seed, budget)
+        self.stagnation = stagnation or StagnationCriteria()
+        self.stagnation.validate()
+        self.state = SimulatedAnnealingState(input, randomizer=self.random)
+        self.state.perf = self.perf
         self.initial_temp = initial_temp
         self.temp = initial_temp
         self.decay = decay
@@ -145,6 +126,8 @@ class SimulatedAnnealing(Solver):
     def search(self):
         # Reset statistics in case solver instance is reused
         self.search_time = 0
+        self.perf.reset()
+        self._start_budget()
         self.iteration = 0
         self.objective_plt = []
         self.stuck_count = 0
@@ -155,8 +138,17 @@ class SimulatedAnnealing(Solver):
         # --- INIT ---
         self.state.seed_jadwal()
         self.jadwal = self.state.jadwal
-        self.jadwal_init = copy.deepcopy(self.jadwal)
-        self.objective_plt.append(self.state.objective())
+        self.jadwal_init = self.perf.copy(self.jadwal)
+        self.objective_plt.append(self.state._energy())
+
+        # Dengan anggaran atau deteksi stagnasi, pencarian bisa berhenti di suhu tinggi
+        # sehingga jadwal terbaik disimpan seperti pada replika parallel tempering
+        simpan_terbaik = self.clock is not None or self.stagnation.active()
+        best_objective = self.state._energy()
+        best_jadwal = None
+        detector = None
+        if self.stagnation.active():
+            detector = StagnationDetector(self.stagnation)
 
         # --- Start ---
         starttime = time.time()
@@ -164,13 +156,33 @@ class SimulatedAnnealing(Solver):
         while self.temp > 1:
             iter_result: IterationResult = self.state.next(self.temp)
 
-            self.objective_plt.append(self.state.objective())
+            if simpan_terbaik and self.state._energy() < best_objective:
+                best_objective = self.state._energy()
+                mulai = perf_counter()
+                best_jadwal = JadwalKuliah(
+                    {k: list(v) for k, v in self.state.jadwal.slot_kuliah.items()}
+                )
+                self.perf.copy_time += perf_counter() - mulai
+            self.objective_plt.append(self.state._energy())
             self.delta_energy_plt.append(iter_result.delta_energy)
             self.temp_plt.append(self.temp)
             self.temp *= self.decay
             self.iteration += 1
             if not iter_result.move_accepted:
                 self.stuck_count += 1
+            if self._tick(
+                self.iteration, self.objective_plt[-1], temperature=self.temp_plt[-1]
+            ):
+                break
+            if detector is not None and self._stop(
+                detector.update(
+                    self.objective_plt[-1], accepted=iter_result.move_accepted
+                )
+            ):
+                break
+
+        if best_jadwal is not None and best_objective < self.state._energy():
+            self.jadwal = best_jadwal
 
         endtime = time.time()
         self.search_time = endtime - starttime
@@ -185,4 +197,230 @@ class SimulatedAnnealing(Solver):
             local_optima_stuck_count=self.stuck_count,
             delta_energy_over_iteration=self.delta_energy_plt,
             temperature_over_iteration=self.temp_plt,
+            stop_reason=self.stop_reason,
+            perf=self._perf_model(self.search_time),
+        )
+
+
+DEFAULT_REPLICAS = 4
+DEFAULT_MIN_TEMP = 1.0
+DEFAULT_EXCHANGE_INTERVAL = 50
+
+
+def _replica_worker(conn, problem: Problem, seed: int):
+    # Satu rantai SA yang dikendalikan oleh ParallelTemperingSimulatedAnnealing.
+    # Rantai tidak pernah bertukar jadwal, hanya suhunya yang ditukar
+    try:
+        state = SimulatedAnnealingState(problem, randomizer=random.Random(seed))
+        state.seed_jadwal()
+        jadwal_init = state.perf.copy(state.jadwal)
+        best_objective = state._energy()
+        best_jadwal = state.perf.copy(state.jadwal)
+        conn.send(best_objective)
+
+        while True:
+            command = conn.recv()
+            if command[0] == "run":
+                _, temp, iterations = command
+                stuck = 0
+                for _ in range(iterations):
+                    if not state.next(temp).move_accepted:
+                        stuck += 1
+                    if state._energy() < best_objective:
+                        best_objective = state._energy()
+                        mulai = perf_counter()
+                        best_jadwal = JadwalKuliah(
+                            {k: list(v) for k, v in state.jadwal.slot_kuliah.items()}
+                        )
+                        state.perf.copy_time += perf_counter() - mulai
+                conn.send((state._energy(), stuck))
+            elif command[0] == "result":
+                conn.send((best_objective, best_jadwal, jadwal_init, state.perf))
+                return
+    except Exception as e:
+        conn.send(e)
+    finally:
+        conn.close()
+
+
+class ParallelTemperingSimulatedAnnealing(Solver):
+    def __init__(
+        self,
+        input: Problem,
+        initial_temp=DEFAULT_INITIAL_TEMP,
+        decay=DEFAULT_DECAY_RATE,
+        replicas: int = DEFAULT_REPLICAS,
+        min_temp: float = DEFAULT_MIN_TEMP,
+        exchange_interval: int = DEFAULT_EXCHANGE_INTERVAL,
+        seed: Optional[int] = None,
+        budget: Optional[SearchBudget] = None,
+        stagnation: Optional[StagnationCriteria] = None,
+    ):
+        super().__init__(input, seed, budget)
+        self.stagnation = stagnation or StagnationCriteria()
+        self.stagnation.validate()
+        if replicas < 2:
+            raise ValueError("Parallel tempering membutuhkan minimal dua replika")
+        if not 0 < decay < 1:
+            raise ValueError("Decay harus di antara 0 dan 1")
+        if not 0 < min_temp < initial_temp:
+            raise ValueError("Suhu minimum harus di antara 0 dan suhu awal")
+        if exchange_interval < 1:
+            raise ValueError("Interval pertukaran harus lebih dari nol")
+        # Tangga suhu tetap, acceptance rantai terdingin memang selalu rendah
+        if self.stagnation.min_acceptance is not None:
+            raise ValueError(
+                "Parallel tempering tidak mendukung min_acceptance, gunakan patience"
+            )
+        self.initial_temp = initial_temp
+        self.decay = decay
+        self.replicas = replicas
+        self.min_temp = min_temp
+        self.exchange_interval = exchange_interval
+
+        # Tangga suhu geometris dari initial_temp ke min_temp
+        self.temperatures = [
+            initial_temp * (min_temp / initial_temp) ** (i / (replicas - 1))
+            for i in range(replicas)
+        ]
+        # Anggaran iterasi per rantai sama dengan jadwal annealing biasa
+        self.max_iteration = math.ceil(math.log(1 / initial_temp) / math.log(decay))
+
+        # Statistics - general
+        self.search_time = 0
+        self.iteration = 0
+        self.objective_plt: list[float] = []
+
+        # Statistics - parallel tempering
+        self.stuck_count = 0
+        self.delta_energy_plt: list[float] = []
+        self.temp_plt: list[float] = []
+        self.exchange_attempts = 0
+        self.exchange_accepted = 0
+
+    def search(self):
+        self.search_time = 0
+        self.perf.reset()
+        self._start_budget()
+        self.iteration = 0
+        self.objective_plt = []
+        self.stuck_count = 0
+        self.delta_energy_plt = []
+        self.temp_plt = []
+        self.exchange_attempts = 0
+        self.exchange_accepted = 0
+
+        context = multiprocessing.get_context("spawn")
+        connections = []
+        processes = []
+        starttime = time.time()
+        try:
+            for _ in range(self.replicas):
+                conn, child_conn = context.Pipe()
+                process = context.Process(
+                    target=_replica_worker,
+                    args=(child_conn, self.input, self.random.getrandbits(64)),
+                    daemon=True,
+                )
+                process.start()
+                connections.append(conn)
+                processes.append(process)
+
+            energies = [self._receive(conn) for conn in connections]
+            # rantai_suhu[i] adalah indeks rantai yang sedang memakai suhu ke-i
+            rantai_suhu = list(range(self.replicas))
+            self.objective_plt.append(min(energies))
+            detector = None
+            if self.stagnation.active():
+                detector = StagnationDetector(self.stagnation)
+
+            while self.iteration < self.max_iteration:
+                iterations = min(
+                    self.exchange_interval, self.max_iteration - self.iteration
+                )
+                for i, rantai in enumerate(rantai_suhu):
+                    connections[rantai].send(("run", self.temperatures[i], iterations))
+                for rantai, conn in enumerate(connections):
+                    energies[rantai], stuck = self._receive(conn)
+                    self.stuck_count += stuck
+                self.iteration += iterations
+
+                # Pertukaran suhu bertetangga dengan kriteria Metropolis,
+                # pasangan genap dan ganjil bergantian
+                paritas = (self.iteration // self.exchange_interval) % 2
+                for i in range(paritas, self.replicas - 1, 2):
+                    self._exchange(rantai_suhu, energies, i)
+
+                dingin = energies[rantai_suhu[-1]]
+                self.delta_energy_plt.append(dingin - self.objective_plt[-1])
+                self.objective_plt.append(dingin)
+                self.temp_plt.append(self.temperatures[-1])
+                if self.clock is not None:
+                    # Counter replika baru digabung di akhir, satu evaluasi per iterasi
+                    self.clock.evaluations_used = self.iteration * self.replicas
+                if self._tick(
+                    self.iteration,
+                    dingin,
+                    temperature=self.temperatures[-1],
+                    best=min(energies),
+                ):
+                    break
+                # Patience dihitung per iterasi rantai
+                if detector is not None and self._stop(
+                    detector.update(min(energies), steps=iterations)
+                ):
+                    break
+
+            best_objective = float("inf")
+            for conn in connections:
+                conn.send(("result",))
+            for conn in connections:
+                objective, jadwal, jadwal_init, perf = self._receive(conn)
+                self.perf.merge(perf)
+                if objective < best_objective:
+                    best_objective = objective
+                    self.jadwal = jadwal
+                    self.jadwal_init = jadwal_init
+        finally:
+            for process in processes:
+                process.join(timeout=1)
+                if process.is_alive():
+                    process.terminate()
+
+        endtime = time.time()
+        self.search_time = endtime - starttime
+
+    def _exchange(self, rantai_suhu: list[int], energies: list[float], i: int):
+        energi1 = energies[rantai_suhu[i]]
+        energi2 = energies[rantai_suhu[i + 1]]
+        beta1 = 1 / self.temperatures[i]
+        beta2 = 1 / self.temperatures[i + 1]
+        log_accept = (beta2 - beta1) * (energi2 - energi1)
+        self.exchange_attempts += 1
+        if log_accept >= 0 or self.random.random() < math.exp(log_accept):
+            rantai_suhu[i], rantai_suhu[i + 1] = rantai_suhu[i + 1], rantai_suhu[i]
+            self.exchange_accepted += 1
+
+    @staticmethod
+    def _receive(conn):
+        message = conn.recv()
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+    def get_result(self) -> SimulatedAnnealingResultsModel:
+        return SimulatedAnnealingResultsModel(
+            alokasi_ruangan_awal=self._form_alokasi_ruangan(self.jadwal_init),
+            alokasi_ruangan=self._form_alokasi_ruangan(self.jadwal),
+            search_time=self.search_time,
+            iteration=self.iteration,
+            objective_over_iteration=self.objective_plt,
+            local_optima_stuck_count=self.stuck_count,
+            delta_energy_over_iteration=self.delta_energy_plt,
+            temperature_over_iteration=self.temp_plt,
+            replicas=self.replicas,
+            exchange_acceptance_rate=self.exchange_accepted
+            / max(1, self.exchange_attempts),
+            stop_reason=self.stop_reason,
+            perf=self._perf_model(self.search_time),
         )
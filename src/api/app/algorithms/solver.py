@@ -1,15 +1,61 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional
+from time import perf_counter
+import random
 from .state import Problem, JadwalKuliah
-from ..schemas import ResultsModel, SlotKuliahModel
+from .progress import SolverProgress
+from .perf import PerfCounters
+from .budget import SearchBudget, BudgetClock, STOP_CANCELLED
+from ..schemas import ResultsModel, SlotKuliahModel, PerfModel
 
 
 class Solver(ABC):
-    def __init__(self, input: Problem):
+    def __init__(
+        self,
+        input: Problem,
+        seed: Optional[int] = None,
+        budget: Optional[SearchBudget] = None,
+    ):
         input.validate()
         self.input = input
+        # Sumber acak solver, seed yang sama menghasilkan pencarian yang sama
+        self.seed = seed
+        self.random = random.Random(seed)
         self.jadwal_init = JadwalKuliah({})
         self.jadwal = JadwalKuliah({})
+        self.progress: Optional[SolverProgress] = None
+        self.perf = PerfCounters()
+        self.budget = budget or SearchBudget()
+        self.budget.validate()
+        self.clock: Optional[BudgetClock] = None
+        self.stop_reason: Optional[str] = None
+
+    def _start_budget(self):
+        # Dipanggil di awal search, waktu inisialisasi ikut terhitung
+        self.stop_reason = None
+        self.clock = self.budget.start(self.perf) if self.budget.active() else None
+
+    def _tick(self, iteration: int, objective: float, **info) -> bool:
+        # True jika anggaran habis atau pemanggil meminta pencarian dihentikan.
+        # Target dibandingkan dengan objective terbaik jika solver melaporkannya
+        if self.clock is not None:
+            alasan = self.clock.exhausted(info.get("best", objective))
+            if alasan is not None:
+                self.stop_reason = alasan
+                return True
+        if self.progress is None:
+            return False
+        if self.progress.tick(iteration, objective, **info):
+            self.stop_reason = STOP_CANCELLED
+            return True
+        return False
+
+    def _stop(self, alasan: Optional[str]) -> bool:
+        # Mencatat alasan berhenti dari detektor lain (mis. stagnasi)
+        if alasan is None:
+            return False
+        self.stop_reason = alasan
+        return True
 
     @abstractmethod
     def search(self):
@@ -28,14 +74,17 @@ class Solver(ABC):
             search_time=0.0,
             iteration=0,
             objective_over_iteration=[],
+            stop_reason=self.stop_reason,
         )
 
     def _form_alokasi_ruangan(
         self, jadwal: JadwalKuliah
     ) -> Dict[str, List[SlotKuliahModel]]:
+        mulai = perf_counter()
         alokasi_ruangan: Dict[str, List[SlotKuliahModel]] = dict()
         for kode_kelas, slot_list in jadwal.slot_kuliah.items():
-            for slot in slot_list:
+            for slot_id in slot_list:
+                slot = self.input.slot(slot_id)
                 if slot.kode_ruangan not in alokasi_ruangan:
                     alokasi_ruangan[slot.kode_ruangan] = []
                 alokasi_ruangan[slot.kode_ruangan].append(
@@ -47,4 +96,9 @@ class Solver(ABC):
                     )
                 )
 
+        self.perf.serialization_time += perf_counter() - mulai
         return alokasi_ruangan
+
+    def _perf_model(self, search_time: float) -> PerfModel:
+        # Dipanggil terakhir pada get_result agar waktu serialisasi ikut terhitung
+        return self.perf.to_model(search_time)
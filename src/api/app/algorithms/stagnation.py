@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import Optional
+
+# Alasan berhenti karena pencarian dianggap sudah konvergen
+STOP_STAGNATION = "stagnation"
+STOP_LOW_DIVERSITY = "low_diversity"
+STOP_LOW_ACCEPTANCE = "low_acceptance"
+
+DEFAULT_ACCEPTANCE_WINDOW = 1000
+
+
+@dataclass(frozen=True)
+class StagnationCriteria:
+    # patience: iterasi (SA) atau generasi (GA) tanpa perbaikan objective terbaik
+    # min_diversity: GA, rata-rata proporsi pertemuan yang berbeda dari individu terbaik
+    # min_acceptance: SA, rasio langkah diterima per acceptance_window iterasi
+    patience: Optional[int] = None
+    min_diversity: Optional[float] = None
+    min_acceptance: Optional[float] = None
+    acceptance_window: int = DEFAULT_ACCEPTANCE_WINDOW
+
+    def validate(self):
+        if self.patience is not None and self.patience < 1:
+            raise ValueError("Patience harus lebih dari nol")
+        if self.min_diversity is not None and not 0 <= self.min_diversity <= 1:
+            raise ValueError("Diversitas minimum harus di antara 0 dan 1")
+        if self.min_acceptance is not None and not 0 <= self.min_acceptance <= 1:
+            raise ValueError("Acceptance rate minimum harus di antara 0 dan 1")
+        if self.acceptance_window < 1:
+            raise ValueError("Window acceptance harus lebih dari nol")
+
+    def active(self) -> bool:
+        return (
+            self.patience is not None
+            or self.min_diversity is not None
+            or self.min_acceptance is not None
+        )
+
+
+class StagnationDetector:
+    def __init__(self, criteria: StagnationCriteria):
+        self.criteria = criteria
+        self.best = float("inf")
+        self.since_improvement = 0
+        self.window_steps = 0
+        self.window_accepted = 0
+
+    def update(
+        self, objective: float, steps: int = 1, accepted: int = 0
+    ) -> Optional[str]:
+        # steps > 1 untuk solver yang melapor per blok iterasi (replika, pulau)
+        criteria = self.criteria
+        if objective < self.best:
+            self.best = objective
+            self.since_improvement = 0
+        else:
+            self.since_improvement += steps
+        if (
+            criteria.patience is not None
+            and self.since_improvement >= criteria.patience
+        ):
+            return STOP_STAGNATION
+
+        if criteria.min_acceptance is not None:
+            self.window_steps += steps
+            self.window_accepted += accepted
+            if self.window_steps >= criteria.acceptance_window:
+                rate = self.window_accepted / self.window_steps
+                self.window_steps = 0
+                self.window_accepted = 0
+                if rate < criteria.min_acceptance:
+                    return STOP_LOW_ACCEPTANCE
+        return None
+
+    def check_diversity(self, diversity: float) -> Optional[str]:
+        if (
+            self.criteria.min_diversity is not None
+            and diversity < self.criteria.min_diversity
+        ):
+            return STOP_LOW_DIVERSITY
+        return None
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from time import perf_counter
 import time
 import random
+from .perf import PerfCounters
 
 
 @dataclass(frozen=True)
@@ -13,7 +15,8 @@ class Slot:
 
 @dataclass
 class JadwalKuliah:
-    slot_kuliah: dict[str, list[Slot]]
+    # Setiap pertemuan adalah ID slot hasil Problem.slot_id()
+    slot_kuliah: dict[str, list[int]]
 
 
 LIST_HARI = [
@@ -31,6 +34,10 @@ LIST_WAKTU_MULAI: list[tuple[str, int]] = [
     for hari in LIST_HARI
     for j in range(MULAI_WAKTU_KULIAH, AKHIR_WAKTU_KULIAH)
 ]
+N_WAKTU = len(LIST_WAKTU_MULAI)
+INDEX_WAKTU: dict[tuple[str, int], int] = {
+    key: i for i, key in enumerate(LIST_WAKTU_MULAI)
+}
 
 PRIORITY_WEIGHT_MAP: dict[int, float] = {
     1: 1.75,
@@ -73,7 +80,126 @@ class Problem:
         self.list_ruangan = list_ruangan
         self.list_kuliah_mahasiswa = list_kuliah_mahasiswa
 
+        # Interning slot: (ruangan, hari, jam) -> ID integer ruang * N_WAKTU + waktu
+        self.index_ruangan = {
+            ruangan.kode: i for i, ruangan in enumerate(self.list_ruangan)
+        }
+        self.n_slot = len(self.list_ruangan) * N_WAKTU
+
+        # Precompiled co-enrollment structures
+        self.mahasiswa_by_class = self._compute_mahasiswa_by_class()
+        self.conflict_graph = self._compute_conflict_graph()
+        self.kelas_ganda = {
+            kode
+            for kode, daftar_mahasiswa in self.mahasiswa_by_class.items()
+            if any(jumlah > 1 for _, jumlah in daftar_mahasiswa)
+        }
+
+        # Tabel objective yang dipakai bersama oleh semua State dari problem ini
+        self.kuota_ruangan = [ruangan.kuota for ruangan in self.list_ruangan]
+        self.jumlah_mahasiswa_kelas = {
+            kelas.kode: kelas.jumlah_mahasiswa for kelas in self.list_kelas
+        }
+        self.weight_sum_by_class = self._compute_weight_sum_by_class()
+        # Setiap entri adalah (offset mahasiswa pada jam_mahasiswa, jumlah pengambilan)
+        self.offset_mahasiswa = {
+            kode: [(mhs * N_WAKTU, jumlah) for mhs, jumlah in daftar_mahasiswa]
+            for kode, daftar_mahasiswa in self.mahasiswa_by_class.items()
+        }
+        self.validated = False
+
+        # Representasi NumPy, diisi oleh compiled.compile_problem()
+        self.compiled = None
+
+    def __getstate__(self):
+        # Representasi NumPy tidak ikut dikirim ke proses lain, dibangun ulang saat perlu
+        state = self.__dict__.copy()
+        state["compiled"] = None
+        return state
+
+    def slot_id(self, kode_ruangan: str, hari: str, waktu_mulai: int) -> int:
+        return (
+            self.index_ruangan[kode_ruangan] * N_WAKTU
+            + INDEX_WAKTU[(hari, waktu_mulai)]
+        )
+
+    def slot(self, slot_id: int) -> Slot:
+        ruang, waktu = divmod(slot_id, N_WAKTU)
+        hari, waktu_mulai = LIST_WAKTU_MULAI[waktu]
+        return Slot(self.list_ruangan[ruang].kode, hari, waktu_mulai, waktu_mulai + 1)
+
+    def student_clash(self, daftar_kelas: list[str]) -> int:
+        # Penalti tabrakan mahasiswa pada satu jam, daftar_kelas berisi kode kelas
+        # untuk setiap pertemuan pada jam tersebut
+        if len(daftar_kelas) == 1:
+            if daftar_kelas[0] not in self.kelas_ganda:
+                return 0
+        elif len(daftar_kelas) == 2:
+            kode1, kode2 = daftar_kelas
+            if kode1 != kode2 and not (
+                kode1 in self.kelas_ganda or kode2 in self.kelas_ganda
+            ):
+                return 2 * self.conflict_graph[kode1].get(kode2, 0)
+
+        kelas_unik: dict[str, int] = {}
+        for kode in daftar_kelas:
+            kelas_unik[kode] = kelas_unik.get(kode, 0) + 1
+
+        jumlah_mahasiswa: dict[int, int] = {}
+        for kode, pertemuan in kelas_unik.items():
+            # Kelas tanpa tetangga pada jam ini tidak mungkin menyebabkan tabrakan
+            if pertemuan == 1 and kode not in self.kelas_ganda:
+                tetangga = self.conflict_graph[kode]
+                if not any(lain in tetangga for lain in kelas_unik if lain != kode):
+                    continue
+            for mhs, jumlah in self.mahasiswa_by_class[kode]:
+                jumlah_mahasiswa[mhs] = (
+                    jumlah_mahasiswa.get(mhs, 0) + jumlah * pertemuan
+                )
+        return sum(jumlah for jumlah in jumlah_mahasiswa.values() if jumlah > 1)
+
+    def _compute_mahasiswa_by_class(self) -> dict[str, list[tuple[int, int]]]:
+        # Setiap entri adalah (indeks mahasiswa, jumlah pengambilan kelas)
+        jumlah_by_class: dict[str, dict[int, int]] = {
+            kelas.kode: {} for kelas in self.list_kelas
+        }
+        for i, mahasiswa in enumerate(self.list_kuliah_mahasiswa):
+            for kode_kuliah in mahasiswa.prio_mata_kuliah.values():
+                # Kode invalid dilaporkan oleh self.validate()
+                if kode_kuliah in jumlah_by_class:
+                    jumlah = jumlah_by_class[kode_kuliah]
+                    jumlah[i] = jumlah.get(i, 0) + 1
+        return {kode: list(jumlah.items()) for kode, jumlah in jumlah_by_class.items()}
+
+    def _compute_weight_sum_by_class(self) -> dict[str, float]:
+        weight_sum = {kelas.kode: 0.0 for kelas in self.list_kelas}
+        for mahasiswa in self.list_kuliah_mahasiswa:
+            for prioritas, kode_kuliah in mahasiswa.prio_mata_kuliah.items():
+                # Kode invalid dilaporkan oleh self.validate()
+                if kode_kuliah in weight_sum:
+                    weight_sum[kode_kuliah] += priority_weight(prioritas)
+        return weight_sum
+
+    def _compute_conflict_graph(self) -> dict[str, dict[str, int]]:
+        # Bobot sisi adalah jumlah mahasiswa yang mengambil kedua kelas
+        graph: dict[str, dict[str, int]] = {kelas.kode: {} for kelas in self.list_kelas}
+        for mahasiswa in self.list_kuliah_mahasiswa:
+            daftar_kelas = [
+                kode
+                for kode in dict.fromkeys(mahasiswa.prio_mata_kuliah.values())
+                if kode in graph
+            ]
+            for i, kode1 in enumerate(daftar_kelas):
+                for kode2 in daftar_kelas[i + 1 :]:
+                    graph[kode1][kode2] = graph[kode1].get(kode2, 0) + 1
+                    graph[kode2][kode1] = graph[kode2].get(kode1, 0) + 1
+        return graph
+
     def validate(self):
+        # Problem yang sudah valid (mis. dari cache) tidak perlu divalidasi ulang
+        if self.validated:
+            return
+
         kode_kelas_mk = dict()
         for kelas in self.list_kelas:
             if kelas.kode in kode_kelas_mk:
@@ -112,6 +238,43 @@ class Problem:
                         f"Jumlah mahasiswa pada kelas {kode_mk} melebihi kapasitas terdaftar"
                     )
 
+        self.validated = True
+
+
+class IndexedSet:
+    # Himpunan dengan add, discard, dan pemilihan acak O(1)
+    def __init__(self, items=()):
+        self.items: list[int] = []
+        self.posisi: dict[int, int] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: int):
+        if item not in self.posisi:
+            self.posisi[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item: int):
+        i = self.posisi.pop(item, None)
+        if i is None:
+            return
+        terakhir = self.items.pop()
+        if i < len(self.items):
+            self.items[i] = terakhir
+            self.posisi[terakhir] = i
+
+    def choice(self, randomizer: random.Random) -> int:
+        return self.items[int(randomizer.random() * len(self.items))]
+
+    def __contains__(self, item: int) -> bool:
+        return item in self.posisi
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
 
 class State:
     def __init__(
@@ -125,32 +288,187 @@ class State:
         self.random = randomizer
 
         # Attributes for calculating objective function
-        self.timetable_mahasiswa = {slot: 0 for slot in LIST_WAKTU_MULAI}
-        self.kuota_ruangan = {
-            ruangan.kode: ruangan.kuota for ruangan in self.problem.list_ruangan
-        }
-        self.weight_sum_by_class = self._compute_weight_sum_by_class()
+        self.kuota_ruangan = self.problem.kuota_ruangan
+        self.weight_sum_by_class = self.problem.weight_sum_by_class
+        self.jumlah_mahasiswa_kelas = self.problem.jumlah_mahasiswa_kelas
+
+        # Attributes for delta evaluation, filled by self.init_delta()
+        self.offset_mahasiswa = self.problem.offset_mahasiswa
+        self.jam_mahasiswa: list[int] = []
+        self.jumlah_slot: list[int] = []
+        self.bobot_slot: list[float] = []
+        self.current_objective = 0.0
+
+        # Attributes for neighbour moves, filled by self.init_slot_assignment()
+        # slot_assignment: slot -> {kode kelas: banyak pertemuan}
+        # posisi_kelas: kode kelas -> {slot: indeks pada jadwal.slot_kuliah[kode]}
+        self.slot_assignment: dict[int, dict[str, int]] = {}
+        self.posisi_kelas: dict[str, dict[int, list[int]]] = {}
+        self.empty_slots = IndexedSet()
+
+        # Counter kinerja, diganti solver dengan miliknya agar terkumpul di satu tempat
+        self.perf = PerfCounters()
 
     def seed_jadwal(self):
         kuliah_dict = dict()
-        list_kode_ruangan = [ruangan.kode for ruangan in self.problem.list_ruangan]
+        list_ruang = range(len(self.problem.list_ruangan))
+        list_waktu = range(N_WAKTU)
 
         for kelas in self.problem.list_kelas:
-            ruang_kelas = self.random.choices(list_kode_ruangan, k=kelas.sks)
-            jadwal_kelas = self.random.sample(LIST_WAKTU_MULAI, k=kelas.sks)
+            ruang_kelas = self.random.choices(list_ruang, k=kelas.sks)
+            jadwal_kelas = self.random.sample(list_waktu, k=kelas.sks)
 
             kuliah_dict[kelas.kode] = [
-                Slot(
-                    ruang_kelas[i],
-                    jadwal_kelas[i][0],
-                    jadwal_kelas[i][1],
-                    jadwal_kelas[i][1] + 1,
-                )
-                for i in range(kelas.sks)
+                ruang_kelas[i] * N_WAKTU + jadwal_kelas[i] for i in range(kelas.sks)
             ]
 
         self.jadwal = JadwalKuliah(kuliah_dict)
 
+    def init_slot_assignment(self):
+        self.slot_assignment = {}
+        self.posisi_kelas = {}
+        for kode, slot_list in self.jadwal.slot_kuliah.items():
+            posisi = self.posisi_kelas[kode] = {}
+            for i, slot in enumerate(slot_list):
+                kelas_slot = self.slot_assignment.setdefault(slot, {})
+                kelas_slot[kode] = kelas_slot.get(kode, 0) + 1
+                posisi.setdefault(slot, []).append(i)
+        self.empty_slots = IndexedSet(
+            slot
+            for slot in range(self.problem.n_slot)
+            if slot not in self.slot_assignment
+        )
+
+    def _pindah_pertemuan(self, kode: str, slot_from: int, slot_to: int):
+        # Memindahkan satu pertemuan kelas tanpa mengubah objektif, O(1)
+        posisi = self.posisi_kelas[kode]
+        daftar_posisi = posisi[slot_from]
+        i = daftar_posisi.pop()
+        if not daftar_posisi:
+            del posisi[slot_from]
+        posisi.setdefault(slot_to, []).append(i)
+        self.jadwal.slot_kuliah[kode][i] = slot_to
+
+        kelas_from = self.slot_assignment[slot_from]
+        if kelas_from[kode] == 1:
+            del kelas_from[kode]
+            if not kelas_from:
+                del self.slot_assignment[slot_from]
+                self.empty_slots.add(slot_from)
+        else:
+            kelas_from[kode] -= 1
+
+        kelas_to = self.slot_assignment.get(slot_to)
+        if kelas_to is None:
+            self.slot_assignment[slot_to] = {kode: 1}
+            self.empty_slots.discard(slot_to)
+        else:
+            kelas_to[kode] = kelas_to.get(kode, 0) + 1
+
+    def init_delta(self):
+        self.jam_mahasiswa = [0] * (len(self.problem.list_kuliah_mahasiswa) * N_WAKTU)
+        self.jumlah_slot = [0] * self.problem.n_slot
+        self.bobot_slot = [0.0] * self.problem.n_slot
+        for kode, slot_list in self.jadwal.slot_kuliah.items():
+            bobot = self.weight_sum_by_class[kode]
+            for slot in slot_list:
+                jam = slot % N_WAKTU
+                for offset, jumlah in self.offset_mahasiswa[kode]:
+                    self.jam_mahasiswa[offset + jam] += jumlah
+                self.jumlah_slot[slot] += 1
+                self.bobot_slot[slot] += bobot
+        self.current_objective = self.objective()
+
+    def delta_move(self, slot_from: int, kode: str, slot_to: int) -> float:
+        mulai = perf_counter()
+        res = self._delta_move(slot_from, kode, slot_to, False)
+        self.perf.evaluations += 1
+        self.perf.evaluation_time += perf_counter() - mulai
+        return res
+
+    def delta_swap(self, kelas1: str, slot1: int, kelas2: str, slot2: int) -> float:
+        self.perf.evaluations += 1
+        if slot1 == slot2 or kelas1 == kelas2:
+            return 0.0
+        mulai = perf_counter()
+        # Kelas kedua dievaluasi terhadap keadaan setelah kelas pertama dipindah
+        res = self._delta_move(slot1, kelas1, slot2, True)
+        res += self._delta_move(slot2, kelas2, slot1, False)
+        self._delta_move(slot2, kelas1, slot1, True)
+        self.perf.evaluation_time += perf_counter() - mulai
+        return res
+
+    def apply_move(self, slot_from: int, kode: str, slot_to: int) -> float:
+        delta = self._delta_move(slot_from, kode, slot_to, True)
+        self.current_objective += delta
+        return delta
+
+    def apply_swap(self, kelas1: str, slot1: int, kelas2: str, slot2: int) -> float:
+        if slot1 == slot2 or kelas1 == kelas2:
+            return 0.0
+        delta = self._delta_move(slot1, kelas1, slot2, True)
+        delta += self._delta_move(slot2, kelas2, slot1, True)
+        self.current_objective += delta
+        return delta
+
+    def _delta_move(
+        self, slot_from: int, kode: str, slot_to: int, terapkan: bool
+    ) -> float:
+        if slot_from == slot_to:
+            return 0.0
+        res = 0.0
+
+        # Tabrakan jadwal mahasiswa, hanya untuk mahasiswa kelas yang dipindah
+        jam_from = slot_from % N_WAKTU
+        jam_to = slot_to % N_WAKTU
+        if jam_from != jam_to:
+            jam_mahasiswa = self.jam_mahasiswa
+            for offset, jumlah in self.offset_mahasiswa[kode]:
+                key_from = offset + jam_from
+                key_to = offset + jam_to
+                lama_from = jam_mahasiswa[key_from]
+                lama_to = jam_mahasiswa[key_to]
+                baru_from = lama_from - jumlah
+                baru_to = lama_to + jumlah
+                res += (
+                    (baru_from if baru_from > 1 else 0)
+                    - (lama_from if lama_from > 1 else 0)
+                    + (baru_to if baru_to > 1 else 0)
+                    - (lama_to if lama_to > 1 else 0)
+                )
+                if terapkan:
+                    jam_mahasiswa[key_from] = baru_from
+                    jam_mahasiswa[key_to] = baru_to
+
+        # Tabrakan ruangan berbobot, hanya untuk kedua slot
+        bobot = self.weight_sum_by_class[kode]
+        res += self._delta_slot(slot_from, -1, -bobot, terapkan)
+        res += self._delta_slot(slot_to, 1, bobot, terapkan)
+
+        # Kuota kelas
+        res += self._penalti_kuota(kode, slot_to) - self._penalti_kuota(kode, slot_from)
+        return res
+
+    def _delta_slot(
+        self, slot: int, d_jumlah: int, d_bobot: float, terapkan: bool
+    ) -> float:
+        jumlah = self.jumlah_slot[slot]
+        bobot = self.bobot_slot[slot]
+        jumlah_baru = jumlah + d_jumlah
+        bobot_baru = bobot + d_bobot
+        if terapkan:
+            self.jumlah_slot[slot] = jumlah_baru
+            self.bobot_slot[slot] = bobot_baru if jumlah_baru > 0 else 0.0
+        return (bobot_baru if jumlah_baru > 1 else 0.0) - (bobot if jumlah > 1 else 0.0)
+
+    def _penalti_kuota(self, kode: str, slot: int) -> float:
+        over_capacity = (
+            self.jumlah_mahasiswa_kelas[kode] - self.kuota_ruangan[slot // N_WAKTU]
+        )
+        if over_capacity <= 0:
+            return 0
+        return over_capacity
+
     def objective(self) -> float:
         return (
             self._tabrakan_jadwal_mahasiswa()
@@ -159,20 +477,15 @@ class State:
         )
 
     def _tabrakan_jadwal_mahasiswa(self) -> float:
+        kelas_per_jam: list[list[str]] = [[] for _ in range(N_WAKTU)]
+        for kode, slot_list in self.jadwal.slot_kuliah.items():
+            for slot in slot_list:
+                kelas_per_jam[slot % N_WAKTU].append(kode)
+
         res = 0
-        timetable = self.timetable_mahasiswa
-        for mhs in self.problem.list_kuliah_mahasiswa:
-            for kode_kuliah in mhs.prio_mata_kuliah.values():
-                for slot in self.jadwal.slot_kuliah[kode_kuliah]:
-                    for jam in range(slot.waktu_mulai, slot.waktu_akhir):
-                        key = (slot.hari, jam)
-                        timetable[key] += 1
-
-            for key in timetable.keys():
-                tabrakan = timetable[key]
-                if tabrakan > 1:
-                    res += tabrakan
-                timetable[key] = 0
+        for daftar_kelas in kelas_per_jam:
+            if daftar_kelas:
+                res += self.problem.student_clash(daftar_kelas)
         return res
 
     def _kuota_kelas(self):
@@ -181,39 +494,22 @@ class State:
         for kelas in self.problem.list_kelas:
             kode = kelas.kode
             for slot in self.jadwal.slot_kuliah[kode]:
-                kuota = kuota_ruangan[slot.kode_ruangan]
+                kuota = kuota_ruangan[slot // N_WAKTU]
                 if kelas.jumlah_mahasiswa > kuota:
-                    over_capacity = kelas.jumlah_mahasiswa - kuota
-                    durasi = slot.waktu_akhir - slot.waktu_mulai
-                    res += over_capacity * durasi
+                    res += kelas.jumlah_mahasiswa - kuota
         return res
 
     def _tabrakan_ruangan_berbobot(self) -> float:
         res = 0.0
-        slot_conflicts: dict[Slot, list[str]] = {}
+        slot_conflicts: dict[int, list[str]] = {}
         for kode, slot_list in self.jadwal.slot_kuliah.items():
             for slot in slot_list:
                 if slot not in slot_conflicts:
                     slot_conflicts[slot] = []
                 slot_conflicts[slot].append(kode)
 
-        for slot, daftar_kelas in slot_conflicts.items():
+        for daftar_kelas in slot_conflicts.values():
             if len(daftar_kelas) <= 1:
                 continue
-            durasi = slot.waktu_akhir - slot.waktu_mulai
-            total_bobot = sum(
-                self.weight_sum_by_class.get(kode, 0.0) for kode in daftar_kelas
-            )
-            res += durasi * total_bobot
+            res += sum(self.weight_sum_by_class.get(kode, 0.0) for kode in daftar_kelas)
         return res
-
-    def _compute_weight_sum_by_class(self) -> dict[str, float]:
-        weight_sum = {kelas.kode: 0.0 for kelas in self.problem.list_kelas}
-        for mahasiswa in self.problem.list_kuliah_mahasiswa:
-            for prioritas, kode_kuliah in mahasiswa.prio_mata_kuliah.items():
-                if kode_kuliah not in weight_sum:
-                    raise ValueError(
-                        f"Mahasiswa NIM {mahasiswa.nim} memiliki kode mata kuliah invalid ({kode_kuliah})"
-                    )
-                weight_sum[kode_kuliah] += priority_weight(prioritas)
-        return weight_sum
@@ -0,0 +1,217 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional
+import multiprocessing
+import threading
+import time
+import uuid
+import os
+from .algorithms import Problem
+from .algorithms.progress import SolverProgress, DEFAULT_PROGRESS_INTERVAL
+from .runner import SolverPool, MAX_RUNS
+from .schemas import JobModel
+from .traces import TraceOptions
+from . import metrics
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_CANCELLED = "cancelled"
+JOB_FAILED = "failed"
+
+DEFAULT_JOB_WORKERS = 2
+MAX_QUEUED_JOBS = 32
+MAX_STORED_JOBS = 100
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+class JobProgress(SolverProgress):
+    # Progres satu run yang ditulis ke dict milik multiprocessing.Manager sehingga
+    # dapat dibaca dari proses API walaupun solver berjalan di proses worker
+    def __init__(
+        self, shared, run: int, cancel, interval: float = DEFAULT_PROGRESS_INTERVAL
+    ):
+        super().__init__(interval)
+        self.shared = shared
+        self.run = run
+        self.cancel = cancel
+
+    def publish(self):
+        self.shared[self.run] = self.snapshot()
+
+    def stop_requested(self) -> bool:
+        return self.cancel.is_set()
+
+
+@dataclass
+class Job:
+    id: str
+    algorithm: str
+    runs: int
+    solver_cls: type
+    solver_kwargs: dict[str, Any]
+    problem: Problem
+    cancel: Any
+    progress: Any
+    traces: Optional[TraceOptions] = None
+    status: str = JOB_PENDING
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def finished(self) -> bool:
+        return self.status in (JOB_COMPLETED, JOB_CANCELLED, JOB_FAILED)
+
+
+class JobManager:
+    def __init__(self, pool: SolverPool, max_workers: Optional[int] = None):
+        self.pool = pool
+        self.max_workers = max_workers
+        self.jobs: dict[str, Job] = {}
+        self.lock = threading.Lock()
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.manager = None
+
+    def start(self):
+        with self.lock:
+            self._start()
+
+    def _start(self):
+        if self.executor is not None:
+            return
+        # Jumlah job yang berjalan bersamaan, dapat diatur dengan JOB_WORKERS
+        workers = self.max_workers or int(
+            os.environ.get("JOB_WORKERS", DEFAULT_JOB_WORKERS)
+        )
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="job"
+        )
+        self.manager = multiprocessing.get_context("spawn").Manager()
+
+    def shutdown(self):
+        with self.lock:
+            for job in self.jobs.values():
+                if not job.finished():
+                    job.cancel.set()
+            if self.executor is not None:
+                self.executor.shutdown(wait=True, cancel_futures=True)
+                self.executor = None
+            if self.manager is not None:
+                self.manager.shutdown()
+                self.manager = None
+            self.jobs = {}
+
+    def submit(
+        self,
+        algorithm: str,
+        solver_cls: type,
+        solver_kwargs: dict[str, Any],
+        problem: Problem,
+        runs: int,
+        traces: Optional[TraceOptions] = None,
+    ) -> Job:
+        if runs < 1 or runs > MAX_RUNS:
+            raise ValueError(f"Jumlah run harus di antara 1 dan {MAX_RUNS}")
+        if traces is not None:
+            traces.validate()
+        problem.validate()
+        # Parameter solver divalidasi konstruktornya; dilakukan di sini agar parameter
+        # yang salah ditolak saat submit, bukan baru gagal di worker
+        solver_cls(problem, **solver_kwargs)
+        with self.lock:
+            self._start()
+            queued = sum(1 for job in self.jobs.values() if not job.finished())
+            if queued >= MAX_QUEUED_JOBS:
+                raise JobQueueFull("Antrian job penuh, coba lagi nanti")
+            self._evict()
+
+            job = Job(
+                id=uuid.uuid4().hex,
+                algorithm=algorithm,
+                runs=runs,
+                solver_cls=solver_cls,
+                solver_kwargs=solver_kwargs,
+                problem=problem,
+                cancel=self.manager.Event(),
+                progress=self.manager.dict(),
+                traces=traces,
+            )
+            self.jobs[job.id] = job
+            self.executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        job = self.jobs.get(job_id)
+        if job is not None and not job.finished():
+            # Solver berhenti pada pengecekan progres berikutnya
+            job.cancel.set()
+        return job
+
+    def read_progress(self, job: Job) -> dict[int, dict]:
+        if self.manager is None:
+            return {}
+        return dict(job.progress)
+
+    def to_model(self, job: Job) -> JobModel:
+        return JobModel(
+            id=job.id,
+            algorithm=job.algorithm,
+            status=job.status,
+            runs=job.runs,
+            created_at=job.created_at,
+            finished_at=job.finished_at,
+            progress=self.read_progress(job),
+            result=job.result,
+            error=job.error,
+        )
+
+    def _run(self, job: Job):
+        if job.cancel.is_set():
+            self._finish(job, JOB_CANCELLED)
+            return
+
+        job.status = JOB_RUNNING
+        try:
+            with metrics.track_search(job.algorithm):
+                job.result = self.pool.run(
+                    job.solver_cls,
+                    job.problem,
+                    job.solver_kwargs,
+                    job.runs,
+                    progress=[
+                        JobProgress(job.progress, i, job.cancel)
+                        for i in range(job.runs)
+                    ],
+                    traces=job.traces,
+                )
+            metrics.observe_results(job.algorithm, job.solver_cls, job.result)
+            self._finish(job, JOB_CANCELLED if job.cancel.is_set() else JOB_COMPLETED)
+        except Exception as e:
+            job.error = str(e)
+            self._finish(job, JOB_FAILED)
+
+    def _finish(self, job: Job, status: str):
+        # Problem tidak lagi dibutuhkan setelah job selesai
+        job.problem = None
+        job.finished_at = time.time()
+        job.status = status
+        metrics.observe_request(
+            job.algorithm,
+            job.solver_cls,
+            "job",
+            status,
+            job.finished_at - job.created_at,
+        )
+
+    def _evict(self):
+        finished = [job for job in self.jobs.values() if job.finished()]
+        finished.sort(key=lambda job: job.finished_at)
+        for job in finished[: max(0, len(self.jobs) - MAX_STORED_JOBS + 1)]:
+            del self.jobs[job.id]
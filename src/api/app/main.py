@@ -1,5 +1,7 @@
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from typing import Optional
 from .schemas import (
     StateInputModel,
@@ -9,24 +11,44 @@ from .schemas import (
     HillClimbingResultsModel,
     GeneticAlgorithmResponseModel,
     GeneticAlgorithmResultsModel,
+    JobRequestModel,
+    JobModel,
 )
-from .algorithms.state_model_parser import load_problem
-from .algorithms.simulated_annealing import (
-    SimulatedAnnealing,
-    DEFAULT_INITIAL_TEMP,
-    DEFAULT_DECAY_RATE,
+from .algorithms.simulated_annealing import DEFAULT_MIN_TEMP, DEFAULT_EXCHANGE_INTERVAL
+from .algorithms.hill_climbing import DEFAULT_NEIGHBORHOOD_SIZE
+from .algorithms.stagnation import DEFAULT_ACCEPTANCE_WINDOW
+from .solver_specs import (
+    simulated_annealing_spec,
+    hill_climbing_spec,
+    genetic_algorithm_spec,
+    solver_spec,
 )
-from .algorithms.hill_climbing import (
-    SteepestAscentHillClimbing,
-    StochasticHillClimbing,
-    SidewaysMoveHillClimbing,
-    RandomRestartHillClimbing,
-    DEFAULT_MAX_SIDEWAYS,
-    DEFAULT_MAX_RESTART,
-)
-from .algorithms.genetic_algorithm import GeneticAlgorithm, GAParams
+from .runner import SolverPool, DEFAULT_RUNS
+from .jobs import JobManager, JobQueueFull
+from .streaming import job_events
+from .traces import TraceOptions
+from .problem_cache import ProblemCache, problem_key
+from .result_cache import ResultCache, result_key
+from . import metrics
+
+solver_pool = SolverPool()
+job_manager = JobManager(solver_pool)
+problem_cache = ProblemCache()
+result_cache = ResultCache()
+metrics.registry.add_collector(metrics.cache_collector("problem", problem_cache))
+metrics.registry.add_collector(metrics.cache_collector("result", result_cache))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    solver_pool.start()
+    job_manager.start()
+    yield
+    job_manager.shutdown()
+    solver_pool.shutdown()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 origins = [
     "http://localhost:5173",
     "http://127.0.0.1:5173",
@@ -40,33 +62,93 @@ app.add_middleware(
 )
 
 
+def _solve(
+    algorithm: str,
+    request: StateInputModel,
+    solver_cls: type,
+    solver_kwargs: dict,
+    runs: int,
+    traces: TraceOptions,
+) -> dict:
+    with metrics.track_request(algorithm, solver_cls):
+        problem_hash = problem_key(request)
+        problem = problem_cache.load(request, problem_hash)
+        metrics.observe_problem(problem)
+
+        def compute():
+            with metrics.track_search(algorithm):
+                results = solver_pool.run(
+                    solver_cls, problem, solver_kwargs, runs, traces=traces
+                )
+            metrics.observe_results(algorithm, solver_cls, results)
+            return results
+
+        # Hanya run ber-seed yang hasilnya dapat diulang sehingga boleh di-cache.
+        # Dengan time_limit_s, sejauh mana pencarian berjalan bergantung pada waktu,
+        # dan dengan beberapa worker restart urutan serta titik berhentinya juga
+        budget = solver_kwargs.get("budget")
+        if (
+            solver_kwargs.get("seed") is None
+            or (budget is not None and budget.time_limit_s is not None)
+            or solver_kwargs.get("workers", 1) > 1
+        ):
+            return compute()
+        key = result_key(problem_hash, solver_cls, solver_kwargs, runs, traces)
+        return result_cache.get_or_compute(key, compute)
+
+
 @app.get("/")
 def read_root():
     return {"message": "Hello World"}
 
 
+@app.get("/metrics")
+def read_metrics():
+    return Response(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.post("/api/sim-anneal")
 def compute_simulated_annealing(
     request: StateInputModel,
     initial_temp: Optional[float] = None,
     decay: Optional[float] = None,
+    replicas: int = 1,
+    min_temp: float = DEFAULT_MIN_TEMP,
+    exchange_interval: int = DEFAULT_EXCHANGE_INTERVAL,
+    runs: int = DEFAULT_RUNS,
+    max_points: Optional[int] = None,
+    encoding: str = "json",
+    seed: Optional[int] = None,
+    time_limit_s: Optional[float] = None,
+    max_evaluations: Optional[int] = None,
+    target_objective: Optional[float] = None,
+    patience: Optional[int] = None,
+    min_acceptance: Optional[float] = None,
+    acceptance_window: int = DEFAULT_ACCEPTANCE_WINDOW,
 ) -> SimulatedAnnealingResponseModel:
     try:
-        problem = load_problem(request)
-        results: dict[int, SimulatedAnnealingResultsModel] = {}
-        init_temp_value = (
-            initial_temp if initial_temp is not None else DEFAULT_INITIAL_TEMP
+        solver_cls, solver_kwargs = simulated_annealing_spec(
+            initial_temp=initial_temp,
+            decay=decay,
+            replicas=replicas,
+            min_temp=min_temp,
+            exchange_interval=exchange_interval,
+            seed=seed,
+            time_limit_s=time_limit_s,
+            max_evaluations=max_evaluations,
+            target_objective=target_objective,
+            patience=patience,
+            min_acceptance=min_acceptance,
+            acceptance_window=acceptance_window,
+        )
+        results: dict[int, SimulatedAnnealingResultsModel] = _solve(
+            "sim-anneal",
+            request,
+            solver_cls,
+            solver_kwargs,
+            runs,
+            TraceOptions(max_points=max_points, encoding=encoding),
         )
-        decay_value = decay if decay is not None else DEFAULT_DECAY_RATE
-
-        for i in range(3):
-            solver = SimulatedAnnealing(
-                problem,
-                initial_temp=init_temp_value,
-                decay=decay_value,
-            )
-            solver.search()
-            results[i] = solver.get_result()
         return {"run": results}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -79,50 +161,39 @@ def compute_hill_climbing(
     max_sideways: Optional[int] = None,
     max_restart: Optional[int] = None,
     max_iterations_per_restart: Optional[int] = None,
+    neighborhood_size: int = DEFAULT_NEIGHBORHOOD_SIZE,
+    batched: bool = False,
+    restart_workers: int = 1,
+    target_objective: Optional[float] = None,
+    runs: int = DEFAULT_RUNS,
+    max_points: Optional[int] = None,
+    encoding: str = "json",
+    seed: Optional[int] = None,
+    time_limit_s: Optional[float] = None,
+    max_evaluations: Optional[int] = None,
 ) -> HillClimbingResponseModel:
     try:
-        problem = load_problem(request)
-        variant_key = variant.lower()
-
-        solver_factory = None
-        if variant_key == "steepest":
-
-            def solver_factory():
-                return SteepestAscentHillClimbing(problem)
-        elif variant_key == "stochastic":
-
-            def solver_factory():
-                return StochasticHillClimbing(problem)
-        elif variant_key == "sideways":
-            sideways_limit = (
-                max_sideways if max_sideways is not None else DEFAULT_MAX_SIDEWAYS
-            )
-
-            def solver_factory():
-                return SidewaysMoveHillClimbing(problem, max_sideways=sideways_limit)
-        elif variant_key == "random_restart":
-            restart_limit = (
-                max_restart if max_restart is not None else DEFAULT_MAX_RESTART
-            )
-
-            def solver_factory():
-                return RandomRestartHillClimbing(
-                    problem,
-                    max_restart=restart_limit,
-                    max_iterations_per_restart=max_iterations_per_restart,
-                )
-
-        if solver_factory is None:
-            raise HTTPException(
-                status_code=400,
-                detail="Varian hill climbing tidak dikenal",
-            )
-
-        results: dict[int, HillClimbingResultsModel] = {}
-        for i in range(3):
-            solver = solver_factory()
-            solver.search()
-            results[i] = solver.get_result()
+        solver_cls, solver_kwargs = hill_climbing_spec(
+            variant=variant,
+            max_sideways=max_sideways,
+            max_restart=max_restart,
+            max_iterations_per_restart=max_iterations_per_restart,
+            neighborhood_size=neighborhood_size,
+            batched=batched,
+            restart_workers=restart_workers,
+            target_objective=target_objective,
+            seed=seed,
+            time_limit_s=time_limit_s,
+            max_evaluations=max_evaluations,
+        )
+        results: dict[int, HillClimbingResultsModel] = _solve(
+            "hill-climbing",
+            request,
+            solver_cls,
+            solver_kwargs,
+            runs,
+            TraceOptions(max_points=max_points, encoding=encoding),
+        )
         return {"run": results}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -137,22 +208,111 @@ def compute_genetic_algorithm(
     mutation_rate: float = 0.2,
     tournament_k: int = 3,
     elitism: int = 1,
+    islands: int = 1,
+    migration_interval: int = 10,
+    migrants: int = 2,
+    migration_topology: str = "ring",
+    runs: int = DEFAULT_RUNS,
+    max_points: Optional[int] = None,
+    encoding: str = "json",
+    seed: Optional[int] = None,
+    time_limit_s: Optional[float] = None,
+    max_evaluations: Optional[int] = None,
+    target_objective: Optional[float] = None,
+    patience: Optional[int] = None,
+    min_diversity: Optional[float] = None,
 ) -> GeneticAlgorithmResponseModel:
     try:
-        problem = load_problem(request)
-        results: dict[int, GeneticAlgorithmResultsModel] = {}
-        params = GAParams(
+        solver_cls, solver_kwargs = genetic_algorithm_spec(
             population_size=population_size,
             max_generations=max_generations,
             crossover_rate=crossover_rate,
             mutation_rate=mutation_rate,
             tournament_k=tournament_k,
             elitism=elitism,
+            islands=islands,
+            migration_interval=migration_interval,
+            migrants=migrants,
+            migration_topology=migration_topology,
+            seed=seed,
+            time_limit_s=time_limit_s,
+            max_evaluations=max_evaluations,
+            target_objective=target_objective,
+            patience=patience,
+            min_diversity=min_diversity,
+        )
+        results: dict[int, GeneticAlgorithmResultsModel] = _solve(
+            "genetic-algorithm",
+            request,
+            solver_cls,
+            solver_kwargs,
+            runs,
+            TraceOptions(max_points=max_points, encoding=encoding),
         )
-        for i in range(3):
-            solver = GeneticAlgorithm(problem, params=params)
-            solver.search()
-            results[i] = solver.get_result()
         return {"run": results}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+
+def _submit_job(request: JobRequestModel):
+    try:
+        problem = problem_cache.load(request.input)
+        metrics.observe_problem(problem)
+        solver_cls, solver_kwargs = solver_spec(request.algorithm, request.params)
+        return job_manager.submit(
+            request.algorithm,
+            solver_cls,
+            solver_kwargs,
+            problem,
+            request.runs,
+            traces=TraceOptions(
+                max_points=request.max_points, encoding=request.encoding
+            ),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+@app.post("/api/jobs")
+def submit_job(request: JobRequestModel) -> JobModel:
+    return job_manager.to_model(_submit_job(request))
+
+
+@app.post("/api/stream")
+def stream_job(request: JobRequestModel, http_request: Request):
+    # Menjalankan job dan langsung men-stream progresnya, job dibatalkan jika
+    # klien memutus koneksi
+    job = _submit_job(request)
+    return StreamingResponse(
+        job_events(job_manager, job, http_request, cancel_on_disconnect=True),
+        media_type="text/event-stream",
+    )
+
+
+@app.get("/api/jobs/{job_id}/events")
+def stream_job_events(job_id: str, http_request: Request):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job tidak ditemukan")
+    return StreamingResponse(
+        job_events(job_manager, job, http_request),
+        media_type="text/event-stream",
+    )
+
+
+@app.get("/api/jobs/{job_id}")
+def get_job(job_id: str) -> JobModel:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job tidak ditemukan")
+    return job_manager.to_model(job)
+
+
+@app.delete("/api/jobs/{job_id}")
+def cancel_job(job_id: str) -> JobModel:
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job tidak ditemukan")
+    return job_manager.to_model(job)
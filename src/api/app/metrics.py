@@ -0,0 +1,278 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Iterable, Optional
+import math
+import threading
+
+# Metrik dalam format eksposisi teks Prometheus. Nilai disimpan per proses API;
+# solver di process pool tidak menulis metrik, hasilnya diamati di sini
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+KELAS_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+RUANGAN_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500)
+MAHASISWA_BUCKETS = (10, 50, 100, 500, 1000, 2500, 5000, 10000, 25000, 50000)
+EVALUATION_RATE_BUCKETS = (1e2, 1e3, 1e4, 5e4, 1e5, 5e5, 1e6, 1e7)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra=()) -> str:
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(str(v))}"' for n, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self.values: dict[tuple[str, ...], object] = {}
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Label metrik {self.name} harus {self.labelnames}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        with self.lock:
+            items = sorted(self.values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(key, value))
+        return lines
+
+    def _render_sample(self, key, value) -> list[str]:
+        labels = _format_labels(self.labelnames, key)
+        return [f"{self.name}{labels} {_format_value(value)}"]
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = value
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self.lock:
+            # [jumlah per bucket..., +Inf], sum
+            data = self.values.get(key)
+            if data is None:
+                data = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            data[0][bisect_left(self.buckets, value)] += 1
+            data[1] += value
+
+    def _render_sample(self, key, value) -> list[str]:
+        counts, total = value
+        lines = []
+        kumulatif = 0
+        for batas, jumlah in zip(self.buckets + (math.inf,), counts):
+            kumulatif += jumlah
+            labels = _format_labels(
+                self.labelnames, key, [("le", _format_value(batas))]
+            )
+            lines.append(f"{self.name}_bucket{labels} {kumulatif}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {kumulatif}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: list[Metric] = []
+        # Collector dipanggil saat scrape, untuk nilai yang dimiliki objek lain
+        self.collectors: list[Callable[[], list[Metric]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], list[Metric]]):
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        for collector in self.collectors:
+            for metric in collector():
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+requests_total = registry.register(
+    Counter(
+        "solver_requests_total",
+        "Permintaan solver per algoritma, kelas solver, mode (sync/job), dan status",
+        ("algorithm", "solver", "mode", "status"),
+    )
+)
+request_duration = registry.register(
+    Histogram(
+        "solver_request_duration_seconds",
+        "Latensi permintaan solver, termasuk antrian dan cache",
+        ("algorithm", "solver", "mode"),
+    )
+)
+searches_in_flight = registry.register(
+    Gauge(
+        "solver_searches_in_flight",
+        "Pencarian yang sedang berjalan per algoritma",
+        ("algorithm",),
+    )
+)
+problem_classes = registry.register(
+    Histogram(
+        "solver_problem_classes",
+        "Jumlah kelas mata kuliah per permintaan",
+        buckets=KELAS_BUCKETS,
+    )
+)
+problem_rooms = registry.register(
+    Histogram(
+        "solver_problem_rooms", "Jumlah ruangan per permintaan", buckets=RUANGAN_BUCKETS
+    )
+)
+problem_students = registry.register(
+    Histogram(
+        "solver_problem_students",
+        "Jumlah mahasiswa per permintaan",
+        buckets=MAHASISWA_BUCKETS,
+    )
+)
+search_time = registry.register(
+    Histogram(
+        "solver_search_time_seconds",
+        "search_time setiap run",
+        ("algorithm", "solver"),
+    )
+)
+evaluation_rate = registry.register(
+    Histogram(
+        "solver_evaluations_per_second",
+        "Evaluasi objective per detik setiap run",
+        ("algorithm", "solver"),
+        buckets=EVALUATION_RATE_BUCKETS,
+    )
+)
+
+
+def observe_problem(problem):
+    problem_classes.observe(len(problem.list_kelas))
+    problem_rooms.observe(len(problem.list_ruangan))
+    problem_students.observe(len(problem.list_kuliah_mahasiswa))
+
+
+def observe_results(algorithm: str, solver_cls: type, results: Optional[dict]):
+    for result in (results or {}).values():
+        search_time.observe(
+            result.search_time, algorithm=algorithm, solver=solver_cls.__name__
+        )
+        if result.perf is not None:
+            evaluation_rate.observe(
+                result.perf.evaluations_per_sec,
+                algorithm=algorithm,
+                solver=solver_cls.__name__,
+            )
+
+
+def observe_request(
+    algorithm: str, solver_cls: type, mode: str, status: str, duration: float
+):
+    solver = solver_cls.__name__
+    requests_total.inc(algorithm=algorithm, solver=solver, mode=mode, status=status)
+    request_duration.observe(duration, algorithm=algorithm, solver=solver, mode=mode)
+
+
+@contextmanager
+def track_request(algorithm: str, solver_cls: type, mode: str = "sync"):
+    mulai = perf_counter()
+    status = "error"
+    try:
+        yield
+        status = "ok"
+    finally:
+        observe_request(algorithm, solver_cls, mode, status, perf_counter() - mulai)
+
+
+@contextmanager
+def track_search(algorithm: str):
+    searches_in_flight.inc(algorithm=algorithm)
+    try:
+        yield
+    finally:
+        searches_in_flight.dec(algorithm=algorithm)
+
+
+def cache_collector(name: str, cache) -> Callable[[], list[Metric]]:
+    # Counter hit/miss dibaca langsung dari cache saat scrape
+    def collect() -> list[Metric]:
+        metrics = []
+        for field in ("hits", "misses", "shared"):
+            if not hasattr(cache, field):
+                continue
+            counter = Counter(
+                f"solver_{name}_cache_{field}_total", f"{field} pada cache {name}"
+            )
+            counter.inc(getattr(cache, field))
+            metrics.append(counter)
+        entries = Gauge(f"solver_{name}_cache_entries", f"Isi cache {name}")
+        entries.set(len(cache.items))
+        metrics.append(entries)
+        return metrics
+
+    return collect
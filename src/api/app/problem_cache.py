@@ -0,0 +1,57 @@
+from collections import OrderedDict
+from typing import Optional
+import hashlib
+import os
+import threading
+from .algorithms import Problem
+from .algorithms.state_model_parser import load_problem
+from .schemas import StateInputModel
+
+DEFAULT_PROBLEM_CACHE_SIZE = 16
+
+
+def problem_key(data: StateInputModel) -> str:
+    # Urutan field model tetap, sehingga JSON-nya kanonik untuk input yang sama
+    return hashlib.sha256(data.model_dump_json().encode()).hexdigest()
+
+
+class ProblemCache:
+    # LRU berisi Problem yang sudah tervalidasi beserta tabel turunannya
+    def __init__(self, max_size: Optional[int] = None):
+        if max_size is None:
+            max_size = int(
+                os.environ.get("PROBLEM_CACHE_SIZE", DEFAULT_PROBLEM_CACHE_SIZE)
+            )
+        self.max_size = max_size
+        self.items: OrderedDict[str, Problem] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, data: StateInputModel, key: Optional[str] = None) -> Problem:
+        if key is None:
+            key = problem_key(data)
+        with self.lock:
+            problem = self.items.get(key)
+            if problem is not None:
+                self.items.move_to_end(key)
+                self.hits += 1
+                return problem
+            self.misses += 1
+
+        # Problem invalid tidak disimpan, ValueError diteruskan ke pemanggil
+        problem = load_problem(data)
+        problem.validate()
+        if self.max_size < 1:
+            return problem
+
+        with self.lock:
+            self.items[key] = problem
+            self.items.move_to_end(key)
+            while len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+        return problem
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
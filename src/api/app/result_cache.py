@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+import hashlib
+import os
+import threading
+from .traces import TraceOptions
+
+DEFAULT_RESULT_CACHE_SIZE = 64
+
+
+def result_key(
+    problem_hash: str,
+    solver_cls: type,
+    kwargs: dict[str, Any],
+    runs: int,
+    traces: Optional[TraceOptions] = None,
+) -> str:
+    # Kelas solver sudah membedakan algoritma dan varian, kwargs berisi parameter dan seed
+    data = repr(
+        (problem_hash, solver_cls.__qualname__, sorted(kwargs.items()), runs, traces)
+    )
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class ResultCache:
+    # LRU hasil run ber-seed. Permintaan identik yang datang bersamaan menunggu
+    # satu komputasi yang sama (single-flight)
+    def __init__(self, max_size: Optional[int] = None):
+        if max_size is None:
+            max_size = int(
+                os.environ.get("RESULT_CACHE_SIZE", DEFAULT_RESULT_CACHE_SIZE)
+            )
+        self.max_size = max_size
+        self.items: OrderedDict[str, Any] = OrderedDict()
+        self.inflight: dict[str, Future] = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        with self.lock:
+            if key in self.items:
+                self.items.move_to_end(key)
+                self.hits += 1
+                return self.items[key]
+            future = self.inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self.inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.shared += 1
+        if not owner:
+            return future.result()
+
+        try:
+            result = compute()
+        except BaseException as e:
+            # Kegagalan tidak disimpan, permintaan berikutnya menghitung ulang
+            with self.lock:
+                del self.inflight[key]
+            future.set_exception(e)
+            raise
+
+        with self.lock:
+            del self.inflight[key]
+            if self.max_size > 0:
+                self.items[key] = result
+                while len(self.items) > self.max_size:
+                    self.items.popitem(last=False)
+        future.set_result(result)
+        return result
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
@@ -0,0 +1,102 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Optional
+import multiprocessing
+import os
+from .algorithms import Problem
+from .algorithms.progress import SolverProgress
+from .schemas import ResultsModel
+from .traces import TraceOptions, compact_result
+
+DEFAULT_RUNS = 3
+MAX_RUNS = 100
+
+
+def default_workers() -> int:
+    # Dapat diatur melalui environment variable SOLVER_WORKERS
+    value = os.environ.get("SOLVER_WORKERS")
+    if value is not None:
+        return max(1, int(value))
+    return os.cpu_count() or 1
+
+
+def run_solver(
+    solver_cls,
+    problem: Problem,
+    kwargs: dict[str, Any],
+    progress: Optional[SolverProgress] = None,
+    traces: Optional[TraceOptions] = None,
+) -> ResultsModel:
+    solver = solver_cls(problem, **kwargs)
+    solver.progress = progress
+    solver.search()
+    if progress is not None:
+        progress.flush()
+    result = solver.get_result()
+    # Trace diringkas di worker agar data yang dikirim antar proses juga kecil
+    if traces is not None:
+        result = compact_result(result, traces)
+    return result
+
+
+class SolverPool:
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self.executor: Optional[Executor] = None
+
+    def start(self):
+        if self.executor is not None:
+            return
+        workers = self.max_workers or default_workers()
+        if workers > 1:
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def run(
+        self,
+        solver_cls,
+        problem: Problem,
+        kwargs: dict[str, Any],
+        runs: int = DEFAULT_RUNS,
+        progress: Optional[list[SolverProgress]] = None,
+        traces: Optional[TraceOptions] = None,
+    ) -> dict[int, ResultsModel]:
+        if runs < 1 or runs > MAX_RUNS:
+            raise ValueError(f"Jumlah run harus di antara 1 dan {MAX_RUNS}")
+        if traces is not None:
+            traces.validate()
+        problem.validate()
+        if progress is None:
+            progress = [None] * runs
+        # Run ke-i memakai seed + i agar setiap run berbeda namun tetap dapat diulang.
+        # Tanpa seed, seed dasar diambil dari os.urandom agar run di worker mana pun
+        # tidak berbagi sumber acak
+        seed = kwargs.get("seed")
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "big")
+        run_kwargs = [{**kwargs, "seed": seed + i} for i in range(runs)]
+
+        # Tanpa pool (mis. belum startup atau satu worker), run dijalankan berurutan
+        if self.executor is None:
+            return {
+                i: run_solver(solver_cls, problem, run_kwargs[i], progress[i], traces)
+                for i in range(runs)
+            }
+
+        futures = [
+            self.executor.submit(
+                run_solver, solver_cls, problem, run_kwargs[i], progress[i], traces
+            )
+            for i in range(runs)
+        ]
+        try:
+            return {i: future.result() for i, future in enumerate(futures)}
+        finally:
+            for future in futures:
+                future.cancel()
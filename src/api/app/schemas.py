@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Union
 
 
 class KelasMataKuliahModel(BaseModel):
@@ -32,18 +32,39 @@ class SlotKuliahModel(BaseModel):
     waktu_akhir: int
 
 
+class PerfModel(BaseModel):
+    # Waktu dalam detik; evaluations_per_sec relatif terhadap search_time
+    evaluations: int
+    neighbors_proposed: int
+    neighbors_accepted: int
+    evaluation_time: float
+    move_time: float
+    copy_time: float
+    serialization_time: float
+    evaluations_per_sec: float
+
+
 class ResultsModel(BaseModel):
     alokasi_ruangan_awal: Dict[str, List[SlotKuliahModel]]
     alokasi_ruangan: Dict[str, List[SlotKuliahModel]]
     search_time: float
     iteration: int
     objective_over_iteration: List[float]
+    # Diisi jika trace di-downsample (max_points) atau di-encode (encoding)
+    trace_index: Optional[Dict[str, List[int]]] = None
+    trace_encoding: Optional[str] = None
+    encoded_traces: Optional[Dict[str, str]] = None
+    perf: Optional[PerfModel] = None
+    # None jika pencarian selesai menurut aturan berhenti algoritmanya
+    stop_reason: Optional[str] = None
 
 
 class SimulatedAnnealingResultsModel(ResultsModel):
     local_optima_stuck_count: int
     delta_energy_over_iteration: list[float]
     temperature_over_iteration: list[float]
+    replicas: Optional[int] = None
+    exchange_acceptance_rate: Optional[float] = None
 
 
 class SimulatedAnnealingResponseModel(BaseModel):
@@ -71,7 +92,53 @@ class GeneticAlgorithmResultsModel(BaseModel):
     objective_best_over_iteration: List[float]
     objective_avg_over_iteration: List[float]
     params: Dict[str, float]
+    trace_index: Optional[Dict[str, List[int]]] = None
+    trace_encoding: Optional[str] = None
+    encoded_traces: Optional[Dict[str, str]] = None
+    perf: Optional[PerfModel] = None
+    # None jika pencarian selesai menurut aturan berhenti algoritmanya
+    stop_reason: Optional[str] = None
 
 
 class GeneticAlgorithmResponseModel(BaseModel):
     run: Dict[int, GeneticAlgorithmResultsModel]
+
+
+class JobRequestModel(BaseModel):
+    algorithm: str
+    input: StateInputModel
+    params: Dict[str, Any] = {}
+    runs: int = 3
+    max_points: Optional[int] = None
+    encoding: str = "json"
+
+
+class RunProgressModel(BaseModel):
+    iteration: int
+    objective: float
+    best_objective: float
+    temperature: Optional[float] = None
+    best: Optional[float] = None
+    avg: Optional[float] = None
+    restart: Optional[int] = None
+
+
+class JobModel(BaseModel):
+    id: str
+    algorithm: str
+    status: str
+    runs: int
+    created_at: float
+    finished_at: Optional[float] = None
+    progress: Dict[int, RunProgressModel] = {}
+    result: Optional[
+        Dict[
+            int,
+            Union[
+                SimulatedAnnealingResultsModel,
+                HillClimbingResultsModel,
+                GeneticAlgorithmResultsModel,
+            ],
+        ]
+    ] = None
+    error: Optional[str] = None
@@ -0,0 +1,201 @@
+from typing import Any, Optional
+from .algorithms.simulated_annealing import (
+    SimulatedAnnealing,
+    ParallelTemperingSimulatedAnnealing,
+    DEFAULT_INITIAL_TEMP,
+    DEFAULT_DECAY_RATE,
+    DEFAULT_MIN_TEMP,
+    DEFAULT_EXCHANGE_INTERVAL,
+)
+from .algorithms.hill_climbing import (
+    SteepestAscentHillClimbing,
+    ExactSteepestAscentHillClimbing,
+    StochasticHillClimbing,
+    SidewaysMoveHillClimbing,
+    RandomRestartHillClimbing,
+    DEFAULT_MAX_SIDEWAYS,
+    DEFAULT_MAX_RESTART,
+    DEFAULT_NEIGHBORHOOD_SIZE,
+    DEFAULT_TARGET_OBJECTIVE,
+)
+from .algorithms.genetic_algorithm import GeneticAlgorithm, GAParams
+from .algorithms.budget import SearchBudget
+from .algorithms.stagnation import StagnationCriteria, DEFAULT_ACCEPTANCE_WINDOW
+
+# Setiap fungsi menerjemahkan parameter endpoint menjadi (kelas solver, kwargs)
+# yang dapat dikirim ke SolverPool
+
+SolverSpec = tuple[type, dict[str, Any]]
+
+
+def search_budget(
+    time_limit_s: Optional[float] = None,
+    max_evaluations: Optional[int] = None,
+    target_objective: Optional[float] = None,
+) -> SearchBudget:
+    budget = SearchBudget(
+        time_limit_s=time_limit_s,
+        max_evaluations=max_evaluations,
+        target_objective=target_objective,
+    )
+    budget.validate()
+    return budget
+
+
+def stagnation_criteria(**kwargs) -> StagnationCriteria:
+    criteria = StagnationCriteria(**kwargs)
+    criteria.validate()
+    return criteria
+
+
+def simulated_annealing_spec(
+    initial_temp: Optional[float] = None,
+    decay: Optional[float] = None,
+    replicas: int = 1,
+    min_temp: float = DEFAULT_MIN_TEMP,
+    exchange_interval: int = DEFAULT_EXCHANGE_INTERVAL,
+    seed: Optional[int] = None,
+    time_limit_s: Optional[float] = None,
+    max_evaluations: Optional[int] = None,
+    target_objective: Optional[float] = None,
+    patience: Optional[int] = None,
+    min_acceptance: Optional[float] = None,
+    acceptance_window: int = DEFAULT_ACCEPTANCE_WINDOW,
+) -> SolverSpec:
+    init_temp_value = initial_temp if initial_temp is not None else DEFAULT_INITIAL_TEMP
+    decay_value = decay if decay is not None else DEFAULT_DECAY_RATE
+
+    solver_kwargs = {
+        "initial_temp": init_temp_value,
+        "decay": decay_value,
+        "seed": seed,
+        "budget": search_budget(time_limit_s, max_evaluations, target_objective),
+        "stagnation": stagnation_criteria(
+            patience=patience,
+            min_acceptance=min_acceptance,
+            acceptance_window=acceptance_window,
+        ),
+    }
+    if replicas > 1:
+        solver_kwargs.update(
+            replicas=replicas,
+            min_temp=min_temp,
+            exchange_interval=exchange_interval,
+        )
+        return ParallelTemperingSimulatedAnnealing, solver_kwargs
+    return SimulatedAnnealing, solver_kwargs
+
+
+def hill_climbing_spec(
+    variant: str = "steepest",
+    max_sideways: Optional[int] = None,
+    max_restart: Optional[int] = None,
+    max_iterations_per_restart: Optional[int] = None,
+    neighborhood_size: int = DEFAULT_NEIGHBORHOOD_SIZE,
+    batched: bool = False,
+    restart_workers: int = 1,
+    target_objective: Optional[float] = None,
+    seed: Optional[int] = None,
+    time_limit_s: Optional[float] = None,
+    max_evaluations: Optional[int] = None,
+) -> SolverSpec:
+    variant_key = variant.lower()
+    budget = search_budget(time_limit_s, max_evaluations, target_objective)
+    if variant_key == "steepest":
+        return SteepestAscentHillClimbing, {
+            "neighborhood_size": neighborhood_size,
+            "batched": batched,
+            "seed": seed,
+            "budget": budget,
+        }
+    if variant_key == "steepest_exact":
+        return ExactSteepestAscentHillClimbing, {"seed": seed, "budget": budget}
+    if variant_key == "stochastic":
+        return StochasticHillClimbing, {"seed": seed, "budget": budget}
+    if variant_key == "sideways":
+        sideways_limit = (
+            max_sideways if max_sideways is not None else DEFAULT_MAX_SIDEWAYS
+        )
+        return SidewaysMoveHillClimbing, {
+            "max_sideways": sideways_limit,
+            "neighborhood_size": neighborhood_size,
+            "batched": batched,
+            "seed": seed,
+            "budget": budget,
+        }
+    if variant_key == "random_restart":
+        restart_limit = max_restart if max_restart is not None else DEFAULT_MAX_RESTART
+        target = (
+            target_objective
+            if target_objective is not None
+            else DEFAULT_TARGET_OBJECTIVE
+        )
+        return RandomRestartHillClimbing, {
+            "max_restart": restart_limit,
+            "max_iterations_per_restart": max_iterations_per_restart,
+            "neighborhood_size": neighborhood_size,
+            "batched": batched,
+            "workers": restart_workers,
+            "target_objective": target,
+            "seed": seed,
+            "budget": budget,
+        }
+    raise ValueError("Varian hill climbing tidak dikenal")
+
+
+def genetic_algorithm_spec(
+    population_size: int = 50,
+    max_generations: int = 200,
+    crossover_rate: float = 0.9,
+    mutation_rate: float = 0.2,
+    tournament_k: int = 3,
+    elitism: int = 1,
+    islands: int = 1,
+    migration_interval: int = 10,
+    migrants: int = 2,
+    migration_topology: str = "ring",
+    seed: Optional[int] = None,
+    time_limit_s: Optional[float] = None,
+    max_evaluations: Optional[int] = None,
+    target_objective: Optional[float] = None,
+    patience: Optional[int] = None,
+    min_diversity: Optional[float] = None,
+) -> SolverSpec:
+    params = GAParams(
+        population_size=population_size,
+        max_generations=max_generations,
+        crossover_rate=crossover_rate,
+        mutation_rate=mutation_rate,
+        tournament_k=tournament_k,
+        elitism=elitism,
+        islands=islands,
+        migration_interval=migration_interval,
+        migrants=migrants,
+        migration_topology=migration_topology,
+    )
+    return GeneticAlgorithm, {
+        "params": params,
+        "seed": seed,
+        "budget": search_budget(time_limit_s, max_evaluations, target_objective),
+        "stagnation": stagnation_criteria(
+            patience=patience, min_diversity=min_diversity
+        ),
+    }
+
+
+SOLVER_SPECS = {
+    "sim-anneal": simulated_annealing_spec,
+    "hill-climbing": hill_climbing_spec,
+    "genetic-algorithm": genetic_algorithm_spec,
+}
+
+
+def solver_spec(algorithm: str, params: dict[str, Any]) -> SolverSpec:
+    if algorithm not in SOLVER_SPECS:
+        raise ValueError(
+            f"Algoritma harus salah satu dari {', '.join(SOLVER_SPECS.keys())}"
+        )
+    try:
+        return SOLVER_SPECS[algorithm](**params)
+    except TypeError as e:
+        raise ValueError(f"Parameter {algorithm} tidak valid: {e}")
@@ -0,0 +1,46 @@
+import asyncio
+import json
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+from .jobs import Job, JobManager
+
+STREAM_INTERVAL = 0.5
+
+
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def job_events(
+    job_manager: JobManager,
+    job: Job,
+    request: Request,
+    cancel_on_disconnect: bool = False,
+):
+    # Server-Sent Events: "job" berisi ID job, "progress" setiap ada perubahan
+    # progres run, lalu "result" berisi JobModel lengkap sebagai event terakhir
+    terakhir: dict[int, dict] = {}
+    yield _sse("job", json.dumps({"id": job.id}))
+    try:
+        while True:
+            if await request.is_disconnected():
+                if cancel_on_disconnect:
+                    job_manager.cancel(job.id)
+                return
+
+            selesai = job.finished()
+            progress = await run_in_threadpool(job_manager.read_progress, job)
+            for run, snapshot in sorted(progress.items()):
+                if terakhir.get(run) != snapshot:
+                    terakhir[run] = snapshot
+                    yield _sse("progress", json.dumps({"run": run, **snapshot}))
+
+            if selesai:
+                model = await run_in_threadpool(job_manager.to_model, job)
+                yield _sse("result", model.model_dump_json())
+                return
+            await asyncio.sleep(STREAM_INTERVAL)
+    except asyncio.CancelledError:
+        if cancel_on_disconnect:
+            job_manager.cancel(job.id)
+        raise
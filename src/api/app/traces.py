@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from typing import Optional
+import base64
+import numpy as np
+from pydantic import BaseModel
+
+TRACE_FIELDS = (
+    "objective_over_iteration",
+    "delta_energy_over_iteration",
+    "temperature_over_iteration",
+    "objective_best_over_iteration",
+    "objective_avg_over_iteration",
+)
+TRACE_ENCODINGS = ("json", "float32", "delta")
+MIN_POINTS = 3
+
+
+@dataclass(frozen=True)
+class TraceOptions:
+    # max_points: batas titik per trace (LTTB), encoding: format trace pada respons
+    max_points: Optional[int] = None
+    encoding: str = "json"
+
+    def validate(self):
+        if self.max_points is not None and self.max_points < MIN_POINTS:
+            raise ValueError(f"max_points minimal {MIN_POINTS}")
+        if self.encoding not in TRACE_ENCODINGS:
+            raise ValueError(
+                f"Encoding trace harus salah satu dari {', '.join(TRACE_ENCODINGS)}"
+            )
+
+    def active(self) -> bool:
+        return self.max_points is not None or self.encoding != "json"
+
+
+def lttb(values: np.ndarray, n: int) -> np.ndarray:
+    # Largest-Triangle-Three-Buckets, mengembalikan indeks titik yang dipertahankan.
+    # Titik pertama dan terakhir selalu ikut
+    size = len(values)
+    if n >= size:
+        return np.arange(size)
+
+    x = np.arange(size, dtype=np.float64)
+    y = values.astype(np.float64)
+    batas = np.linspace(1, size - 1, n - 1).astype(np.int64)
+    res = np.empty(n, dtype=np.int64)
+    res[0] = 0
+    res[-1] = size - 1
+
+    a = 0
+    for i in range(n - 2):
+        awal, akhir = batas[i], batas[i + 1]
+        # Rata-rata bucket berikutnya menjadi titik ketiga segitiga
+        berikut_akhir = batas[i + 2] if i + 2 < n - 1 else size
+        cx = x[akhir:berikut_akhir].mean()
+        cy = y[akhir:berikut_akhir].mean()
+
+        luas = np.abs(
+            (x[a] - cx) * (y[awal:akhir] - y[a]) - (x[a] - x[awal:akhir]) * (cy - y[a])
+        )
+        a = awal + int(np.argmax(luas))
+        res[i + 1] = a
+    return res
+
+
+def encode_trace(values: np.ndarray, encoding: str) -> str:
+    # float32 little-endian dalam base64; "delta" menyimpan selisih antar titik
+    # sehingga decode dilakukan dengan cumulative sum
+    if encoding == "delta":
+        values = np.diff(values, prepend=0.0)
+    return base64.b64encode(values.astype("<f4").tobytes()).decode("ascii")
+
+
+def compact_result(result: BaseModel, options: TraceOptions) -> BaseModel:
+    if not options.active():
+        return result
+
+    update = {}
+    trace_index: dict[str, list[int]] = {}
+    encoded_traces: dict[str, str] = {}
+    for name in TRACE_FIELDS:
+        values = getattr(result, name, None)
+        if values is None:
+            continue
+        values = np.asarray(values, dtype=np.float64)
+
+        if options.max_points is not None and len(values) > options.max_points:
+            index = lttb(values, options.max_points)
+            values = values[index]
+            trace_index[name] = index.tolist()
+
+        if options.encoding == "json":
+            update[name] = values.tolist()
+        else:
+            encoded_traces[name] = encode_trace(values, options.encoding)
+            update[name] = []
+
+    if trace_index:
+        update["trace_index"] = trace_index
+    if encoded_traces:
+        update["trace_encoding"] = options.encoding
+        update["encoded_traces"] = encoded_traces
+    return result.model_copy(update=update)
@@ -0,0 +1,204 @@
+import argparse
+import json
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from fastapi.testclient import TestClient
+from .instances import add_generator_arguments, generate_size, generator_kwargs
+
+# Parameter ringan agar satu request selesai dalam hitungan detik pada ukuran besar
+DEFAULT_PARAMS = {
+    "sim-anneal": {"decay": 0.99},
+    "hill-climbing": {"variant": "steepest"},
+    "genetic-algorithm": {"population_size": 20, "max_generations": 20},
+}
+DEFAULT_SIZES = ["small", "medium"]
+DEFAULT_CONCURRENCY = [1, 4]
+DEFAULT_REQUESTS = 8
+PERCENTILES = (50, 90, 99)
+
+
+def _parse_params(values: list[str]) -> dict[str, dict]:
+    # Format: <algoritma>:<nama>=<nilai>, mis. sim-anneal:decay=0.999
+    params = {algoritma: dict(p) for algoritma, p in DEFAULT_PARAMS.items()}
+    for value in values or []:
+        algoritma, _, pasangan = value.partition(":")
+        nama, _, nilai = pasangan.partition("=")
+        if algoritma not in params or not nama:
+            raise ValueError(f"Parameter tidak valid: {value}")
+        params[algoritma][nama] = nilai
+    return params
+
+
+def run_scenario(
+    client: TestClient,
+    algorithm: str,
+    payload: dict,
+    params: dict,
+    concurrency: int,
+    requests: int,
+    runs: int,
+    seed: int,
+) -> dict:
+    # Seed berbeda per request (dan antar skenario) agar result cache tidak ikut terukur
+    def kirim(i: int):
+        query = {**params, "runs": runs, "seed": seed + i * runs, "max_points": 3}
+        mulai = time.perf_counter()
+        response = client.post(f"/api/{algorithm}", params=query, json=payload)
+        latency = time.perf_counter() - mulai
+        if response.status_code != 200:
+            raise RuntimeError(f"{algorithm} {response.status_code}: {response.text}")
+        search_time = [r["search_time"] for r in response.json()["run"].values()]
+        return latency, search_time
+
+    mulai = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        hasil = list(executor.map(kirim, range(requests)))
+    wall = time.perf_counter() - mulai
+
+    latency = np.array([h[0] for h in hasil])
+    search_time = np.array([t for h in hasil for t in h[1]])
+    return {
+        "requests": requests,
+        "wall_seconds": wall,
+        "throughput_rps": requests / wall,
+        **{f"latency_p{p}": float(np.percentile(latency, p)) for p in PERCENTILES},
+        "latency_mean": float(latency.mean()),
+        "search_time_mean": float(search_time.mean()),
+        "search_time_max": float(search_time.max()),
+    }
+
+
+def format_table(results: list[dict]) -> str:
+    kolom = [
+        ("size", "{:>12}"),
+        ("algorithm", "{:>17}"),
+        ("concurrency", "{:>4}"),
+        ("throughput_rps", "{:>8.2f}"),
+        ("latency_p50", "{:>8.3f}"),
+        ("latency_p90", "{:>8.3f}"),
+        ("latency_p99", "{:>8.3f}"),
+        ("search_time_mean", "{:>8.3f}"),
+    ]
+    judul = [
+        "size",
+        "algorithm",
+        "conc",
+        "rps",
+        "p50(s)",
+        "p90(s)",
+        "p99(s)",
+        "search(s)",
+    ]
+    lebar = [len(fmt.format(r[nama])) for nama, fmt in kolom for r in results[:1]]
+    baris = [" ".join(j.rjust(w) for j, w in zip(judul, lebar))]
+    for r in results:
+        baris.append(" ".join(fmt.format(r[nama]) for nama, fmt in kolom))
+    return "\n".join(baris)
+
+
+def run(
+    sizes: list[str],
+    algorithms: list[str],
+    concurrency: list[int],
+    requests: int,
+    runs: int,
+    params: dict[str, dict],
+    seed: int,
+    instance_kwargs: dict,
+) -> dict:
+    from app.main import app
+
+    results = []
+    seed_request = 0
+    with TestClient(app) as client:
+        for size in sizes:
+            instance = generate_size(size, seed, **instance_kwargs)
+            payload = instance.model_dump()
+            info = {
+                "size": size,
+                "n_kelas": len(instance.kelas_mata_kuliah),
+                "n_mahasiswa": len(instance.mahasiswa),
+                "n_ruangan": len(instance.ruangan),
+                "n_pertemuan": sum(k.sks for k in instance.kelas_mata_kuliah),
+            }
+            for algorithm in algorithms:
+                # Request pemanasan: parsing problem dan start worker tidak ikut terukur
+                run_scenario(
+                    client, algorithm, payload, params[algorithm], 1, 1, 1, seed_request
+                )
+                seed_request += 1
+                for c in concurrency:
+                    hasil = run_scenario(
+                        client,
+                        algorithm,
+                        payload,
+                        params[algorithm],
+                        c,
+                        requests,
+                        runs,
+                        seed_request,
+                    )
+                    seed_request += requests * runs
+                    results.append(
+                        {**info, "algorithm": algorithm, "concurrency": c, **hasil}
+                    )
+                    print(format_table(results[-1:]).splitlines()[-1], file=sys.stderr)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "runs": runs,
+            "params": params,
+            "instance": instance_kwargs,
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skala endpoint solver")
+    parser.add_argument(
+        "--size",
+        action="append",
+        help="small, medium, large, atau <kelas>x<mahasiswa> (default: small, medium)",
+    )
+    parser.add_argument("--algorithm", action="append", choices=DEFAULT_PARAMS.keys())
+    parser.add_argument("--concurrency", action="append", type=int)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument(
+        "--param",
+        action="append",
+        help="parameter endpoint, mis. sim-anneal:decay=0.999",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file JSON hasil, default stdout")
+    add_generator_arguments(parser)
+    args = parser.parse_args()
+
+    report = run(
+        args.size or DEFAULT_SIZES,
+        args.algorithm or list(DEFAULT_PARAMS.keys()),
+        args.concurrency or DEFAULT_CONCURRENCY,
+        args.requests,
+        args.runs,
+        _parse_params(args.param),
+        args.seed,
+        generator_kwargs(args),
+    )
+    print(format_table(report["results"]), file=sys.stderr)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
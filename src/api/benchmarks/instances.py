@@ -0,0 +1,158 @@
+import argparse
+import json
+import math
+import random
+import sys
+from typing import Optional
+from app.algorithms.state import N_WAKTU
+from app.schemas import StateInputModel
+
+# Ukuran instance standar: (jumlah kelas, jumlah mahasiswa)
+SIZES = {
+    "small": (50, 500),
+    "medium": (250, 5000),
+    "large": (1000, 20000),
+}
+PRIORITY_DISTRIBUTIONS = ("uniform", "popularity")
+
+DEFAULT_SKEW = 1.5
+DEFAULT_ROOM_SLACK = 1.2
+DEFAULT_CAPACITY_RATIO = 1.0
+
+
+def generate_instance(
+    n_kelas: int,
+    n_mahasiswa: int,
+    seed: int = 0,
+    min_mk: int = 4,
+    max_mk: int = 8,
+    max_sks: int = 4,
+    skew: Optional[float] = DEFAULT_SKEW,
+    priority: str = "uniform",
+    n_ruangan: Optional[int] = None,
+    room_slack: float = DEFAULT_ROOM_SLACK,
+    capacity_ratio: float = DEFAULT_CAPACITY_RATIO,
+) -> StateInputModel:
+    # Instance sintetis yang selalu valid dan sama untuk seed yang sama.
+    # skew: parameter Pareto popularitas kelas (None berarti seragam, makin kecil makin timpang)
+    # priority: "uniform" acak, "popularity" kelas populer cenderung berprioritas tinggi
+    # room_slack: rasio slot ruangan terhadap jumlah pertemuan jika n_ruangan tidak diisi
+    # capacity_ratio: skala kuota ruangan terhadap ukuran kelas, < 1 berarti lebih ketat
+    if priority not in PRIORITY_DISTRIBUTIONS:
+        raise ValueError(
+            f"Distribusi prioritas harus salah satu dari {', '.join(PRIORITY_DISTRIBUTIONS)}"
+        )
+    if n_kelas < 1 or n_mahasiswa < 0 or max_sks < 1 or min_mk > max_mk:
+        raise ValueError("Ukuran instance tidak valid")
+
+    r = random.Random(seed)
+    sks = [r.randint(1, max_sks) for _ in range(n_kelas)]
+    terdaftar = [0] * n_kelas
+
+    if skew is None:
+        bobot_kelas = [1.0] * n_kelas
+    else:
+        bobot_kelas = [r.paretovariate(skew) for _ in range(n_kelas)]
+    mahasiswa = []
+    for nim in range(n_mahasiswa):
+        k = min(r.randint(min_mk, max_mk), n_kelas)
+        daftar = set()
+        while len(daftar) < k:
+            daftar.update(r.choices(range(n_kelas), weights=bobot_kelas, k=k))
+        daftar = r.sample(sorted(daftar), k)
+        for i in daftar:
+            terdaftar[i] += 1
+
+        if priority == "popularity":
+            # Diurutkan dengan bobot acak agar tetap ada variasi antar mahasiswa
+            urutan = sorted(
+                range(k), key=lambda j: -bobot_kelas[daftar[j]] * r.random()
+            )
+            prioritas = [0] * k
+            for prio, j in enumerate(urutan, 1):
+                prioritas[j] = prio
+        else:
+            prioritas = list(range(1, k + 1))
+            r.shuffle(prioritas)
+        mahasiswa.append(
+            {
+                "nim": f"{nim:08d}",
+                "daftar_mk": [f"K{i:04d}" for i in daftar],
+                "prioritas": prioritas,
+            }
+        )
+
+    ukuran_kelas = [max(1, terdaftar[i] + r.randint(0, 5)) for i in range(n_kelas)]
+    kelas = [
+        {"kode": f"K{i:04d}", "jumlah_mahasiswa": ukuran_kelas[i], "sks": sks[i]}
+        for i in range(n_kelas)
+    ]
+
+    if n_ruangan is None:
+        n_ruangan = max(1, math.ceil(sum(sks) * room_slack / N_WAKTU))
+    # Kuota mengikuti sebaran ukuran kelas sehingga kelas besar tetap punya ruangan
+    ruangan = [
+        {
+            "kode": f"R{i:03d}",
+            "kuota": max(1, round(r.choice(ukuran_kelas) * capacity_ratio)),
+        }
+        for i in range(n_ruangan)
+    ]
+    return StateInputModel(
+        kelas_mata_kuliah=kelas, ruangan=ruangan, mahasiswa=mahasiswa
+    )
+
+
+def parse_size(size: str) -> tuple[int, int]:
+    # Nama ukuran standar atau "<kelas>x<mahasiswa>", mis. 500x10000
+    if size in SIZES:
+        return SIZES[size]
+    try:
+        n_kelas, n_mahasiswa = (int(x) for x in size.lower().split("x"))
+    except ValueError:
+        raise ValueError(
+            f"Ukuran harus salah satu dari {', '.join(SIZES.keys())} atau <kelas>x<mahasiswa>"
+        )
+    return n_kelas, n_mahasiswa
+
+
+def generate_size(size: str, seed: int = 0, **kwargs) -> StateInputModel:
+    n_kelas, n_mahasiswa = parse_size(size)
+    return generate_instance(n_kelas, n_mahasiswa, seed, **kwargs)
+
+
+def add_generator_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--max-sks", type=int, default=4)
+    parser.add_argument(
+        "--skew", type=float, default=DEFAULT_SKEW, help="0 berarti seragam"
+    )
+    parser.add_argument("--priority", choices=PRIORITY_DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--rooms", type=int, help="default: dari --room-slack")
+    parser.add_argument("--room-slack", type=float, default=DEFAULT_ROOM_SLACK)
+    parser.add_argument("--capacity-ratio", type=float, default=DEFAULT_CAPACITY_RATIO)
+
+
+def generator_kwargs(args: argparse.Namespace) -> dict:
+    return {
+        "max_sks": args.max_sks,
+        "skew": args.skew or None,
+        "priority": args.priority,
+        "n_ruangan": args.rooms,
+        "room_slack": args.room_slack,
+        "capacity_ratio": args.capacity_ratio,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generator payload StateInputModel")
+    parser.add_argument("size", help="small, medium, large, atau <kelas>x<mahasiswa>")
+    parser.add_argument("--seed", type=int, default=0)
+    add_generator_arguments(parser)
+    args = parser.parse_args()
+
+    instance = generate_size(args.size, args.seed, **generator_kwargs(args))
+    json.dump(instance.model_dump(), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Optional
+import numpy as np
+from app.algorithms.state_model_parser import load_problem
+from app.algorithms.state import State
+from app.algorithms.hill_climbing import HillClimbingState
+from app.algorithms.simulated_annealing import (
+    SimulatedAnnealing,
+    SimulatedAnnealingState,
+)
+from app.algorithms.genetic_algorithm import GAState
+from .instances import SIZES, generate_size
+
+DEFAULT_MIN_TIME = 1.0
+DEFAULT_TOLERANCE = 0.2
+DEFAULT_SEED = 0
+SA_TEMPERATURE = 10.0
+GA_POPULATION = 50
+GA_ELITISM = 2
+
+
+def measure(
+    step: Callable[[], object],
+    reset: Optional[Callable[[], None]] = None,
+    min_time: float = DEFAULT_MIN_TIME,
+    min_calls: int = 5,
+) -> dict:
+    # step dipanggil berulang sampai min_time, hanya waktu step yang dihitung.
+    # Jika step mengembalikan False, reset dipanggil di luar pengukuran
+    calls = 0
+    elapsed = 0.0
+    while elapsed < min_time or calls < min_calls:
+        mulai = time.perf_counter()
+        lanjut = step()
+        elapsed += time.perf_counter() - mulai
+        calls += 1
+        if lanjut is False and reset is not None:
+            reset()
+
+    # Memori puncak diukur terpisah karena tracemalloc memperlambat eksekusi
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    for _ in range(min(calls, min_calls)):
+        if step() is False and reset is not None:
+            reset()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "calls": calls,
+        "seconds": elapsed,
+        "ops_per_sec": calls / elapsed,
+        "mean_us": elapsed / calls * 1e6,
+        "peak_memory_bytes": max(0, peak - base),
+    }
+
+
+def hot_paths(problem, seed: int) -> dict[str, tuple[Callable, Optional[Callable]]]:
+    rng = random.Random(seed)
+
+    state = State(problem, randomizer=random.Random(rng.getrandbits(64)))
+    state.seed_jadwal()
+
+    hc = HillClimbingState(problem, randomizer=random.Random(rng.getrandbits(64)))
+    hc.seed_jadwal()
+
+    sa = SimulatedAnnealingState(problem, randomizer=random.Random(rng.getrandbits(64)))
+    sa.seed_jadwal()
+
+    ga = GAState(problem, random.Random(rng.getrandbits(64)))
+    population = ga.seed_population(GA_POPULATION)
+    p1, p2 = population.genome[0], population.genome[1]
+    anak1, anak2 = np.empty_like(p1), np.empty_like(p2)
+    mutan = p1.copy()
+
+    solver = SimulatedAnnealing(problem, seed=rng.getrandbits(64))
+    solver.jadwal = state.jadwal
+
+    return {
+        "State.objective": (state.objective, None),
+        "State._tabrakan_jadwal_mahasiswa": (state._tabrakan_jadwal_mahasiswa, None),
+        "State._tabrakan_ruangan_berbobot": (state._tabrakan_ruangan_berbobot, None),
+        "State._kuota_kelas": (state._kuota_kelas, None),
+        # Local optimum mengakhiri pendakian, state di-seed ulang di luar pengukuran
+        "HillClimbingState.next": (
+            lambda: hc.next().move_accepted,
+            hc.seed_jadwal,
+        ),
+        "SimulatedAnnealingState.next": (lambda: sa.next(SA_TEMPERATURE), None),
+        "GAState.crossover": (lambda: ga.crossover(p1, p2, anak1, anak2), None),
+        "GAState.mutate": (lambda: ga.mutate(mutan, 1.0), None),
+        "GAState.elitism": (lambda: ga.elitism(population, GA_ELITISM), None),
+        "PopulationEvaluator.objective": (
+            lambda: ga.evaluator.objective(population.genome),
+            None,
+        ),
+        "Solver._form_alokasi_ruangan": (
+            lambda: solver._form_alokasi_ruangan(solver.jadwal),
+            None,
+        ),
+    }
+
+
+def run(
+    sizes: list[str],
+    seed: int = DEFAULT_SEED,
+    min_time: float = DEFAULT_MIN_TIME,
+    only: Optional[list[str]] = None,
+) -> dict:
+    results = []
+    for size in sizes:
+        mulai = time.perf_counter()
+        problem = load_problem(generate_size(size, seed))
+        problem.validate()
+        setup_time = time.perf_counter() - mulai
+
+        for name, (step, reset) in hot_paths(problem, seed).items():
+            if only and not any(pola in name for pola in only):
+                continue
+            hasil = measure(step, reset, min_time)
+            results.append(
+                {
+                    "size": size,
+                    "benchmark": name,
+                    "n_kelas": len(problem.list_kelas),
+                    "n_mahasiswa": len(problem.list_kuliah_mahasiswa),
+                    "n_ruangan": len(problem.list_ruangan),
+                    "setup_seconds": setup_time,
+                    **hasil,
+                }
+            )
+            print(
+                f"{size:>6} {name:<36} {hasil['ops_per_sec']:>12.1f} ops/s "
+                f"{hasil['peak_memory_bytes'] / 1024:>10.1f} KiB",
+                file=sys.stderr,
+            )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": seed,
+            "min_time": min_time,
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    # Benchmark dianggap regresi jika ops/sec turun lebih dari tolerance
+    lama = {(r["size"], r["benchmark"]): r for r in baseline["results"]}
+    regresi = []
+    for r in report["results"]:
+        dasar = lama.get((r["size"], r["benchmark"]))
+        if dasar is None:
+            continue
+        rasio = r["ops_per_sec"] / dasar["ops_per_sec"]
+        r["baseline_ops_per_sec"] = dasar["ops_per_sec"]
+        r["ratio"] = rasio
+        if rasio < 1 - tolerance:
+            regresi.append(f"{r['size']} {r['benchmark']}: {rasio:.2f}x baseline")
+    return regresi
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark hot path solver")
+    parser.add_argument(
+        "--size", action="append", choices=SIZES.keys(), help="default: semua ukuran"
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument(
+        "--only", action="append", help="hanya benchmark yang namanya memuat teks ini"
+    )
+    parser.add_argument("--output", help="file JSON hasil, default stdout")
+    parser.add_argument(
+        "--baseline", help="file JSON hasil sebelumnya untuk dibandingkan"
+    )
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    report = run(args.size or list(SIZES.keys()), args.seed, args.min_time, args.only)
+    regresi = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regresi = compare(report, json.load(f), args.tolerance)
+        report["regressions"] = regresi
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+    for pesan in regresi:
+        print(f"REGRESI {pesan}", file=sys.stderr)
+    if regresi:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
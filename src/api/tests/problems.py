@@ -0,0 +1,47 @@
+import random
+from app.algorithms.state import Problem, KelasMataKuliah, Ruangan, KuliahMahasiswa
+
+
+def random_problem(
+    seed: int,
+    n_kelas: int = 8,
+    n_ruangan: int = 3,
+    n_mahasiswa: int = 30,
+    max_mk: int = 4,
+    max_sks: int = 3,
+    ganda: float = 0.1,
+    kelas_kosong: int = 0,
+) -> Problem:
+    # Instance kecil yang valid. ganda: peluang mahasiswa mengambil kelas yang sama
+    # dua kali, kelas_kosong: jumlah kelas terakhir yang tidak diambil mahasiswa.
+    # Kuota ruangan sengaja dibuat lebih kecil dari sebagian kelas
+    rng = random.Random(seed)
+    kode_kelas = [f"K{i}" for i in range(n_kelas)]
+    diambil = kode_kelas[: n_kelas - kelas_kosong]
+
+    list_kuliah_mahasiswa = []
+    jumlah = {kode: 0 for kode in kode_kelas}
+    for j in range(n_mahasiswa if diambil else 0):
+        daftar = rng.sample(diambil, k=min(len(diambil), rng.randint(1, max_mk)))
+        if rng.random() < ganda:
+            daftar.append(daftar[0])
+        for kode in daftar:
+            jumlah[kode] += 1
+        list_kuliah_mahasiswa.append(
+            KuliahMahasiswa(
+                nim=f"M{j}",
+                prio_mata_kuliah={i + 1: kode for i, kode in enumerate(daftar)},
+            )
+        )
+
+    list_kelas = [
+        KelasMataKuliah(kode, max(1, jumlah[kode]), rng.randint(1, max_sks))
+        for kode in kode_kelas
+    ]
+    terbesar = max(kelas.jumlah_mahasiswa for kelas in list_kelas)
+    list_ruangan = [
+        Ruangan(f"R{i}", rng.randint(1, terbesar)) for i in range(n_ruangan)
+    ]
+    problem = Problem(list_kelas, list_ruangan, list_kuliah_mahasiswa)
+    problem.validate()
+    return problem
@@ -0,0 +1,91 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app, result_cache
+from benchmarks.instances import generate_instance
+
+client = TestClient(app)
+PAYLOAD = generate_instance(6, 20, seed=0).model_dump()
+
+
+def _post(**params):
+    response = client.post("/api/hill-climbing", json=PAYLOAD, params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_seeded_request_is_cached():
+    hits = result_cache.hits
+    _post(seed=7, runs=1)
+    _post(seed=7, runs=1)
+    assert result_cache.hits == hits + 1
+
+
+def test_time_limited_request_bypasses_cache():
+    hits, misses = result_cache.hits, result_cache.misses
+    _post(seed=8, runs=1, time_limit_s=5)
+    _post(seed=8, runs=1, time_limit_s=5)
+    assert (result_cache.hits, result_cache.misses) == (hits, misses)
+
+
+def test_parallel_restart_request_bypasses_cache():
+    hits, misses = result_cache.hits, result_cache.misses
+    params = dict(variant="random_restart", max_restart=2, restart_workers=2)
+    _post(seed=9, runs=1, **params)
+    _post(seed=9, runs=1, **params)
+    assert (result_cache.hits, result_cache.misses) == (hits, misses)
+
+
+@pytest.mark.parametrize("variant", ["steepest", "sideways", "random_restart"])
+def test_non_positive_neighborhood_size_is_rejected(variant):
+    response = client.post(
+        "/api/hill-climbing",
+        json=PAYLOAD,
+        params=dict(variant=variant, neighborhood_size=0, batched=True, seed=1),
+    )
+    assert response.status_code == 400
+
+
+def test_non_positive_restart_workers_is_rejected():
+    response = client.post(
+        "/api/hill-climbing",
+        json=PAYLOAD,
+        params=dict(variant="random_restart", restart_workers=0, seed=1),
+    )
+    assert response.status_code == 400
+
+
+def test_empty_population_is_rejected():
+    response = client.post(
+        "/api/genetic-algorithm",
+        json=PAYLOAD,
+        params=dict(population_size=0, seed=1),
+    )
+    assert response.status_code == 400
+    assert "populasi" in response.json()["detail"]
+    assert "pulau" not in response.json()["detail"]
+
+
+@pytest.mark.parametrize(
+    "algorithm, params",
+    [
+        ("genetic-algorithm", dict(population_size=4, islands=8)),
+        ("sim-anneal", dict(replicas=4, exchange_interval=0)),
+        ("hill-climbing", dict(variant="random_restart", restart_workers=0)),
+    ],
+)
+def test_job_with_invalid_solver_params_is_rejected(algorithm, params):
+    response = client.post(
+        "/api/jobs",
+        json=dict(algorithm=algorithm, input=PAYLOAD, params=params, runs=1),
+    )
+    assert response.status_code == 400
+
+
+def test_job_with_valid_params_is_accepted():
+    response = client.post(
+        "/api/jobs",
+        json=dict(
+            algorithm="hill-climbing", input=PAYLOAD, params=dict(seed=1), runs=1
+        ),
+    )
+    assert response.status_code == 200
@@ -0,0 +1,88 @@
+import random
+import numpy as np
+import pytest
+from app.algorithms import (
+    SteepestAscentHillClimbing,
+    SidewaysMoveHillClimbing,
+    State,
+    compile_problem,
+    NeighborhoodEvaluator,
+)
+from app.algorithms.state import Problem, KelasMataKuliah, Ruangan
+from .problems import random_problem
+
+PROBLEMS = [
+    pytest.param(dict(seed=0), id="students"),
+    pytest.param(dict(seed=1, ganda=0.5), id="double-enrollment"),
+    pytest.param(dict(seed=2, kelas_kosong=3), id="partly-studentless"),
+    pytest.param(dict(seed=3, n_mahasiswa=0), id="studentless"),
+]
+
+
+def _seeded_state(problem: Problem, seed: int) -> State:
+    state = State(problem, randomizer=random.Random(seed))
+    state.seed_jadwal()
+    state.init_delta()
+    return state
+
+
+@pytest.mark.parametrize("kwargs", PROBLEMS)
+def test_delta_swaps_match_state(kwargs):
+    problem = random_problem(**kwargs)
+    state = _seeded_state(problem, 10)
+    compiled = compile_problem(problem)
+    evaluator = NeighborhoodEvaluator(compiled, compiled.compile_jadwal(state.jadwal))
+
+    rng = np.random.default_rng(0)
+    pertemuan1 = rng.integers(compiled.n_pertemuan, size=200)
+    pertemuan2 = rng.integers(compiled.n_pertemuan, size=200)
+    deltas = evaluator.delta_swaps(pertemuan1, pertemuan2)
+
+    assert deltas.dtype == np.float64
+    for p, q, delta in zip(pertemuan1, pertemuan2, deltas):
+        expected = state.delta_swap(
+            compiled.kode_kelas[compiled.kelas_pertemuan[p]],
+            int(evaluator.slot_pertemuan(p)),
+            compiled.kode_kelas[compiled.kelas_pertemuan[q]],
+            int(evaluator.slot_pertemuan(q)),
+        )
+        assert delta == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("kwargs", PROBLEMS)
+def test_delta_moves_match_state(kwargs):
+    problem = random_problem(**kwargs)
+    state = _seeded_state(problem, 11)
+    compiled = compile_problem(problem)
+    evaluator = NeighborhoodEvaluator(compiled, compiled.compile_jadwal(state.jadwal))
+
+    rng = np.random.default_rng(1)
+    pertemuan = rng.integers(compiled.n_pertemuan, size=200)
+    slot_to = rng.integers(problem.n_slot, size=200)
+    deltas = evaluator.delta_moves(pertemuan, slot_to)
+
+    assert deltas.dtype == np.float64
+    for p, slot, delta in zip(pertemuan, slot_to, deltas):
+        expected = state.delta_move(
+            int(evaluator.slot_pertemuan(p)),
+            compiled.kode_kelas[compiled.kelas_pertemuan[p]],
+            int(slot),
+        )
+        assert delta == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "solver_cls", [SteepestAscentHillClimbing, SidewaysMoveHillClimbing]
+)
+def test_batched_hill_climbing_without_students(solver_cls):
+    problem = Problem(
+        [KelasMataKuliah("A", 10, 2), KelasMataKuliah("B", 5, 1)],
+        [Ruangan("R1", 8)],
+        [],
+    )
+    solver = solver_cls(problem, seed=1, batched=True)
+    solver.search()
+    result = solver.get_result()
+    assert State(problem, solver.jadwal).objective() == pytest.approx(
+        result.objective_over_iteration[-1]
+    )
@@ -0,0 +1,66 @@
+import random
+import pytest
+from app.algorithms import ExactHillClimbingState
+from app.algorithms.state_model_parser import load_problem
+from benchmarks.instances import generate_instance
+from .problems import random_problem
+
+
+def _brute_force_best(state: ExactHillClimbingState) -> float:
+    # Delta terbaik atas seluruh swap dua pertemuan dan move ke slot kosong
+    compiled = state.queue.compiled
+    pertemuan = [state._slot_pertemuan(p) for p in range(compiled.n_pertemuan)]
+    best = float("inf")
+    for kode1, slot1 in pertemuan:
+        for kode2, slot2 in pertemuan:
+            if kode1 != kode2 and slot1 != slot2:
+                best = min(best, state.delta_swap(kode1, slot1, kode2, slot2))
+        for slot_to in state.empty_slots:
+            best = min(best, state.delta_move(slot1, kode1, slot_to))
+    return best
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param(dict(seed=0), id="students"),
+        pytest.param(dict(seed=1, ganda=0.5), id="double-enrollment"),
+        pytest.param(dict(seed=2, kelas_kosong=3), id="partly-studentless"),
+        pytest.param(dict(seed=3, n_ruangan=1, n_kelas=12), id="few-empty-slots"),
+    ],
+)
+def test_queue_pops_brute_force_best_move(kwargs):
+    problem = random_problem(**kwargs)
+    state = ExactHillClimbingState(problem, randomizer=random.Random(0))
+    state.seed_jadwal()
+
+    for _ in range(200):
+        expected = _brute_force_best(state)
+        best = state.queue.best()
+        if expected >= 0:
+            assert best is None
+            break
+        assert best is not None
+        assert best[0] == pytest.approx(expected)
+
+        sebelum = state.current_objective
+        result = state.next()
+        assert result.move_accepted
+        assert state.current_objective == pytest.approx(sebelum + expected)
+        assert state.current_objective == pytest.approx(state.objective())
+    else:
+        pytest.fail("Hill climbing tidak mencapai local optimum")
+
+
+def test_apply_evaluates_only_affected_entries():
+    # Setiap langkah hanya menghitung ulang delta yang terpengaruh, jauh lebih
+    # sedikit dari membangun ulang seluruh queue
+    problem = load_problem(generate_instance(200, 3000, seed=0))
+    state = ExactHillClimbingState(problem, randomizer=random.Random(0))
+    state.seed_jadwal()
+    semua = state.queue.evaluations
+
+    for _ in range(30):
+        sebelum = state.queue.evaluations
+        assert state.next().move_accepted
+        assert state.queue.evaluations - sebelum <= 0.15 * semua
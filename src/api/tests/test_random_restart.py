@@ -0,0 +1,31 @@
+import time
+from app.algorithms.budget import STOP_CANCELLED
+from app.algorithms.hill_climbing import RandomRestartHillClimbing
+from app.algorithms.progress import SolverProgress
+from .problems import random_problem
+
+
+class CancelAfter(SolverProgress):
+    def __init__(self, delay: float):
+        super().__init__(interval=0.05)
+        self.deadline = time.monotonic() + delay
+
+    def stop_requested(self) -> bool:
+        return time.monotonic() >= self.deadline
+
+
+def test_parallel_restarts_stop_on_cancel():
+    # Satu restart pada instance ini butuh ratusan iterasi (beberapa detik),
+    # pembatalan harus menghentikan restart yang sedang berjalan di worker
+    solver = RandomRestartHillClimbing(
+        random_problem(0, n_kelas=150, n_ruangan=10, n_mahasiswa=600),
+        max_restart=2,
+        neighborhood_size=2000,
+        workers=2,
+        target_objective=-1,
+        seed=0,
+    )
+    solver.progress = CancelAfter(0.5)
+    solver.search()
+    assert solver.stop_reason == STOP_CANCELLED
+    assert solver.iteration < 200
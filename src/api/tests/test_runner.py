@@ -0,0 +1,28 @@
+import pytest
+from app.algorithms.budget import SearchBudget
+from app.algorithms.simulated_annealing import SimulatedAnnealing
+from app.runner import SolverPool
+from .problems import random_problem
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = SolverPool(max_workers=2)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+def _jadwal_awal(pool, seed):
+    kwargs = {"seed": seed, "budget": SearchBudget(max_evaluations=50)}
+    results = pool.run(SimulatedAnnealing, random_problem(0), kwargs, runs=4)
+    return [results[i].alokasi_ruangan_awal for i in range(4)]
+
+
+def test_unseeded_runs_differ_across_workers(pool):
+    awal = _jadwal_awal(pool, None) + _jadwal_awal(pool, None)
+    assert all(awal[i] != awal[j] for i in range(8) for j in range(i))
+
+
+def test_seeded_runs_are_repeatable(pool):
+    assert _jadwal_awal(pool, 3) == _jadwal_awal(pool, 3)
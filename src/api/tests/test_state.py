@@ -0,0 +1,41 @@
+import random
+import pytest
+from app.algorithms.state import State
+from .problems import random_problem
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_incremental_objective_matches_full(seed):
+    problem = random_problem(seed, n_kelas=10, n_ruangan=2, ganda=0.5)
+    # Instance harus memuat kelas yang diambil dua kali dan kelas melebihi kuota
+    assert problem.kelas_ganda
+    rng = random.Random(seed)
+    state = State(problem, randomizer=random.Random(seed))
+    state.seed_jadwal()
+    state.init_slot_assignment()
+    state.init_delta()
+    assert state.current_objective == state.objective()
+    assert state._kuota_kelas() > 0
+
+    for _ in range(300):
+        kelas1 = rng.choice(problem.list_kelas).kode
+        slot1 = rng.choice(state.jadwal.slot_kuliah[kelas1])
+        sebelum = state.current_objective
+        if rng.random() < 0.5:
+            kelas2 = rng.choice(problem.list_kelas).kode
+            slot2 = rng.choice(state.jadwal.slot_kuliah[kelas2])
+            delta = state.delta_swap(kelas1, slot1, kelas2, slot2)
+            applied = state.apply_swap(kelas1, slot1, kelas2, slot2)
+            if slot1 != slot2 and kelas1 != kelas2:
+                state._pindah_pertemuan(kelas1, slot1, slot2)
+                state._pindah_pertemuan(kelas2, slot2, slot1)
+        else:
+            slot2 = rng.randrange(problem.n_slot)
+            delta = state.delta_move(slot1, kelas1, slot2)
+            applied = state.apply_move(slot1, kelas1, slot2)
+            if slot1 != slot2:
+                state._pindah_pertemuan(kelas1, slot1, slot2)
+
+        assert delta == pytest.approx(applied)
+        assert state.current_objective == pytest.approx(sebelum + delta)
+        assert state.current_objective == pytest.approx(state.objective())